@@ -0,0 +1,94 @@
+"""
+Benchmark DatabaseManager.insert_raw_jobs against the per-row insert_raw_job.
+
+    python bench_db_insert.py [--sizes 10000 100000] [--skip-per-row-above N]
+
+For every size N, on a fresh throwaway database (never applications.db):
+
+  per-row   N x insert_raw_job            (one commit per job)
+  bulk      insert_raw_jobs(N jobs)       (one transaction)
+
+each run twice -- first into an empty DB (all new), then the same jobs
+again (all unchanged re-sightings: content_hash compare + last_seen bump,
+the common case on a daily run).  Both paths must leave identical jobs /
+applications / known_jobs row counts; the script exits non-zero if they
+do not.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from local_db_manager import DatabaseManager
+
+
+def synthetic_jobs(n: int) -> list[dict]:
+    companies = [f"Company {i}" for i in range(max(n // 20, 1))]
+    return [{
+        "company":     companies[i % len(companies)],
+        "title":       f"Software Engineer {i}",
+        "location":    "San Francisco, CA" if i % 3 else "Remote",
+        "source":      "Greenhouse",
+        "url":         f"https://boards.greenhouse.io/company{i % len(companies)}/jobs/{1_000_000 + i}",
+        "description": "We build distributed systems with Python, Go and Kubernetes. " * 8,
+        "date":        "2026-01-15",
+        "salary":      "",
+        "sponsorship": "",
+    } for i in range(n)]
+
+
+def counts(db: DatabaseManager) -> tuple[int, int, int]:
+    return tuple(db.conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0]
+                 for t in ("jobs", "applications", "known_jobs"))
+
+
+def run(path: str, jobs: list[dict], bulk: bool) -> tuple[float, float, tuple]:
+    db = DatabaseManager(path)
+    times = []
+    for _ in range(2):                      # pass 1: all new, pass 2: all unchanged
+        t0 = time.perf_counter()
+        if bulk:
+            db.insert_raw_jobs(jobs)
+        else:
+            for job in jobs:
+                db.insert_raw_job(job)
+        times.append(time.perf_counter() - t0)
+    rows = counts(db)
+    db.close()
+    return times[0], times[1], rows
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    ap.add_argument("--skip-per-row-above", type=int, default=0,
+                    help="only time the bulk path for sizes above this (per-row is one fsync per job)")
+    args = ap.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'jobs':>8}  {'path':<8} {'new (s)':>9} {'dup (s)':>9} {'new jobs/s':>11}  rows (jobs/apps/known)")
+        for n in args.sizes:
+            jobs = synthetic_jobs(n)
+            results = {}
+            for name, bulk in (("per-row", False), ("bulk", True)):
+                if not bulk and args.skip_per_row_above and n > args.skip_per_row_above:
+                    continue
+                path = os.path.join(tmp, f"{name}-{n}.db")
+                t_new, t_dup, rows = run(path, jobs, bulk)
+                results[name] = (t_new, t_dup, rows)
+                print(f"{n:>8}  {name:<8} {t_new:>9.2f} {t_dup:>9.2f} {n / t_new:>11,.0f}  {rows}")
+            if len(results) == 2:
+                (rn, rd, r_rows), (bn, bd, b_rows) = results["per-row"], results["bulk"]
+                ok = r_rows == b_rows == (n, n, 2 * n)
+                failed |= not ok
+                print(f"{'':>8}  speedup  {rn / bn:>8.1f}x {rd / bd:>8.1f}x  {'':>11}  "
+                      f"{'rows match' if ok else 'ROW COUNT MISMATCH'}\n")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Equivalence check + micro-benchmark for the dashboard's derived columns.
+
+    python bench_derived_columns.py [--rows N] [--rounds N]
+
+load_data() used to derive Posted, work_mode, the Entry Level Only mask
+and the H1B label with one Python call per row (copied verbatim below as
+the reference).  The Jobs Board now gets work_mode / entry level / H1B
+from SQL (job_queries.WORK_MODE_SQL / _where, local_db_manager.H1B_LABEL_SQL) and Posted from job_queries.posted_labels.
+On a synthetic frame this times, per column:
+
+  - legacy       the row-wise apply
+  - vectorized   pandas / NumPy: posted_labels, one compiled regex through
+                 str.contains, np.select
+  - sql          the expression the dashboard actually runs, over the same
+                 rows in an in-memory SQLite table (fetching every value into
+                 Python; the board only evaluates it in a WHERE / for one page)
+
+Any disagreement with the legacy output is printed and the script exits
+non-zero.
+"""
+
+import argparse
+import random
+import re
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import timeago
+
+from job_queries import SENIOR_TOKENS, WORK_MODE_SQL, _where, posted_labels
+from local_db_manager import H1B_LABEL_SQL
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# REFERENCE (row-wise) IMPLEMENTATIONS
+# ─────────────────────────────────────────────────────────────────────────────
+def legacy_posted(df, now):
+    return df['scraped_date'].apply(
+        lambda x: timeago.format(x, now) if pd.notna(x) else ""
+    )
+
+
+def legacy_work_mode(df):
+    def _mode(loc):
+        ll = str(loc).lower()
+        if 'remote' in ll: return 'Remote'
+        if 'hybrid' in ll: return 'Hybrid'
+        return 'On-site'
+    return df['location'].apply(_mode)
+
+
+def legacy_entry_level(df):
+    _snr = ["senior", " sr ", "sr.", "staff", "principal", "director",
+            " vp ", "v.p.", "head of", "manager", "lead engineer", "tech lead",
+            "distinguished", "fellow", "architect"]
+    return ~df['title'].str.lower().apply(lambda t: any(x in t for x in _snr))
+
+
+def legacy_h1b(df):
+    def h1b_label(v):
+        v = str(v).lower()
+        if 'likely' in v or 'yes' in v: return 'Likely Sponsor'
+        if v == 'no' or 'does not' in v: return 'No Sponsorship'
+        return 'Unknown'
+    return df['sponsorship'].apply(h1b_label)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# VECTORIZED (pandas / NumPy)
+# ─────────────────────────────────────────────────────────────────────────────
+_SENIOR_RE = re.compile("|".join(map(re.escape, SENIOR_TOKENS)))
+
+
+def vector_work_mode(df):
+    loc = df['location'].str.lower()
+    return pd.Series(np.select([loc.str.contains('remote', regex=False),
+                                loc.str.contains('hybrid', regex=False)],
+                               ['Remote', 'Hybrid'], 'On-site'), index=df.index, dtype=object)
+
+
+def vector_entry_level(df):
+    return ~df['title'].str.lower().str.contains(_SENIOR_RE)
+
+
+def vector_h1b(df):
+    v = df['sponsorship'].str.lower()
+    return pd.Series(np.select([v.str.contains('likely|yes'),
+                                (v == 'no') | v.str.contains('does not', regex=False)],
+                               ['Likely Sponsor', 'No Sponsorship'], 'Unknown'), index=df.index, dtype=object)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SQL (what the dashboard runs)
+# ─────────────────────────────────────────────────────────────────────────────
+def sql_column(conn, expr: str, params=()) -> list:
+    return [r[0] for r in conn.execute(f"SELECT {expr} FROM jobs j ORDER BY rowid", params)]
+
+
+def sql_work_mode(conn):
+    return sql_column(conn, WORK_MODE_SQL)
+
+
+def sql_entry_level(conn):
+    terms, params = _where(conn, {"entry_level": True})
+    return [bool(v) for v in sql_column(conn, terms[0], params)]
+
+
+def sql_h1b(conn):
+    return sql_column(conn, H1B_LABEL_SQL.format(j="j"))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# DATA
+# ─────────────────────────────────────────────────────────────────────────────
+def synthetic_frame(n: int, now: datetime, rng: random.Random) -> pd.DataFrame:
+    """Titles / locations / sponsorship mixing the filter tokens with plain text; dates over 3 years."""
+    roles   = ["Software Engineer", "Data Engineer", "ML Engineer", "Analyst", "Backend Developer"]
+    prefix  = [t.strip().title() for t in SENIOR_TOKENS] + ["", "", "", "", "Junior", "New Grad"]
+    places  = ["Remote", "Remote - US", "Hybrid (NYC)", "San Francisco, CA", "Austin, TX", "Hybrid", ""]
+    sponsor = ["", "", "Likely", "No", "yes", "Does not sponsor", "Unknown", "no visa"]
+    ages    = [rng.choice([rng.uniform(0, 120), rng.uniform(0, 86_400), rng.uniform(0, 94_608_000)])
+               for _ in range(n)]
+    dates   = [now - timedelta(seconds=a) for a in ages]
+    for i in rng.sample(range(n), n // 100):
+        dates[i] = None
+    return pd.DataFrame({
+        "title":        [f"{rng.choice(prefix)} {rng.choice(roles)} {i}".strip() for i in range(n)],
+        "location":     [rng.choice(places) for _ in range(n)],
+        "sponsorship":  [rng.choice(sponsor) for _ in range(n)],
+        "scraped_date": pd.to_datetime(pd.Series(dates, dtype=object), errors="coerce"),
+    })
+
+
+def best_of(fn, rounds) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows",   type=int, default=100_000)
+    ap.add_argument("--rounds", type=int, default=3)
+    args = ap.parse_args()
+
+    now = datetime.now()
+    df  = synthetic_frame(args.rows, now, random.Random(42))
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE jobs (title TEXT, location TEXT, sponsorship TEXT)")
+    conn.executemany("INSERT INTO jobs VALUES (?, ?, ?)",
+                     df[["title", "location", "sponsorship"]].itertuples(index=False))
+
+    checks = [
+        ("Posted",      lambda: legacy_posted(df, now), lambda: posted_labels(df["scraped_date"], now), None),
+        ("work_mode",   lambda: legacy_work_mode(df),   lambda: vector_work_mode(df),   lambda: sql_work_mode(conn)),
+        ("entry level", lambda: legacy_entry_level(df), lambda: vector_entry_level(df), lambda: sql_entry_level(conn)),
+        ("H1B label",   lambda: legacy_h1b(df),         lambda: vector_h1b(df),         lambda: sql_h1b(conn)),
+    ]
+
+    print(f"{args.rows:,} synthetic rows, best of {args.rounds}\n")
+    failed = 0
+    for name, old, new, sql in checks:
+        expected = old().tolist()
+        for label, fn in [("vectorized", new), ("sql", sql)]:
+            if fn is None:
+                continue
+            got = fn()
+            got = got.tolist() if hasattr(got, "tolist") else got
+            bad = [i for i, (a, b) in enumerate(zip(expected, got)) if a != b]
+            failed += len(bad)
+            for i in bad[:5]:
+                print(f"  MISMATCH {name} ({label}) row {i}: legacy={expected[i]!r} got={got[i]!r}")
+
+        old_ms = best_of(old, args.rounds)
+        new_ms = best_of(new, args.rounds)
+        line   = f"{name:<12} legacy {old_ms:8.1f} ms  vectorized {new_ms:7.1f} ms ({old_ms / new_ms:5.1f}x)"
+        if sql is not None:
+            sql_ms = best_of(sql, args.rounds)
+            line  += f"  sql {sql_ms:7.1f} ms ({old_ms / sql_ms:5.1f}x)"
+        print(line)
+
+    print("\nOK -- derived columns match legacy behaviour" if not failed else f"\n{failed} mismatches")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark the html_parsing backends on captured / representative payloads.
+
+    python bench_html_parsers.py [--rounds N] [files.html ...]
+
+For every document prints the mean parse time per backend and flags any
+backend whose output differs from the html.parser (BeautifulSoup) baseline.
+Defaults to jobright_debug.html plus a synthetic Greenhouse-style
+description and a synthetic 25-card LinkedIn guest-API page.
+"""
+
+import argparse
+import os
+import time
+
+from html_parsing import available_backends, extract_linkedin_cards, html_to_text, CARD_BACKENDS, lxml
+
+
+def _greenhouse_description() -> str:
+    para = ("<p>We are looking for a <strong>Software Engineer</strong> to join our "
+            "<em>Platform</em> team. You will build distributed systems &amp; APIs.</p>")
+    items = "".join(f"<li>Requirement {i}: Python, Go, Kubernetes, SQL</li>" for i in range(15))
+    return f"<div class='content-intro'>{para * 6}</div><h3>Requirements</h3><ul>{items}</ul>" \
+           f"<p>We are unable to sponsor visas for this role.</p>"
+
+
+def _linkedin_page(n: int = 25) -> str:
+    card = """
+    <li><div class="base-card relative base-search-card job-search-card">
+      <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/{i}?trk=x">
+        <span class="sr-only">Software Engineer {i}</span></a>
+      <div class="base-search-card__info">
+        <h3 class="base-search-card__title">  Software Engineer {i}  </h3>
+        <h4 class="base-search-card__subtitle"><a class="hidden-nested-link" href="#">Acme {i}</a></h4>
+        <div class="base-search-card__metadata">
+          <span class="job-search-card__location">San Francisco, CA</span>
+          <time class="job-search-card__listdate" datetime="2024-05-0{d}">1 day ago</time>
+        </div>
+      </div></div></li>"""
+    return "".join(card.format(i=i, d=i % 9 + 1) for i in range(n))
+
+
+def _time(fn, doc, backend, rounds) -> tuple[float, object]:
+    out = fn(doc, backend=backend)
+    t0  = time.perf_counter()
+    for _ in range(rounds):
+        fn(doc, backend=backend)
+    return (time.perf_counter() - t0) / rounds * 1000, out
+
+
+def bench(name, doc, fn, backends, rounds):
+    print(f"\n{name}  ({len(doc):,} chars)")
+    baseline_ms, baseline = _time(fn, doc, "html.parser", rounds)
+    for backend in backends:
+        ms, out = (baseline_ms, baseline) if backend == "html.parser" else _time(fn, doc, backend, rounds)
+        flag = "" if out == baseline else "   MISMATCH vs html.parser"
+        print(f"  {backend:<12} {ms:9.3f} ms/doc   {baseline_ms / ms:5.1f}x{flag}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("files", nargs="*")
+    ap.add_argument("--rounds", type=int, default=20)
+    args = ap.parse_args()
+
+    files = args.files or [f for f in ["jobright_debug.html"] if os.path.exists(f)]
+    if lxml is None:
+        print("lxml not installed -- only stream / html.parser are benchmarked (pip install lxml)")
+
+    for path in files:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            bench(f"{path} [text]", f.read(), html_to_text, available_backends(), args.rounds)
+
+    bench("greenhouse description [text]", _greenhouse_description(), html_to_text,
+          available_backends(), args.rounds * 10)
+    bench("linkedin 25-card page [cards]", _linkedin_page(), extract_linkedin_cards,
+          [b for b in CARD_BACKENDS if b in available_backends()], args.rounds * 5)
+
+
+if __name__ == "__main__":
+    main()
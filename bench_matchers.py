@@ -0,0 +1,202 @@
+"""
+Equivalence check + micro-benchmark for the compiled discovery filters.
+
+    python bench_matchers.py [--rounds N]
+
+Runs the pre-TokenMatcher implementations of _is_role_match, the
+_SENIORITY_BLOCK gate in _add_job, _is_us_location and _extract_sponsorship
+(copied verbatim below as the reference) against the compiled ones on:
+
+  - titles / locations from jobs_found.json and job_hunter.db (read-only)
+  - a fuzz corpus stitched together from the filter tokens themselves,
+    which exercises overlapping / prefix tokens and word-boundary cases
+  - synthetic ~2 KB descriptions for the sponsorship scan, which ships as
+    the plain containment loop -- a TokenMatcher over the same tokens is
+    timed alongside to show why
+
+Any disagreement is printed and the script exits non-zero.
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import time
+
+import job_discovery
+from job_discovery import JobDiscovery
+from token_matcher import TokenMatcher
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# REFERENCE (pre-compiled) IMPLEMENTATIONS
+# ─────────────────────────────────────────────────────────────────────────────
+def legacy_is_role_match(jd, title):
+    title_lower = str(title).lower()
+    if not jd.roles: return True
+    if any(neg in title_lower for neg in jd._SENIORITY_BLOCK):
+        return False
+    if any(tok in title_lower for tok in jd._ALWAYS_MATCH):
+        return True
+    return any(role.lower() in title_lower for role in jd.roles)
+
+
+def legacy_blocked(jd, title):
+    tl = title.lower()
+    return any(blk in tl for blk in jd._SENIORITY_BLOCK)
+
+
+def legacy_extract_sponsorship(text):
+    t = text.lower()
+    if any(x in t for x in ["no h1b", "no visa", "does not sponsor", "not sponsor",
+                             "unable to sponsor", "cannot sponsor", "citizen only",
+                             "us citizen", "clearance required"]):
+        return "No"
+    if any(x in t for x in ["h1b sponsor likely", "visa sponsor", "h1b sponsor",
+                             "sponsorship available", "will sponsor", "open to sponsor",
+                             "sponsors h1b"]):
+        return "Likely"
+    return ""
+
+
+def legacy_is_us_location(loc_str):
+    if not loc_str: return True
+    loc_lower = str(loc_str).lower()
+    if "remote" in loc_lower and not any(x in loc_lower for x in ["emea","apac","uk","europe","germany","india","canada","latam"]):
+        return True
+    us_indicators = [
+        "united states","usa","us","america",
+        " ca"," ny"," wa"," tx"," fl"," il"," ma"," co"," ga"," va",
+        "california","new york","washington","texas","seattle","san francisco",
+        "san jose","los angeles","boston","chicago","austin","denver","atlanta",
+        "remote us","us-remote","remote (us",
+    ]
+    for ind in us_indicators:
+        if ind in loc_lower: return True
+    return False
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CORPUS
+# ─────────────────────────────────────────────────────────────────────────────
+def real_postings() -> list[tuple[str, str]]:
+    rows = []
+    if os.path.exists("jobs_found.json"):
+        with open("jobs_found.json", "r", encoding="utf-8") as f:
+            rows += [(j.get("title") or "", j.get("location") or "") for j in json.load(f)]
+    if os.path.exists("job_hunter.db"):
+        conn = sqlite3.connect("file:job_hunter.db?mode=ro", uri=True)
+        rows += [(t or "", l or "") for t, l in conn.execute("SELECT title, location FROM jobs")]
+        conn.close()
+    return rows
+
+
+def fuzz_strings(tokens: list[str], n: int, rng: random.Random) -> list[str]:
+    filler = ["", " ", "-", "/", ", ", "(", ")", "x", "ii", "software", "remote", "Senior", "U.S."]
+    out = []
+    for _ in range(n):
+        parts = rng.choices(tokens + filler, k=rng.randint(1, 6))
+        # chop tokens apart / glue them together to hit partial and overlapping matches
+        s = "".join(p[rng.randint(0, 2):] if rng.random() < 0.3 else p for p in parts)
+        out.append(s.upper() if rng.random() < 0.1 else s)
+    return out
+
+
+def descriptions(n: int, rng: random.Random) -> list[str]:
+    words = ("we build distributed systems for customers across the united states using python go "
+             "and kubernetes you will own services end to end and partner with product design").split()
+    phrases = JobDiscovery._SPONSOR_NO + JobDiscovery._SPONSOR_LIKELY + ["sponsorship", "visa", "h1b"]
+    out = []
+    for _ in range(n):
+        body = rng.choices(words, k=320)
+        for _ in range(rng.randint(0, 2)):
+            body.insert(rng.randrange(len(body)), rng.choice(phrases))
+        out.append(" ".join(body))
+    return out
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# RUN
+# ─────────────────────────────────────────────────────────────────────────────
+def sponsorship_matcher():
+    """_extract_sponsorship on a TokenMatcher -- not shipped (slower than the loop on descriptions)."""
+    m = TokenMatcher({"no": JobDiscovery._SPONSOR_NO, "likely": JobDiscovery._SPONSOR_LIKELY})
+
+    def extract(text):
+        hits = m.scan(text.lower())
+        return "No" if "no" in hits else "Likely" if "likely" in hits else ""
+    return extract
+
+
+def timed(fn, items, rounds) -> float:
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for x in items:
+            fn(x)
+    return (time.perf_counter() - t0) / (rounds * max(len(items), 1)) * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rounds", type=int, default=5)
+    args = ap.parse_args()
+
+    rng = random.Random(42)
+    jd  = JobDiscovery(profile_path="user_profile.json")
+    real = real_postings()
+    title_tokens = jd._SENIORITY_BLOCK + jd._ALWAYS_MATCH + jd.roles
+    loc_tokens   = ["remote"] + jd._NON_US_REMOTE + jd._US_INDICATORS
+
+    titles = [t for t, _ in real] + fuzz_strings(title_tokens, 20000, rng)
+    locs   = [l for _, l in real] + fuzz_strings(loc_tokens, 20000, rng) + ["", None]
+    descs  = descriptions(2000, rng) + fuzz_strings(JobDiscovery._SPONSOR_NO + JobDiscovery._SPONSOR_LIKELY, 5000, rng)
+
+    checks = [
+        ("_is_role_match",      lambda t: legacy_is_role_match(jd, t), jd._is_role_match, titles),
+        ("_add_job block gate", lambda t: legacy_blocked(jd, t),
+                                lambda t: "block" in jd._title_matcher.scan(t.lower()), titles),
+        ("_is_us_location",     legacy_is_us_location, jd._is_us_location, locs),
+        ("_extract_sponsorship", legacy_extract_sponsorship, jd._extract_sponsorship, descs),
+        ("sponsorship matcher",  legacy_extract_sponsorship, sponsorship_matcher(), descs),
+    ]
+
+    print(f"{len(real)} real postings, profile roles: {jd.roles}\n")
+    failed = 0
+    for name, old, new, items in checks:
+        bad = [x for x in items if old(x) != new(x)]
+        failed += len(bad)
+        for x in bad[:5]:
+            print(f"  MISMATCH {name}: {x!r}  legacy={old(x)!r} compiled={new(x)!r}")
+        # first pass over `items` warms the title / location memo, as a real run's
+        # second check of the same posting would
+        old_us = timed(old, items, args.rounds)
+        new_us = timed(new, items, args.rounds)
+        print(f"{name:<22} {len(items):>6} inputs  equal={not bad!s:<5}  "
+              f"legacy {old_us:7.2f} us  compiled {new_us:7.2f} us  ({old_us / new_us:4.1f}x)")
+
+    # Per-posting pipeline from an empty memo: the scraper checks title + location,
+    # then _add_job checks the title again -- what one discovery run actually does.
+    # Real postings, every title made distinct; locations repeat as they do in a run.
+    fresh = JobDiscovery(profile_path="user_profile.json")
+    job_discovery._LOCATION_MATCHER.scan.cache_clear()
+    pairs = [(f"{t} #{i}", l) for i, (t, l) in enumerate(real * 40)]
+
+    def legacy_posting(p):
+        legacy_is_role_match(fresh, p[0]) and legacy_is_us_location(p[1]) and not legacy_blocked(fresh, p[0])
+
+    def compiled_posting(p):
+        fresh._is_role_match(p[0]) and fresh._is_us_location(p[1]) and "block" not in fresh._title_matcher.scan(p[0].lower())
+
+    old_us = timed(legacy_posting, pairs, 1)
+    new_us = timed(compiled_posting, pairs, 1)
+    print(f"\n{'per real posting':<22} {len(pairs):>6} inputs  "
+          f"legacy {old_us:7.2f} us  compiled {new_us:7.2f} us  ({old_us / new_us:4.1f}x)")
+
+    print("\nOK -- compiled filters match legacy behaviour" if not failed else f"\n{failed} mismatches")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark dashboard search: jobs_fts (job_queries) vs the old pandas scan.
+
+    python bench_search.py [--sizes 10000 100000] [--rounds N]
+
+For every size a throwaway DB is seeded with synthetic postings (~1 KB
+descriptions).  Each query is timed as the old dashboard ran it -- four
+`str.lower().str.contains()` passes over the loaded DataFrame -- and as the
+Jobs Board runs it now: count_jobs() for the stats bar, the first
+fetch_page() in relevance order and snippets() for that page.  The FTS
+match count must equal the pandas one for these whole-word queries.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from job_queries import count_jobs, fetch_page, snippets
+from local_db_manager import DatabaseManager
+
+QUERIES = ["kubernetes", "acme", "seattle", "machine learning", "zebra"]
+
+WORDS = ("we build distributed systems for customers using python go java typescript react "
+         "and postgres you will own services end to end and partner with product design "
+         "data platform infrastructure reliability security payments search ranking").split()
+
+
+def synthetic_jobs(n: int, rng: random.Random) -> list[dict]:
+    cities = ["Seattle, WA", "San Francisco, CA", "New York, NY", "Austin, TX", "Remote"]
+    extra  = ["kubernetes", "machine learning", "rust", "spark", "terraform"]
+    return [{
+        "company":     f"Acme {i % 50}" if i % 10 == 0 else f"Company {i % 3000}",
+        "title":       rng.choice(["Software Engineer", "Data Engineer", "ML Engineer", "Backend Engineer"]),
+        "location":    rng.choice(cities),
+        "url":         f"https://jobs.example.com/{i}",
+        "description": " ".join(rng.choices(WORDS, k=150)) + " " + rng.choice(extra),
+    } for i in range(n)]
+
+
+def pandas_search(df: pd.DataFrame, q: str) -> int:
+    q = q.lower()
+    return len(df[
+        df['company'].str.lower().str.contains(q, na=False) |
+        df['title'].str.lower().str.contains(q, na=False) |
+        df['location'].str.lower().str.contains(q, na=False) |
+        df['description'].str.lower().str.contains(q, na=False)
+    ])
+
+
+def board_search(conn, q: str) -> int:
+    """One Jobs Board rerun with `q` in the search box; returns the match count."""
+    f = {"search": q}
+    total = count_jobs(conn, f)[0]
+    page, _ = fetch_page(conn, f, "Relevance (Search)")
+    snippets(conn, q, page["_rowid"].tolist())
+    return total
+
+
+def timed(fn, rounds: int) -> tuple[float, object]:
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        out = fn()
+    return (time.perf_counter() - t0) / rounds * 1000, out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    ap.add_argument("--rounds", type=int, default=5)
+    args = ap.parse_args()
+
+    rng = random.Random(7)
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            db = DatabaseManager(os.path.join(tmp, f"search-{n}.db"))
+            db.insert_raw_jobs(synthetic_jobs(n, rng))
+            df = pd.read_sql_query("SELECT company, title, location, description FROM jobs", db.conn)
+            print(f"\n{n:,} jobs")
+            print(f"  {'query':<18} {'pandas ms':>10} {'fts ms':>8} {'speedup':>8}  matches")
+            for q in QUERIES:
+                p_ms, p_hits = timed(lambda: pandas_search(df, q), args.rounds)
+                f_ms, f_hits = timed(lambda: board_search(db.conn, q), args.rounds)
+                same = p_hits == f_hits
+                failed |= not same
+                print(f"  {q:<18} {p_ms:>10.1f} {f_ms:>8.2f} {p_ms / f_ms:>7.0f}x  "
+                      f"{p_hits} / {f_hits}{'' if same else '  MISMATCH'}")
+            db.close()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+BoardHealth — liveness registry for ATS board slugs
+─────────────────────────────────────────────────────
+Many entries in GREENHOUSE_BOARDS / ASHBY_BOARDS / WORKABLE_BOARDS /
+BAMBOOHR_BOARDS return 404 or an empty board on every run.  This registry
+(board_health.json) remembers, per (ATS, slug):
+
+    status        'ok' | 'empty' | 'http_404' | 'http_<code>' | 'error'
+    last_success  ISO time of the last 200 with at least one job
+    last_checked  ISO time of the last probe
+    job_count     jobs on the board at the last probe
+    failures      consecutive 'gone' probes (404 / 410)
+    next_probe    ISO time before which run_discovery skips the slug
+
+Only a gone slug backs off: one 404 is treated as a fluke; from the second
+in a row the slug is skipped for PROBE_BASE_HOURS * 2^(failures-2), capped
+at PROBE_MAX_HOURS.  A 200 -- with jobs or without ('empty', a board in a
+lull) -- resets the slug to healthy.  Other errors (429, 5xx, network) are
+transient: the slug is retried on the next run and its count is left alone.
+
+    python board_health.py        -> report of dead slugs per ATS
+"""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+
+HEALTH_PATH      = os.getenv("BOARD_HEALTH_PATH", "board_health.json")
+PROBE_BASE_HOURS = 6
+PROBE_MAX_HOURS  = 24 * 14
+DEAD_AFTER       = 5      # consecutive failures before a slug is reported as dead
+GONE_STATUSES    = {"http_404", "http_410"}
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class BoardHealth:
+    def __init__(self, path: str = HEALTH_PATH):
+        self.path    = path
+        self.boards: dict[str, dict] = {}
+        self.skipped: dict[str, int] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    self.boards = json.load(f)
+            except (OSError, ValueError):
+                self.boards = {}
+
+    @staticmethod
+    def _key(ats: str, slug: str) -> str:
+        return f"{ats}:{slug}"
+
+    # ──────────────────────────────────────────────────────────────────────
+    # SCHEDULING
+    # ──────────────────────────────────────────────────────────────────────
+    def should_probe(self, ats: str, slug: str) -> bool:
+        """False while the slug is inside its re-probe backoff window."""
+        entry = self.boards.get(self._key(ats, slug))
+        # only gone slugs back off (entries from older runs may carry one for 'empty' / 5xx)
+        if not entry or not entry.get("next_probe") or entry.get("status") not in GONE_STATUSES:
+            return True
+        try:
+            due = datetime.fromisoformat(entry["next_probe"]) <= _now()
+        except ValueError:
+            due = True
+        if not due:
+            self.skipped[ats] = self.skipped.get(ats, 0) + 1
+        return due
+
+    def record(self, ats: str, slug: str, status: str, job_count: int = 0):
+        """Store the outcome of one probe.  status 'ok' with 0 jobs is stored as 'empty' (still healthy)."""
+        if status == "ok" and not job_count:
+            status = "empty"
+        now   = _now()
+        entry = self.boards.setdefault(self._key(ats, slug), {
+            "ats": ats, "slug": slug, "last_success": "", "failures": 0,
+        })
+        entry["status"]       = status
+        entry["last_checked"] = now.isoformat(timespec="seconds")
+        entry["job_count"]    = job_count
+
+        if status in ("ok", "empty"):
+            entry["failures"]   = 0
+            entry["next_probe"] = ""
+            if job_count:
+                entry["last_success"] = entry["last_checked"]
+            return
+        if status not in GONE_STATUSES:
+            entry["next_probe"] = ""
+            return
+
+        entry["failures"] = entry.get("failures", 0) + 1
+        if entry["failures"] < 2:
+            entry["next_probe"] = ""
+        else:
+            hours = min(PROBE_BASE_HOURS * 2 ** (entry["failures"] - 2), PROBE_MAX_HOURS)
+            entry["next_probe"] = (now + timedelta(hours=hours)).isoformat(timespec="seconds")
+
+    # ──────────────────────────────────────────────────────────────────────
+    # REPORTING / PERSISTENCE
+    # ──────────────────────────────────────────────────────────────────────
+    def dead(self) -> list[dict]:
+        """Gone slugs with >= DEAD_AFTER consecutive failures, grouped by ATS then slug."""
+        rows = [e for e in self.boards.values()
+                if e.get("failures", 0) >= DEAD_AFTER and e.get("status") in GONE_STATUSES]
+        return sorted(rows, key=lambda e: (e["ats"], e["slug"]))
+
+    def save(self):
+        if not self.path:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.boards, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+if __name__ == "__main__":
+    health = BoardHealth()
+    dead   = health.dead()
+    print(f"{len(health.boards)} boards tracked, {len(dead)} dead (>= {DEAD_AFTER} consecutive failures)\n")
+    current = None
+    for e in dead:
+        if e["ats"] != current:
+            current = e["ats"]
+            print(f"{current}:")
+        print(f"  {e['slug']:<28} {e['status']:<10} failures={e['failures']:<3} "
+              f"last_success={e['last_success'] or 'never'}  next_probe={e['next_probe']}")
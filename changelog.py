@@ -0,0 +1,241 @@
+"""
+Changelog — append-only delta sync of the jobs DB
+───────────────────────────────────────────────────
+Every sync used to ship the whole DB (later the whole snapshot), even when
+one row changed.  The change feed (migration 7) already knows which rows
+moved past a version, so a sync can ship just those:
+
+    changelog/00000000-00000042.ndjson.gz    changes in versions (0, 42]
+    changelog/00000042-00000057.ndjson.gz    changes in versions (42, 57]
+
+One gzipped NDJSON line per change, in replay order:
+
+    {"op": "del", "id": "..."}               job deleted (job_tombstones)
+    {"op": "job", "row": {...}}              jobs row inserted / updated
+    {"op": "app", "row": {...}}              its applications row
+
+Rows are whole rows (last write wins), so replaying a segment twice or
+out of a compacted overlap is harmless.  last_seen / content_hash bumps
+and known_jobs are runner-local and not shipped.
+
+    python changelog.py                  -> write a segment with the changes since the last one
+    python changelog.py --compact        -> merge every segment into one
+    python changelog.py --replay DB      -> patch DB with the segments it has not replayed yet
+"""
+
+import gzip
+import json
+import os
+import re
+
+from local_db_manager import DB_PATH, DatabaseManager
+
+
+CHANGELOG_DIR    = os.getenv("JOB_CHANGELOG_DIR", "changelog")
+CHANGELOG_MAX_MB = float(os.getenv("CHANGELOG_MAX_MB", "5"))   # daily_runner re-snapshots past this
+
+_SEGMENT = re.compile(r"^(\d+)-(\d+)\.ndjson\.gz$")
+
+# the change feed's own column and the runner-local bookkeeping: never shipped
+_LOCAL_COLUMNS = {"row_version", "content_hash", "last_seen"}
+
+
+def segments(directory: str = CHANGELOG_DIR) -> list[tuple[int, int, str]]:
+    """(from_version, to_version, path) of every segment, oldest first."""
+    if not os.path.isdir(directory):
+        return []
+    found = []
+    for name in os.listdir(directory):
+        m = _SEGMENT.match(name)
+        if m:
+            found.append((int(m.group(1)), int(m.group(2)), os.path.join(directory, name)))
+    return sorted(found, key=lambda s: (s[1], s[0]))
+
+
+def last_version(directory: str = CHANGELOG_DIR) -> int:
+    """The version the newest segment runs up to (0 with no segments)."""
+    found = segments(directory)
+    return found[-1][1] if found else 0
+
+
+def size_mb(directory: str = CHANGELOG_DIR) -> float:
+    return sum(os.path.getsize(path) for _, _, path in segments(directory)) / 1e6
+
+
+def _rows(cur) -> list[dict]:
+    names = [d[0] for d in cur.description]
+    return [{k: v for k, v in zip(names, row) if k not in _LOCAL_COLUMNS} for row in cur.fetchall()]
+
+
+def _write(directory: str, start: int, end: int, ops) -> str:
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{start:08d}-{end:08d}.ndjson.gz")
+    tmp  = path + ".tmp"
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        for op in ops:
+            f.write(json.dumps(op, ensure_ascii=False, separators=(",", ":")) + "\n")
+    os.replace(tmp, path)
+    return path
+
+
+def read_segment(path: str):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def _mark(conn, name: str) -> int | None:
+    row = conn.execute("SELECT version FROM sync_state WHERE name = ?", (name,)).fetchone()
+    return row[0] if row else None
+
+
+def _set_mark(cur, name: str, version: int):
+    cur.execute("""
+        INSERT INTO sync_state (name, version) VALUES (?, ?)
+        ON CONFLICT(name) DO UPDATE SET version = excluded.version
+    """, (name, version))
+
+
+def write_segment(conn, directory: str = CHANGELOG_DIR) -> tuple[str | None, int]:
+    """
+    Append the changes since the last segment written from this DB
+    (sync_state 'changelog_out' -- segments may since have been pruned)
+    as a new segment: (its path, or None when nothing changed; number of
+    changes).
+    """
+    since   = _mark(conn, "changelog_out")
+    version = conn.execute("SELECT version FROM change_version").fetchone()[0]
+    if since is not None and version <= since:
+        return None, 0
+    # the first segment carries the whole DB (rows from before the change feed sit at row_version 0)
+    after = -1 if since is None else since
+    dels = [r[0] for r in conn.execute("SELECT job_id FROM job_tombstones WHERE version > ?", (after,))]
+    jobs = _rows(conn.execute("SELECT * FROM jobs WHERE row_version > ? ORDER BY rowid", (after,)))
+    apps = _rows(conn.execute("""
+        SELECT * FROM applications
+        WHERE row_version > ? OR job_id IN (SELECT id FROM jobs WHERE row_version > ?)
+    """, (after, after)))
+    ops = ([{"op": "del", "id": i} for i in dels] + [{"op": "job", "row": r} for r in jobs]
+           + [{"op": "app", "row": r} for r in apps])
+    path = _write(directory, max(after, 0), version, ops)
+    with conn:
+        _set_mark(conn, "changelog_out", version)
+    return path, len(ops)
+
+
+def _merge(paths) -> list[dict]:
+    """The ops of `paths` (oldest first) reduced to the last state of each job."""
+    dels, jobs, apps = set(), {}, {}
+    for path in paths:
+        for op in read_segment(path):
+            if op["op"] == "del":
+                dels.add(op["id"])
+                jobs.pop(op["id"], None)
+                apps.pop(op["id"], None)
+            elif op["op"] == "job":
+                dels.discard(op["row"]["id"])
+                jobs[op["row"]["id"]] = op
+            else:
+                apps[op["row"]["job_id"]] = op
+    return [{"op": "del", "id": i} for i in sorted(dels)] + list(jobs.values()) + list(apps.values())
+
+
+def compact(directory: str = CHANGELOG_DIR) -> str | None:
+    """Merge every segment into one covering the same versions; returns its path."""
+    found = segments(directory)
+    if len(found) < 2:
+        return found[0][2] if found else None
+    ops  = _merge(path for _, _, path in found)
+    path = _write(directory, found[0][0], found[-1][1], ops)
+    for _, _, old in found:
+        if old != path:
+            os.remove(old)
+    return path
+
+
+def prune(directory: str, upto: int) -> int:
+    """Delete segments a snapshot at version `upto` already contains; returns how many."""
+    stale = [path for _, end, path in segments(directory) if end <= upto]
+    for path in stale:
+        os.remove(path)
+    return len(stale)
+
+
+def _upsert(cur, table: str, key: str, columns: set[str], row: dict):
+    cols = [c for c in row if c in columns]
+    cur.execute(
+        f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))}) "
+        f"ON CONFLICT({key}) DO UPDATE SET " + ", ".join(f"{c} = excluded.{c}" for c in cols if c != key),
+        [row[c] for c in cols])
+
+
+def replay(db: DatabaseManager, directory: str = CHANGELOG_DIR, since: int | None = None) -> tuple[int, int]:
+    """
+    Apply, in one transaction, every segment of `directory` newer than
+    `since` (default: the version db last replayed, sync_state
+    'changelog_in') and record the new high-water mark.  Returns (version
+    replayed up to, number of ops applied).
+
+    New jobs are indexed / counted like an insert_raw_jobs batch before
+    their applications rows go in, so the analytics triggers see each
+    status change exactly once; updates and deletes go through the
+    ordinary triggers.
+    """
+    conn = db.conn
+    if since is None:
+        since = _mark(conn, "changelog_in")
+    todo = [s for s in segments(directory) if since is None or s[1] > since]
+    if not todo:
+        return since or 0, 0
+
+    # the replica's own columns: a segment from a newer schema (or an older one
+    # that still shipped last_seen / content_hash) just loses the extras
+    columns = {t: {r[1] for r in conn.execute(f"PRAGMA table_info({t})")} - _LOCAL_COLUMNS
+               for t in ("jobs", "applications")}
+    applied = 0
+    with conn:
+        cur = conn.cursor()
+        cur.execute("BEGIN IMMEDIATE")
+        for _, end, path in todo:
+            ops = list(read_segment(path))
+            last_rowid = cur.execute("SELECT COALESCE(MAX(rowid), 0) FROM jobs").fetchone()[0]
+            for op in ops:
+                if op["op"] == "del":
+                    cur.execute("DELETE FROM applications WHERE job_id = ?", (op["id"],))
+                    cur.execute("DELETE FROM jobs WHERE id = ?", (op["id"],))
+            for op in ops:
+                if op["op"] == "job":
+                    _upsert(cur, "jobs", "id", columns["jobs"], op["row"])
+            if cur.execute("SELECT COALESCE(MAX(rowid), 0) FROM jobs").fetchone()[0] > last_rowid:
+                db._index_new_rows(cur, last_rowid)
+            for op in ops:
+                if op["op"] == "app":
+                    _upsert(cur, "applications", "job_id", columns["applications"], op["row"])
+            applied += len(ops)
+            since = end
+        _set_mark(cur, "changelog_in", since)
+    return since, applied
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Job Hunter changelog sync")
+    parser.add_argument("--compact", action="store_true", help="Merge every segment into one")
+    parser.add_argument("--replay",  metavar="DB", help="Patch DB with the segments it has not replayed yet")
+    args = parser.parse_args()
+
+    if args.compact:
+        before = len(segments())
+        path   = compact()
+        print(f"{before} segments -> {path or 'none'} ({size_mb():.2f} MB)")
+    elif args.replay:
+        replica = DatabaseManager(args.replay)
+        version, ops = replay(replica)
+        print(f"{args.replay}: replayed {ops:,} changes, now at changelog version {version}")
+        replica.close()
+    else:
+        db = DatabaseManager(DB_PATH)
+        path, ops = write_segment(db.conn)
+        print(f"{ops:,} changes -> {path}" if path else "No changes since the last segment.")
+        db.close()
@@ -0,0 +1,101 @@
+"""
+Query-plan regression check for the jobs DB's hot queries.
+
+    python check_query_plans.py [--jobs N]
+
+Builds a throwaway DB through DatabaseManager (so every migration runs,
+ANALYZE included), fills it with N synthetic jobs -- most already tailored
+or applied, as in a real tracker -- and EXPLAINs:
+
+  get_new_applications()   must read idx_applications_todo as a covering
+                           index (its ORDER BY sort over the small backlog
+                           is expected, see _m006_covering_todo_index)
+  Jobs Board pages         first and keyset next page (job_queries.page_sql,
+                           Newest First, default filters) must walk
+                           idx_jobs_scraped_date, no temp sort
+
+The SQL of the DatabaseManager methods is captured from the live calls, so
+the check follows the code.  Exits non-zero if any plan regressed.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+from job_queries import page_sql
+from local_db_manager import DatabaseManager
+
+
+def seed(db: DatabaseManager, n: int):
+    db.insert_raw_jobs({
+        "company": f"Company {i % 500}",
+        "title":   f"Software Engineer {i}",
+        "url":     f"https://jobs.example.com/{i}",
+        "source":  "Greenhouse",
+    } for i in range(n))
+    with db.conn:
+        # ~5% still waiting for tailoring, the rest tailored / applied
+        db.conn.execute("""
+            UPDATE applications SET resume_pdf_path = 'resume.pdf',
+                   status = CASE WHEN rowid % 3 = 0 THEN 'APPLIED' ELSE 'NEW' END
+            WHERE rowid % 20 != 0
+        """)
+        db.conn.execute("UPDATE jobs SET scraped_date = printf('2026-01-%02d 12:00:00', rowid % 28 + 1)")
+    db.conn.execute("ANALYZE")
+
+
+def captured_sql(db: DatabaseManager, call) -> str:
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    try:
+        call()
+    finally:
+        db.conn.set_trace_callback(None)
+    return next(s for s in statements if s.lstrip().upper().startswith("SELECT"))
+
+
+def plan(db: DatabaseManager, sql: str, params=()) -> list[str]:
+    return [row[3] for row in db.conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--jobs", type=int, default=20000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, "plans.db"))
+        seed(db, args.jobs)
+        print(f"schema_version {db.schema_version}, {args.jobs} jobs\n")
+
+        # the dashboard's opening state: every status ticked, entry level only
+        board = {"statuses": ["NEW", "APPLIED"], "entry_level": True}
+        checks = [
+            ("get_new_applications", captured_sql(db, db.get_new_applications), (),
+             ["COVERING INDEX idx_applications_todo"], []),
+            ("jobs board page 1",    *page_sql(db.conn, board, "Newest First"),
+             ["idx_jobs_scraped_date"], ["TEMP B-TREE"]),
+            ("jobs board next page", *page_sql(db.conn, board, "Newest First",
+                                               after=("2026-01-15 12:00:00", args.jobs // 2)),
+             ["idx_jobs_scraped_date"], ["TEMP B-TREE"]),
+        ]
+
+        failed = 0
+        for name, sql, params, must, must_not in checks:
+            steps = plan(db, sql, params)
+            text  = "\n".join(steps)
+            bad   = [f"missing {m}" for m in must if m not in text] + \
+                    [f"uses {m}" for m in must_not if m in text]
+            failed += bool(bad)
+            print(f"{name:<22} {'OK' if not bad else 'REGRESSED: ' + ', '.join(bad)}")
+            for step in steps:
+                print(f"    {step}")
+        db.close()
+
+    print("\nOK -- hot queries use their indexes" if not failed else f"\n{failed} query plan(s) regressed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,8 @@ import time
 import argparse
 from job_discovery import JobDiscovery
 from local_db_manager import DatabaseManager
+from snapshot import SNAPSHOT_PATH, export_snapshot, snapshot_version
+from changelog import CHANGELOG_DIR, CHANGELOG_MAX_MB, prune, size_mb, write_segment
 from resume_tailor import ResumeTailor
 from browser_agent import BrowserAgent
 from dotenv import load_dotenv
@@ -110,11 +112,15 @@ async def main():
                         help="Tailor + apply a single job by its DB id (used by dashboard)")
     parser.add_argument("--skip-discovery", action="store_true",
                         help="Skip the job discovery step and only process existing new jobs")
+    parser.add_argument("--delta",       action="store_true",
+                        help="Incremental discovery: only process postings newer than each board's "
+                             "high-water mark (watermarks.json)")
     args = parser.parse_args()
 
     print("=" * 65)
     print("🤖  JOB HUNTER AGENT")
-    print(f"    Lookback : {args.hours}h  |  Max tailor: {args.max_tailor}  |  Apply: {not args.skip_apply}")
+    print(f"    Lookback : {args.hours}h  |  Max tailor: {args.max_tailor}  |  Apply: {not args.skip_apply}"
+          f"{'  |  Delta' if args.delta else ''}")
     print("=" * 65)
 
     db     = DatabaseManager()
@@ -139,8 +145,8 @@ async def main():
     # ── STEP 1: Discovery ─────────────────────────────────────────────────
     if not args.skip_discovery:
         print(f"\n[STEP 1] Job Discovery (last {args.hours}h)...")
-        discoverer = JobDiscovery()
-        # Pass db so LinkedIn/Jobright flush jobs immediately — no data loss on Ctrl+C
+        discoverer = JobDiscovery(delta=args.delta)
+        # Pass db so every scraper streams jobs to the DB writer as it finds them — no data loss on Ctrl+C
         jobs       = await discoverer.run_discovery(lookback_hours=args.hours, db=db)
 
         if not jobs:
@@ -148,8 +154,12 @@ async def main():
             return
 
         # ── STEP 2: Sync to DB ────────────────────────────────────────────────
-        print(f"\n[STEP 2] Syncing {len(jobs)} discovered jobs to DB...")
-        new_inserts = sum(1 for job in jobs if db.insert_raw_job(job))
+        # Already written during discovery; only re-sync if a writer batch failed
+        print(f"\n[STEP 2] {len(jobs)} discovered jobs streamed to DB during discovery.")
+        new_inserts = discoverer.writer.inserted
+        if discoverer.writer.failed:
+            print(f"  Re-syncing after {discoverer.writer.failed} failed writes...")
+            new_inserts += db.insert_raw_jobs(jobs)[0]
     else:
         print("\n[STEP 1 & 2] Skipped discovery phase. Proceeding to Tailoring.")
         new_inserts = 0
@@ -194,13 +204,27 @@ async def main():
         print("=" * 65)
 
     # ── STEP 5: Auto-Sync to GitHub (for Live Dashboard) ──────────────────
-    print("\n[STEP 5] Auto-syncing database to GitHub...")
+    print("\n[STEP 5] Auto-syncing dashboard snapshot to GitHub...")
     try:
         # We use subprocess to run the git commands quietly
         import subprocess
-        
-        # Add the database file
-        subprocess.run(["git", "add", "applications.db"], check=True, capture_output=True)
+
+        # The hosted dashboard reads a columnar snapshot (snapshot.py) plus the changelog
+        # segments pushed since (changelog.py).  Each run ships one segment -- just the
+        # rows that changed -- and a fresh snapshot only once the log has outgrown it.
+        segment, changes = write_segment(db.conn, CHANGELOG_DIR)
+        print(f"  Changelog: {changes:,} changes" + (f" -> {segment}" if segment else ""))
+        if not os.path.exists(SNAPSHOT_PATH) or size_mb(CHANGELOG_DIR) > CHANGELOG_MAX_MB:
+            rows   = export_snapshot(db.conn, SNAPSHOT_PATH)
+            pruned = prune(CHANGELOG_DIR, snapshot_version(SNAPSHOT_PATH))
+            print(f"  Snapshot: {rows:,} jobs, {os.path.getsize(SNAPSHOT_PATH) / 1e6:.1f} MB "
+                  f"({pruned} segments folded in)")
+
+        # Add the snapshot and the log; stop tracking the DB itself (the file stays on disk)
+        subprocess.run(["git", "add", SNAPSHOT_PATH], check=True, capture_output=True)
+        subprocess.run(["git", "add", "-A", "--", CHANGELOG_DIR], check=False, capture_output=True)
+        subprocess.run(["git", "rm", "--cached", "--quiet", "--ignore-unmatch", "applications.db"],
+                       check=False, capture_output=True)
         subprocess.run(["git", "add", "jobs_found.json"], check=False, capture_output=True)
         
         # Commit with a skip-ci message (optional, but good practice)
@@ -209,7 +233,7 @@ async def main():
         # Push to main
         push_result = subprocess.run(["git", "push", "origin", "main"], check=True, capture_output=True, text=True)
         
-        print("  ✓ Successfully pushed database to GitHub!")
+        print("  ✓ Successfully pushed snapshot to GitHub!")
         print("  → Your Streamlit live dashboard will update automatically in a few seconds.")
     except Exception as e:
         print(f"  [WARNING] Failed to auto-sync to GitHub: {e}")
@@ -7,17 +7,26 @@ No emojis. No clutter. Pure productivity.
 import sys
 import os
 import subprocess
-import sqlite3
 import json
 import re
-import base64
-import timeago
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 from datetime import datetime, timedelta
-from local_db_manager import DatabaseManager
+from local_db_manager import DatabaseManager, connect
+from job_queries import (
+    PAGE_SIZE, count_jobs, fetch_page, snippets, job_detail, kpis, distinct_values, analytics_counts,
+    ats_histogram, tailoring_queue, applied_jobs, documents, export_csv,
+    data_version, changes_since, patch_page, posted_labels, thumbnail_path,
+)
+from snapshot import SNAPSHOT_PATH, open_snapshot, description as snapshot_description
+from changelog import CHANGELOG_DIR, last_version
+
+try:
+    import streamlit_pdf  # noqa: F401 -- st.pdf's viewer
+except ImportError:          # optional -- thumbnails / download still work
+    streamlit_pdf = None
 
 # ─── PAGE CONFIG ─────────────────────────────────────────────────────────────
 st.set_page_config(
@@ -29,6 +38,10 @@ st.set_page_config(
 
 DB_PATH = "applications.db"
 
+# Hosted read-only deployment: daily_runner pushes jobs_snapshot.parquet, not the DB (see snapshot.py)
+SNAPSHOT = os.getenv("DASHBOARD_SNAPSHOT") == "1" or (
+    not os.path.exists(DB_PATH) and os.path.exists(SNAPSHOT_PATH))
+
 # ─── CSS ─────────────────────────────────────────────────────────────────────
 st.markdown("""
 <style>
@@ -309,8 +322,8 @@ div[data-testid="stToast"] { background: var(--bg2) !important; border: 1px soli
 /* File uploader, info */
 .stInfo, .stSuccess, .stWarning, .stError { border-radius: var(--radius) !important; }
 
-/* PDF iframe */
-.pdf-frame { border-radius: var(--radius); border: 1px solid var(--border); width: 100%; height: 600px; }
+/* Document thumbnails */
+[data-testid="stImage"] img { border-radius: var(--radius); border: 1px solid var(--border); }
 
 /* Launch button row */
 .launch-row {
@@ -337,79 +350,140 @@ div[data-testid="stToast"] { background: var(--bg2) !important; border: 1px soli
 
 # ─── CONSTANTS ────────────────────────────────────────────────────────────────
 STATUS_OPTIONS = ["NEW", "APPLIED", "INTERVIEW", "OFFER", "REJECTED", "MANUAL_NEEDED", "SKIPPED"]
+DB_POLL_SECONDS = 10       # how often an idle page checks whether a run wrote to the DB
 PYTHON = sys.executable    # guaranteed to be the correct venv python
 CWD    = os.path.dirname(os.path.abspath(__file__))
 
 
 # ─── DB HELPERS ───────────────────────────────────────────────────────────────
 @st.cache_resource
+def get_writer() -> DatabaseManager:
+    """The dashboard's one write connection (status / notes saves); also brings the schema up to date."""
+    return DatabaseManager(DB_PATH)
+
+
+@st.cache_resource
+def _live_db():
+    """Read-only WAL connection -- dashboard reads never wait on a running daily_runner."""
+    get_writer()            # DB + schema exist and are in WAL mode before a read-only open
+    return connect(DB_PATH, readonly=True)
+
+
+@st.cache_resource(max_entries=1)
+def _snapshot_db(mtime: float, log_version: int):
+    """In-memory DB: the snapshot plus newer changelog segments; new files (mtime / segment) load afresh."""
+    return open_snapshot(SNAPSHOT_PATH, CHANGELOG_DIR)
+
+
 def get_db():
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-    # Ensure sponsorship column exists
-    try:
-        conn.execute("ALTER TABLE jobs ADD COLUMN sponsorship TEXT DEFAULT ''")
-        conn.commit()
-    except Exception:
-        pass
-    return conn
-
-
-@st.cache_data(ttl=30)
-def load_data() -> pd.DataFrame:
-    expected_cols = [
-        'id', 'company', 'title', 'location', 'source', 'url', 'description', 
-        'date_posted', 'scraped_date', 'salary', 'sponsorship', 'department',
-        'status', 'ats_score', 'notes', 'resume_pdf_path', 'cover_letter_pdf_path', 
-        'applied_date'
-    ]
-    
+    if SNAPSHOT:
+        return _snapshot_db(os.path.getmtime(SNAPSHOT_PATH), last_version(CHANGELOG_DIR))
+    return _live_db()
+
+
+# Everything below reads through job_queries.py: aggregates and one grid page,
+# never the whole jobs table.  Caches are keyed by the DB's change version
+# (data_version) instead of a TTL: nothing is re-read while the DB is
+# unchanged, and any write -- a status edit here, a batch from a running
+# scrape -- shows up on the next rerun.  Filter dicts are plain data, so
+# they key the caches too.
+@st.cache_data(max_entries=8)
+def load_kpis(version: int) -> dict:
+    return kpis(get_db())
+
+
+@st.cache_data(max_entries=8)
+def load_options(version: int) -> tuple[list[str], list[str]]:
+    """Filter-bar choices: (statuses, sources) present in the DB."""
     conn = get_db()
-    try:
-        df = pd.read_sql_query("""
-            SELECT
-                j.id, j.company, j.title, j.location, j.source,
-                j.url, j.description, j.date_posted, j.scraped_date,
-                COALESCE(j.salary,'')       AS salary,
-                COALESCE(j.sponsorship,'')  AS sponsorship,
-                COALESCE(j.department,'')   AS department,
-                a.status, a.ats_score, a.notes,
-                a.resume_pdf_path, a.cover_letter_pdf_path, a.applied_date
-            FROM jobs j
-            LEFT JOIN applications a ON j.id = a.job_id
-            ORDER BY j.scraped_date DESC
-        """, conn)
-    except Exception:
-        df = pd.DataFrame(columns=expected_cols)
-
-    # Ensure all columns exist with correct dtypes
-    for col in expected_cols:
-        if col not in df.columns:
-            df[col] = pd.Series(dtype='object' if col != 'ats_score' else 'float64')
-    df['scraped_date'] = pd.to_datetime(df['scraped_date'], errors='coerce')
-    df['applied_date'] = pd.to_datetime(df['applied_date'], errors='coerce')
-    df['ats_score']    = pd.to_numeric(df['ats_score'], errors='coerce')
-    
+    return distinct_values(conn, "status"), distinct_values(conn, "source")
+
+
+def load_page(f: dict, sort: str, after, version: int) -> tuple[pd.DataFrame, object]:
+    """
+    One Jobs Board page plus Posted and, while searching, the match snippet.
+
+    The page lives in session state with the version it was read at.  When
+    the DB moved on, the change feed since that version is applied to it
+    (patch_page) if it can be -- a status / notes edit costs a few indexed
+    lookups -- and the page is only re-read when rows entered, left or
+    moved.
+    """
+    conn  = get_db()
+    key   = repr((f, sort, after))
+    board = st.session_state.get("board")
+    if board is None or board["key"] != key:
+        board = None
+    elif board["version"] != version:
+        page = patch_page(board["raw"], *changes_since(conn, board["version"], f, sort))
+        board = None if page is None else {**board, "raw": page, "df": None}
+    if board is None:
+        raw, cursor = fetch_page(conn, f, sort, after)
+        board = {"key": key, "raw": raw, "next": cursor, "df": None}
+        # rows may have moved: the grid's editor starts fresh (see jobs_editor)
+        st.session_state.board_gen = st.session_state.get("board_gen", 0) + 1
+    board["version"] = version
+
+    if board["df"] is None:
+        df  = board["raw"].copy()
+        now = datetime.now()
+        df['scraped_date'] = pd.to_datetime(df['scraped_date'], errors='coerce')
+        df['ats_score']    = pd.to_numeric(df['ats_score'], errors='coerce')
+        df['Posted']       = posted_labels(df['scraped_date'], now)
+        hits = snippets(conn, f.get("search", ""), df['_rowid'].tolist())
+        if hits:
+            df['match'] = df['_rowid'].map(hits).fillna('')
+        board["df"] = df.drop(columns=['_rowid', '_key'])
+    st.session_state.board = board
+    return board["df"], board["next"]
+
+
+@st.cache_data(max_entries=32)
+def load_count(f: dict, version: int) -> tuple[int, int, int]:
+    return count_jobs(get_db(), f)
+
+
+@st.cache_data(max_entries=64)
+def load_counts(f: dict | None, version: int, *columns: str) -> pd.DataFrame:
+    return analytics_counts(get_db(), f, *columns)
+
+
+@st.cache_data(max_entries=8)
+def load_ats_histogram(version: int) -> pd.DataFrame:
+    return ats_histogram(get_db())
+
+
+@st.cache_data(max_entries=8)
+def load_pipeline(version: int) -> tuple[pd.DataFrame, int, pd.DataFrame, pd.DataFrame]:
+    """Pipeline tab: (tailoring queue, its full size, applied jobs, jobs with documents)."""
+    conn = get_db()
+    queue, queue_total = tailoring_queue(conn)
     now = datetime.now()
-    if not df.empty:
-        df['Posted'] = df['scraped_date'].apply(
-            lambda x: timeago.format(x, now) if pd.notna(x) else ""
-        )
-        def _mode(loc):
-            ll = str(loc).lower()
-            if 'remote' in ll: return 'Remote'
-            if 'hybrid' in ll: return 'Hybrid'
-            return 'On-site'
-        df['work_mode'] = df['location'].apply(_mode)
-    else:
-        df['Posted'] = pd.Series(dtype='object')
-        df['work_mode'] = pd.Series(dtype='object')
+    queue['Posted'] = posted_labels(pd.to_datetime(queue['scraped_date'], errors='coerce'), now)
+    return queue, queue_total, applied_jobs(conn), documents(conn)
+
+
+@st.fragment(run_every=DB_POLL_SECONDS)
+def watch_db():
+    """Rerun the page as soon as another process (daily_runner, a tailoring run) wrote to the DB."""
+    if data_version(get_db()) != st.session_state.get("rendered_version"):
+        st.rerun()
 
-    df['status'] = df['status'].fillna('NEW')
-    return df
+
+def _next_page(cursor):
+    st.session_state.page_cursors.append(cursor)
+
+
+def _prev_page():
+    if len(st.session_state.page_cursors) > 1:
+        st.session_state.page_cursors.pop()
 
 
 def save_application(job_id: str, status: str | None = None, notes: str | None = None):
-    conn = get_db()
+    if SNAPSHOT:
+        st.warning("Read-only snapshot -- changes are not saved.")
+        return
+    conn = get_writer().conn
     fields, vals = [], []
     if status is not None:
         fields.append("status = ?"); vals.append(status)
@@ -429,19 +503,39 @@ def save_application(job_id: str, status: str | None = None, notes: str | None =
         if fields:
             cur.execute(f"UPDATE applications SET {', '.join(fields)} WHERE job_id=?", vals)
     conn.commit()
-    st.cache_data.clear()
 
 
-def display_pdf_b64(path):
+@st.cache_data(max_entries=16)
+def pdf_bytes(path: str, mtime: float) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def show_document(path, key: str):
+    """
+    A tailored PDF: its first-page thumbnail, a download button and, on
+    request, the full viewer.  Both go out through Streamlit's media
+    endpoint -- a URL named by the content hash that the browser fetches
+    once and caches -- not as a base64 data: iframe inside every rerun.
+    """
     if not path or not os.path.exists(str(path)):
         st.info("No file available.")
         return
-    with open(path, "rb") as f:
-        b64 = base64.b64encode(f.read()).decode()
-    st.markdown(
-        f'<iframe src="data:application/pdf;base64,{b64}" class="pdf-frame"></iframe>',
-        unsafe_allow_html=True
-    )
+    path, mtime = str(path), os.path.getmtime(str(path))
+    thumb = thumbnail_path(path)
+    if os.path.exists(thumb):
+        st.image(thumb, width=306)
+    else:
+        st.caption("No thumbnail -- tailored before thumbnails were rendered.")
+
+    dl_col, view_col = st.columns(2)
+    dl_col.download_button("Download PDF", data=lambda: pdf_bytes(path, mtime),
+                           file_name=os.path.basename(path), mime="application/pdf",
+                           on_click="ignore", key=f"dl_{key}")
+    if streamlit_pdf is None:
+        view_col.caption('In-page viewer: pip install "streamlit[pdf]"')
+    elif view_col.toggle("Full preview", key=f"view_{key}"):
+        st.pdf(pdf_bytes(path, mtime), height=600, key=f"pdf_{key}")
 
 
 # ─── QUICK LAUNCH ─────────────────────────────────────────────────────────────
@@ -476,18 +570,16 @@ def launch_apply_single(job_id: str, job_url: str):
         )
         save_application(job_id, "APPLIED")
         st.toast(f"Application launched for job {job_id[:8]}...", icon=None)
-        st.cache_data.clear()
     except Exception as e:
         st.error(f"Apply failed: {e}")
 
 
 # ─── DATA LOAD ─────────────────────────────────────────────────────────────────
-raw_df = load_data()
-
-
-# ─── NAVIGATION / SELECTOR DEFAULTS ──────────────────────────────────────────
-all_statuses = sorted(raw_df['status'].dropna().unique().tolist()) if not raw_df.empty else []
-all_sources  = sorted(raw_df['source'].dropna().unique().tolist()) if not raw_df.empty else []
+version = data_version(get_db())
+st.session_state.rendered_version = version
+watch_db()
+all_statuses, all_sources = load_options(version)
+k = load_kpis(version)
 
 
 # ─── TOP BAR ─────────────────────────────────────────────────────────────────
@@ -502,6 +594,7 @@ with tb_search:
 with tb_refresh:
     if st.button("Refresh", use_container_width=True):
         st.cache_data.clear()
+        st.session_state.pop("board", None)
         st.rerun()
 
 # ─── QUICK LAUNCH BAR ─────────────────────────────────────────────────────────
@@ -527,14 +620,13 @@ with lc6:
 
 
 # ─── KPI METRICS ──────────────────────────────────────────────────────────────
-total      = len(raw_df)
-new_cnt    = int((raw_df['status'] == 'NEW').sum())
-applied    = int((raw_df['status'] == 'APPLIED').sum())
-interviews = int((raw_df['status'] == 'INTERVIEW').sum())
-offers     = int((raw_df['status'] == 'OFFER').sum())
-avg_ats    = raw_df['ats_score'].dropna()
-avg_ats_v  = f"{avg_ats.mean():.1f}" if len(avg_ats) else "—"
-tailored   = int(raw_df['resume_pdf_path'].fillna('').str.len().gt(0).sum())
+total      = k["total"]
+new_cnt    = k["new"]
+applied    = k["applied"]
+interviews = k["interviews"]
+offers     = k["offers"]
+avg_ats_v  = f"{k['avg_ats']:.1f}" if k["avg_ats"] is not None else "—"
+tailored   = k["tailored"]
 
 kc = st.columns(7)
 with kc[0]: st.metric("Total Jobs",      f"{total:,}")
@@ -552,10 +644,8 @@ st.markdown("<hr style='margin:0;border-color:#252525;'>", unsafe_allow_html=Tru
 # ─── FILTERS (always visible) ───────────────────────────────────────────────────
 fc1, fc2, fc3, fc4, fc5 = st.columns([3, 3, 2, 2, 2])
 with fc1:
-    all_statuses = sorted(raw_df['status'].dropna().unique().tolist())
     sel_status = st.multiselect("Status", all_statuses, default=all_statuses, key="f_status")
 with fc2:
-    all_sources = sorted(raw_df['source'].dropna().unique().tolist())
     sel_source = st.multiselect("Source", all_sources, key="f_source")
 with fc3:
     sel_mode = st.multiselect("Work Mode", ["Remote", "Hybrid", "On-site"], key="f_mode")
@@ -563,7 +653,7 @@ with fc4:
     sel_h1b = st.multiselect("H1B Sponsorship", ["Likely", "No", "Unknown"], key="f_h1b")
 with fc5:
     sort_by = st.selectbox("Sort By", [
-        "Newest First", "ATS Score (High to Low)", "Company A-Z",
+        "Newest First", "Relevance (Search)", "ATS Score (High to Low)", "Company A-Z",
         "Status Priority", "Source"
     ], key="f_sort")
 
@@ -581,101 +671,42 @@ with fc8:
 
 
 # ─── APPLY FILTERS ────────────────────────────────────────────────────────────
-df = raw_df.copy()
+# The filter bar becomes one parameterized WHERE clause (job_queries.py)
+time_map = {
+    "Last Hour": timedelta(hours=1),
+    "Last 6 Hours": timedelta(hours=6),
+    "Last 24 Hours": timedelta(hours=24),
+    "Last 3 Days": timedelta(days=3),
+    "Last 7 Days": timedelta(days=7),
+}
+since = ""
+if time_window in time_map:
+    # minute resolution, so reruns within the same minute hit the cached page
+    since = (datetime.now() - time_map[time_window]).strftime("%Y-%m-%d %H:%M:00")
+
+filters = {
+    "since":       since,
+    "statuses":    sel_status,
+    "sources":     sel_source,
+    "modes":       sel_mode,
+    "h1b":         sel_h1b,
+    "ats":         tuple(ats_range),
+    "entry_level": hide_senior,
+    "search":      search_q,
+}
+sort_key = sort_by
 
-if not df.empty:
-    # Time window
-    now = datetime.now()
-    time_map = {
-        "Last Hour": timedelta(hours=1),
-        "Last 6 Hours": timedelta(hours=6),
-        "Last 24 Hours": timedelta(hours=24),
-        "Last 3 Days": timedelta(days=3),
-        "Last 7 Days": timedelta(days=7),
-    }
-    tw = st.session_state.get("f_time", "All Time")
-    if tw in time_map:
-        cutoff = now - time_map[tw]
-        if 'scraped_date' in df.columns:
-            df = df[df['scraped_date'] >= pd.Timestamp(cutoff)]
-
-    # Status
-    ss = st.session_state.get("f_status", all_statuses)
-    if ss:
-        df = df[df['status'].isin(ss)]
-
-    # Source
-    src = st.session_state.get("f_source", [])
-    if src:
-        df = df[df['source'].isin(src)]
-
-    # Work mode
-    mode_sel = st.session_state.get("f_mode", [])
-    if mode_sel:
-        df = df[df['work_mode'].isin(mode_sel)]
-
-    # H1B
-    h1b_sel = st.session_state.get("f_h1b", [])
-    if h1b_sel:
-        mask = pd.Series([False] * len(df), index=df.index)
-        if "Likely" in h1b_sel:
-            mask |= df['sponsorship'].str.lower().str.contains("likely|yes|sponsor", na=False)
-        if "No" in h1b_sel:
-            mask |= df['sponsorship'].str.lower().str.contains("^no$|does not", na=False, regex=True)
-        if "Unknown" in h1b_sel:
-            mask |= df['sponsorship'].fillna('').eq('')
-        df = df[mask]
-
-    # ATS
-    ats_r = st.session_state.get("f_ats", (0.0, 10.0))
-    if 'ats_score' in df.columns:
-        ats_mask = df['ats_score'].isna() | (
-            (df['ats_score'] >= ats_r[0]) & (df['ats_score'] <= ats_r[1])
-        )
-        df = df[ats_mask]
-
-    # Entry-level-only filter
-    if st.session_state.get("f_hide_senior", True):
-        _snr = ["senior", " sr ", "sr.", "staff", "principal", "director",
-                " vp ", "v.p.", "head of", "manager", "lead engineer", "tech lead",
-                "distinguished", "fellow", "architect"]
-        snr_mask = ~df['title'].str.lower().apply(lambda t: any(x in t for x in _snr))
-        df = df[snr_mask]
-
-    # Search
-    if search_q:
-        q = search_q.lower()
-        df = df[
-            df['company'].str.lower().str.contains(q, na=False) |
-            df['title'].str.lower().str.contains(q, na=False) |
-            df['location'].str.lower().str.contains(q, na=False) |
-            df['description'].str.lower().str.contains(q, na=False)
-        ]
-
-# Sort
-sort_key = st.session_state.get("f_sort", "Newest First")
-if sort_key == "ATS Score (High to Low)":
-    df = df.sort_values('ats_score', ascending=False, na_position='last')
-elif sort_key == "Company A-Z":
-    df = df.sort_values('company')
-elif sort_key == "Status Priority":
-    order = {"INTERVIEW": 0, "OFFER": 1, "APPLIED": 2, "MANUAL_NEEDED": 3, "NEW": 4, "REJECTED": 5, "SKIPPED": 6}
-    df['_s'] = df['status'].map(lambda x: order.get(x, 9))
-    df = df.sort_values('_s').drop(columns=['_s'])
-elif sort_key == "Source":
-    if not df.empty and 'source' in df.columns:
-        df = df.sort_values('source')
-else:
-    if not df.empty and 'scraped_date' in df.columns:
-        df = df.sort_values('scraped_date', ascending=False)
+shown, n_companies, n_sources = load_count(filters, version)
 
 # Stats bar
 st.markdown(
     f"<div style='padding:6px 24px;background:#0c0c0c;border-bottom:1px solid #252525;"
     f"font-size:0.72rem;color:#555;'>"
-    f"Showing <b style='color:#FF6B00'>{len(df):,}</b> of {len(raw_df):,} jobs &nbsp;|&nbsp; "
-    f"<b style='color:#FF6B00'>{df['company'].nunique()}</b> companies &nbsp;|&nbsp; "
-    f"<b style='color:#FF6B00'>{df['source'].nunique()}</b> sources"
+    f"Showing <b style='color:#FF6B00'>{shown:,}</b> of {total:,} jobs &nbsp;|&nbsp; "
+    f"<b style='color:#FF6B00'>{n_companies}</b> companies &nbsp;|&nbsp; "
+    f"<b style='color:#FF6B00'>{n_sources}</b> sources"
+    + (" &nbsp;|&nbsp; read-only snapshot: edits are off, search covers title / company / location"
+       if SNAPSHOT else "") +
     f"</div>",
     unsafe_allow_html=True
 )
@@ -689,14 +720,29 @@ tab_jobs, tab_pipeline, tab_analytics, tab_settings = st.tabs([
 # ══════════════════════════════════════════════════════════════════════════════
 # TAB 1: JOBS BOARD
 # ══════════════════════════════════════════════════════════════════════════════
-with tab_jobs:
+# The filter bar above runs at app scope: the stats bar and the Analytics tab
+# follow it too.  Everything inside the board -- cell edits, paging, the
+# column picker -- reruns only this fragment, and the detail / actions panel
+# below it is a fragment of its own.
+@st.fragment
+def jobs_board(filters: dict, sort_key: str):
+    version = data_version(get_db())     # fresh: edits made here show up without a full rerun
+
+    # Keyset paging: a stack of page cursors, reset whenever the filters or the sort change
+    page_sig = repr((filters, sort_key))
+    if st.session_state.get("page_sig") != page_sig:
+        st.session_state.page_sig     = page_sig
+        st.session_state.page_cursors = [None]
+    page_no = len(st.session_state.page_cursors)
+    df, next_cursor = load_page(filters, sort_key, st.session_state.page_cursors[-1], version)
+    shown = load_count(filters, version)[0]
 
     # Column selector
     visible = st.multiselect(
         "COLUMNS",
         ['status', 'company', 'title', 'work_mode', 'location', 'source',
          'department', 'sponsorship', 'salary', 'Posted', 'ats_score',
-         'notes', 'url', 'resume_pdf_path', 'cover_letter_pdf_path'],
+         'notes', 'url'],
         default=['status', 'company', 'title', 'department', 'work_mode',
                  'sponsorship', 'salary', 'source', 'Posted', 'ats_score', 'notes', 'url'],
         key="col_selector",
@@ -707,6 +753,10 @@ with tab_jobs:
 
     # Build editor dataframe (include id invisibly for row identification)
     display_cols = [c for c in visible if c in df.columns]
+    if 'match' in df.columns:
+        # search active: show where the query matched, next to the title
+        at = display_cols.index('title') + 1 if 'title' in display_cols else 0
+        display_cols.insert(at, 'match')
     editor_df = df[['id'] + display_cols].copy()
     editor_display = editor_df.drop(columns=['id'])
 
@@ -720,6 +770,7 @@ with tab_jobs:
         ),
         "company":    st.column_config.TextColumn("Company", width="medium"),
         "title":      st.column_config.TextColumn("Title", width="large"),
+        "match":      st.column_config.TextColumn("Match", width="large", disabled=True),
         "location":   st.column_config.TextColumn("Location", width="medium"),
         "work_mode":  st.column_config.TextColumn("Mode", width="small"),
         "department": st.column_config.TextColumn("Dept", width="medium"),
@@ -730,8 +781,6 @@ with tab_jobs:
         "ats_score":  st.column_config.NumberColumn("ATS", format="%.1f", width="small"),
         "notes":      st.column_config.TextColumn("Notes", width="large"),
         "url":        st.column_config.LinkColumn("Apply Link", display_text="Open", width="small"),
-        "resume_pdf_path":       st.column_config.TextColumn("Resume", width="small"),
-        "cover_letter_pdf_path": st.column_config.TextColumn("Cover Letter", width="small"),
     }
 
     edited = st.data_editor(
@@ -740,13 +789,17 @@ with tab_jobs:
         hide_index=True,
         height=min(750, 36 * len(editor_display) + 42),
         num_rows="fixed",
+        disabled=SNAPSHOT,
         column_config={k: v for k, v in col_cfg.items() if k in editor_display.columns},
-        key="jobs_editor"
+        # a re-read page gets a fresh editor, so pending edits never land on other rows
+        key=f"jobs_editor_{st.session_state.board_gen}"
     )
 
     # Detect and persist changes
     try:
-        changed = (editor_display.reset_index(drop=True) != edited.reset_index(drop=True)).any(axis=1)
+        before, after = editor_display.reset_index(drop=True), edited.reset_index(drop=True)
+        # NaN != NaN: without the isna() pair every unscored row would be re-saved on each rerun
+        changed = ~((before == after) | (before.isna() & after.isna())).all(axis=1)
         if changed.any():
             for i in changed[changed].index:
                 row_id = editor_df.iloc[i]['id']
@@ -757,10 +810,30 @@ with tab_jobs:
     except Exception:
         pass
 
-    # ── Per-row Apply buttons ──────────────────────────────────────────────
+    # ── Pagination ─────────────────────────────────────────────────────────
+    first = (page_no - 1) * PAGE_SIZE
+    pg1, pg2, pg3 = st.columns([1, 1, 6])
+    with pg1:
+        st.button("Previous", disabled=page_no == 1, on_click=_prev_page, use_container_width=True)
+    with pg2:
+        st.button("Next", disabled=next_cursor is None, on_click=_next_page, args=(next_cursor,),
+                  use_container_width=True)
+    with pg3:
+        st.caption(f"Page {page_no} — rows {first + 1:,}–{first + len(df):,} of {shown:,}"
+                   if len(df) else "No jobs match the filters.")
+
+    job_actions(filters)
+
+
+@st.fragment
+def job_actions(filters: dict):
+    """Detail / apply / bulk / export -- reruns alone; the board reruns it with each new page."""
+    df = st.session_state.board["df"]
+
+    # ── Job detail / Apply ─────────────────────────────────────────────────
     st.markdown("---")
     st.markdown("#### Apply to Selected Jobs")
-    st.caption("Enter a job's row number (0-indexed from the table above) to trigger our automation for that job.")
+    st.caption("Enter a job's row number (0-indexed on this page) to open its detail or trigger our automation for that job.")
 
     apply_col1, apply_col2, apply_col3 = st.columns([2, 2, 4])
     with apply_col1:
@@ -777,6 +850,21 @@ with tab_jobs:
         if st.button("Tailor Resumes (No Apply)"):
             launch_discovery(tailor_only=True)
 
+    # Description and document paths are only read for the job being looked at
+    if 0 <= int(apply_idx) < len(df) and st.toggle("Show job detail", key="show_detail"):
+        job = job_detail(get_db(), df.iloc[int(apply_idx)]['id'])
+        if SNAPSHOT and not job['description']:     # replayed (changelog) jobs carry theirs
+            job['description'] = snapshot_description(job['id'], SNAPSHOT_PATH)
+        st.markdown(f"**{job['company']} — {job['title']}**")
+        st.caption(" | ".join(str(v) for v in [
+            job['location'], job['department'], job['salary'],
+            f"H1B: {job['sponsorship']}" if job['sponsorship'] else "",
+            f"Applied {job['applied_date']}" if job['applied_date'] else "",
+        ] if v))
+        st.markdown(f"Resume: `{job['resume_pdf_path'] or '—'}` &nbsp;|&nbsp; "
+                    f"Cover letter: `{job['cover_letter_pdf_path'] or '—'}`")
+        st.text_area("Description", job['description'] or "", height=300, disabled=True)
+
     # ── Bulk Status Update ─────────────────────────────────────────────────
     with st.expander("Bulk Status Update"):
         bulk1, bulk2, bulk3 = st.columns(3)
@@ -795,47 +883,49 @@ with tab_jobs:
                 st.success(f"Updated {len(ids)} jobs to {bulk_status}")
 
     # ── Export ────────────────────────────────────────────────────────────
+    # Built by the query only when a download is clicked
     with st.expander("Export"):
         ec1, ec2 = st.columns(2)
         with ec1:
-            csv_filtered = df.drop(columns=['id', '_s'], errors='ignore').to_csv(index=False)
-            st.download_button("Download Filtered CSV", csv_filtered, "jobs_filtered.csv", "text/csv")
+            st.download_button("Download Filtered CSV", lambda: export_csv(get_db(), filters),
+                               "jobs_filtered.csv", "text/csv")
         with ec2:
-            csv_all = raw_df.drop(columns=['id', '_s'], errors='ignore').to_csv(index=False)
-            st.download_button("Download All Jobs CSV", csv_all, "jobs_all.csv", "text/csv")
+            st.download_button("Download All Jobs CSV", lambda: export_csv(get_db()),
+                               "jobs_all.csv", "text/csv")
+
+
+with tab_jobs:
+    jobs_board(filters, sort_key)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # TAB 2: PIPELINE & RESUMES
 # ══════════════════════════════════════════════════════════════════════════════
-with tab_pipeline:
+@st.fragment
+def pipeline_tab(version: int):
     st.markdown("<div style='padding:16px 24px;'>", unsafe_allow_html=True)
 
     pipeline_sub = st.tabs(["Tailoring Queue", "Applied Jobs", "View Documents"])
+    queue, queue_total, applied_df, jobs_with_docs = load_pipeline(version)
 
     # ── Tailoring Queue ───────────────────────────────────────────────────
     with pipeline_sub[0]:
-        queue = raw_df[
-            (raw_df['status'] == 'NEW') &
-            (raw_df['resume_pdf_path'].fillna('').eq(''))
-        ][['company', 'title', 'source', 'Posted', 'salary', 'url']].copy()
-
         if queue.empty:
             st.info("No jobs awaiting tailoring. Run a discovery to fetch new jobs.")
         else:
-            st.caption(f"{len(queue):,} jobs need tailored resumes.")
+            st.caption(f"{queue_total:,} jobs need tailored resumes."
+                       + (f" Newest {len(queue):,} shown." if queue_total > len(queue) else ""))
             st.dataframe(
-                queue,
+                queue[['company', 'title', 'source', 'Posted', 'salary', 'url']],
                 use_container_width=True,
                 hide_index=True,
                 column_config={"url": st.column_config.LinkColumn("Link", display_text="Open")}
             )
-            if st.button(f"Generate Tailored Resumes for All ({len(queue)})", type="primary"):
+            if st.button(f"Generate Tailored Resumes for All ({queue_total})", type="primary"):
                 launch_discovery(tailor_only=True)
 
     # ── Applied Jobs ──────────────────────────────────────────────────────
     with pipeline_sub[1]:
-        applied_df = raw_df[raw_df['status'].isin(['APPLIED', 'INTERVIEW', 'OFFER'])].copy()
         if applied_df.empty:
             st.info("No applied jobs yet.")
         else:
@@ -860,132 +950,123 @@ with tab_pipeline:
 
     # ── Document Viewer ────────────────────────────────────────────────────
     with pipeline_sub[2]:
-        jobs_with_docs = raw_df[raw_df['resume_pdf_path'].fillna('').str.len() > 0][
-            ['company', 'title', 'resume_pdf_path', 'cover_letter_pdf_path']
-        ].copy()
-
         if jobs_with_docs.empty:
             st.info("No tailored documents yet.")
         else:
-            doc_company = st.selectbox("Select Company", jobs_with_docs['company'].tolist(), key="doc_company")
-            selected_doc = jobs_with_docs[jobs_with_docs['company'] == doc_company].iloc[0]
+            doc_idx = st.selectbox(
+                "Select Job", range(len(jobs_with_docs)), key="doc_job",
+                format_func=lambda i: f"{jobs_with_docs['company'].iat[i]} — {jobs_with_docs['title'].iat[i]}")
+            selected_doc = jobs_with_docs.iloc[doc_idx]
 
             doc_tab1, doc_tab2 = st.tabs(["Tailored Resume", "Cover Letter"])
             with doc_tab1:
-                display_pdf_b64(selected_doc.get('resume_pdf_path', ''))
+                show_document(selected_doc.get('resume_pdf_path', ''), "resume")
             with doc_tab2:
-                display_pdf_b64(selected_doc.get('cover_letter_pdf_path', ''))
+                show_document(selected_doc.get('cover_letter_pdf_path', ''), "cl")
 
     st.markdown("</div>", unsafe_allow_html=True)
 
 
+with tab_pipeline:
+    pipeline_tab(version)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # TAB 3: ANALYTICS
 # ══════════════════════════════════════════════════════════════════════════════
-with tab_analytics:
-    st.markdown("<div style='padding:16px 24px;'>", unsafe_allow_html=True)
-
+@st.cache_data(max_entries=16)
+def analytics_figures(f: dict, version: int) -> dict:
+    """
+    Every Analytics chart, built once per (chart filters, DB version): a
+    rerun for anything else -- a search keystroke, a grid edit elsewhere --
+    reuses the figures instead of re-querying and re-laying them out.
+    """
     chart_theme = {
         "plot_bgcolor":  "rgba(0,0,0,0)",
         "paper_bgcolor": "rgba(0,0,0,0)",
         "font":          {"color": "#888", "family": "Inter"},
         "margin":        {"l": 0, "r": 0, "t": 36, "b": 0},
     }
-
-    ac1, ac2 = st.columns(2)
+    figs = {}
 
     # Source bar chart
-    with ac1:
-        src_counts = df['source'].value_counts().reset_index()
-        src_counts.columns = ['source', 'count']
-        fig = px.bar(
-            src_counts, x='count', y='source', orientation='h',
-            title="Jobs by Source",
-            color='count', color_continuous_scale=["#1a1a1a", "#FF6B00", "#FF8C33"],
-            template="plotly_dark"
-        )
-        fig.update_layout(**chart_theme, showlegend=False, coloraxis_showscale=False, height=380)
-        fig.update_layout(yaxis=dict(categoryorder='total ascending',
-                                     tickfont=dict(size=11, color="#888")))
-        st.plotly_chart(fig, use_container_width=True)
+    src_counts = load_counts(f, version, "source").query("source != ''")
+    fig = px.bar(
+        src_counts, x='count', y='source', orientation='h',
+        title="Jobs by Source",
+        color='count', color_continuous_scale=["#1a1a1a", "#FF6B00", "#FF8C33"],
+        template="plotly_dark"
+    )
+    fig.update_layout(**chart_theme, showlegend=False, coloraxis_showscale=False, height=380)
+    fig.update_layout(yaxis=dict(categoryorder='total ascending',
+                                 tickfont=dict(size=11, color="#888")))
+    figs["source"] = fig
 
     # Status donut
-    with ac2:
-        status_counts = df['status'].value_counts().reset_index()
-        status_counts.columns = ['status', 'count']
-        color_map = {
-            "NEW": "#FF6B00", "APPLIED": "#22c55e", "INTERVIEW": "#3b82f6",
-            "OFFER": "#eab308", "REJECTED": "#ef4444",
-            "MANUAL_NEEDED": "#8b5cf6", "SKIPPED": "#555"
-        }
-        fig2 = px.pie(
-            status_counts, values='count', names='status',
-            title="Status Breakdown", hole=0.55,
-            color='status', color_discrete_map=color_map,
-            template="plotly_dark"
-        )
-        fig2.update_traces(textinfo='label+percent', textfont_size=11)
-        fig2.update_layout(**chart_theme, height=380, showlegend=False)
-        st.plotly_chart(fig2, use_container_width=True)
-
-    ac3, ac4 = st.columns(2)
+    status_counts = load_counts(f, version, "status")
+    color_map = {
+        "NEW": "#FF6B00", "APPLIED": "#22c55e", "INTERVIEW": "#3b82f6",
+        "OFFER": "#eab308", "REJECTED": "#ef4444",
+        "MANUAL_NEEDED": "#8b5cf6", "SKIPPED": "#555"
+    }
+    fig2 = px.pie(
+        status_counts, values='count', names='status',
+        title="Status Breakdown", hole=0.55,
+        color='status', color_discrete_map=color_map,
+        template="plotly_dark"
+    )
+    fig2.update_traces(textinfo='label+percent', textfont_size=11)
+    fig2.update_layout(**chart_theme, height=380, showlegend=False)
+    figs["status"] = fig2
 
     # Daily velocity
-    with ac3:
-        vel_df = raw_df.copy()
-        vel_df['Day'] = vel_df['scraped_date'].dt.date
-        daily = vel_df.groupby('Day').size().reset_index(name='Count')
-        daily = daily.tail(21)  # last 3 weeks
-        fig3 = px.bar(
-            daily, x='Day', y='Count', title="Daily Jobs Discovered (Last 21 Days)",
-            color_discrete_sequence=["#FF6B00"], template="plotly_dark"
-        )
-        fig3.update_traces(marker_line_width=0)
-        fig3.update_layout(**chart_theme, height=320, bargap=0.3)
-        st.plotly_chart(fig3, use_container_width=True)
+    daily = load_counts(None, version, "day").query("day != ''").rename(columns={'day': 'Day', 'count': 'Count'})
+    daily = daily.sort_values('Day').tail(21)  # last 3 weeks
+    fig3 = px.bar(
+        daily, x='Day', y='Count', title="Daily Jobs Discovered (Last 21 Days)",
+        color_discrete_sequence=["#FF6B00"], template="plotly_dark"
+    )
+    fig3.update_traces(marker_line_width=0)
+    fig3.update_layout(**chart_theme, height=320, bargap=0.3)
+    figs["daily"] = fig3
 
     # H1B breakdown
-    with ac4:
-        h1b_df = raw_df.copy()
-        def h1b_label(v):
-            v = str(v).lower()
-            if 'likely' in v or 'yes' in v: return 'Likely Sponsor'
-            if v == 'no' or 'does not' in v: return 'No Sponsorship'
-            return 'Unknown'
-        h1b_df['H1B'] = h1b_df['sponsorship'].apply(h1b_label)
-        h1b_counts = h1b_df['H1B'].value_counts().reset_index()
-        h1b_counts.columns = ['H1B', 'Count']
-        fig4 = px.pie(
-            h1b_counts, values='Count', names='H1B',
-            title="H1B Sponsorship Breakdown", hole=0.55,
-            color='H1B',
-            color_discrete_map={
-                'Likely Sponsor': '#22c55e',
-                'No Sponsorship': '#ef4444',
-                'Unknown': '#555'
-            },
-            template="plotly_dark"
-        )
-        fig4.update_traces(textinfo='label+percent', textfont_size=11)
-        fig4.update_layout(**chart_theme, height=320, showlegend=False)
-        st.plotly_chart(fig4, use_container_width=True)
+    h1b_counts = load_counts(None, version, "h1b").rename(columns={'h1b': 'H1B', 'count': 'Count'})
+    fig4 = px.pie(
+        h1b_counts, values='Count', names='H1B',
+        title="H1B Sponsorship Breakdown", hole=0.55,
+        color='H1B',
+        color_discrete_map={
+            'Likely Sponsor': '#22c55e',
+            'No Sponsorship': '#ef4444',
+            'Unknown': '#555'
+        },
+        template="plotly_dark"
+    )
+    fig4.update_traces(textinfo='label+percent', textfont_size=11)
+    fig4.update_layout(**chart_theme, height=320, showlegend=False)
+    figs["h1b"] = fig4
 
     # ATS distribution
-    ats_data = raw_df['ats_score'].dropna()
+    ats_data = load_ats_histogram(version)
+    figs["ats"] = None
     if len(ats_data) > 0:
-        fig5 = px.histogram(
-            raw_df, x='ats_score', nbins=20,
+        fig5 = px.bar(
+            ats_data, x='ats_score', y='count',
             title="ATS Score Distribution",
             color_discrete_sequence=["#FF6B00"], template="plotly_dark"
         )
-        fig5.update_layout(**chart_theme, height=280)
-        st.plotly_chart(fig5, use_container_width=True)
+        fig5.update_traces(marker_line_width=0)
+        fig5.update_layout(**chart_theme, height=280, bargap=0.05)
+        figs["ats"] = fig5
 
     # Source x Status heatmap
-    if len(df) > 0 and df['source'].nunique() > 1:
-        pivot = df.pivot_table(
-            index='source', columns='status', values='id',
-            aggfunc='count', fill_value=0
+    src_status = load_counts(f, version, "source", "status").query("source != ''")
+    figs["heatmap"] = None
+    if src_status['source'].nunique() > 1:
+        pivot = src_status.pivot_table(
+            index='source', columns='status', values='count',
+            aggfunc='sum', fill_value=0
         )
         fig6 = px.imshow(
             pivot, title="Source vs Status Heatmap",
@@ -993,15 +1074,44 @@ with tab_analytics:
             template="plotly_dark", aspect="auto"
         )
         fig6.update_layout(**chart_theme, height=max(300, len(pivot) * 40))
-        st.plotly_chart(fig6, use_container_width=True)
+        figs["heatmap"] = fig6
+    return figs
+
+
+@st.fragment
+def analytics_tab(filters: dict, version: int):
+    st.markdown("<div style='padding:16px 24px;'>", unsafe_allow_html=True)
+    st.caption("Charts read the analytics summary tables: the date, status and source filters apply, "
+               "search / work mode / H1B / ATS / entry-level do not.")
+
+    # keyed by the filters the charts can apply, so e.g. typing a search reuses them
+    figs = analytics_figures({k: filters[k] for k in ("since", "statuses", "sources")}, version)
+    ac1, ac2 = st.columns(2)
+    with ac1:
+        st.plotly_chart(figs["source"], use_container_width=True)
+    with ac2:
+        st.plotly_chart(figs["status"], use_container_width=True)
+    ac3, ac4 = st.columns(2)
+    with ac3:
+        st.plotly_chart(figs["daily"], use_container_width=True)
+    with ac4:
+        st.plotly_chart(figs["h1b"], use_container_width=True)
+    for name in ("ats", "heatmap"):
+        if figs[name] is not None:
+            st.plotly_chart(figs[name], use_container_width=True)
 
     st.markdown("</div>", unsafe_allow_html=True)
 
 
+with tab_analytics:
+    analytics_tab(filters, version)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # TAB 4: SETTINGS
 # ══════════════════════════════════════════════════════════════════════════════
-with tab_settings:
+@st.fragment
+def settings_tab(k: dict):
     st.markdown("<div style='padding:16px 24px;'>", unsafe_allow_html=True)
     st.markdown("#### Configuration")
 
@@ -1045,25 +1155,24 @@ with tab_settings:
         st.markdown("**Database Actions**")
         if st.button("Clear Cache"):
             st.cache_data.clear()
+            st.session_state.pop("board", None)
             st.rerun()
 
         st.markdown("---")
         st.warning("⚠️ **Danger Zone**")
         confirm_delete = st.checkbox("I understand this will permanently delete ALL jobs and applications.")
-        if st.button("Delete Entire Database", type="secondary", disabled=not confirm_delete):
-            db_mgr = DatabaseManager(DB_PATH)
-            db_mgr.clear_all_data()
-            db_mgr.close()
+        if st.button("Delete Entire Database", type="secondary", disabled=not confirm_delete or SNAPSHOT):
+            get_writer().clear_all_data()
             st.cache_data.clear()
             st.success("Database cleared successfully.")
             st.rerun()
         db_stats_df = pd.DataFrame([{
-            "Total Jobs":    len(raw_df),
-            "Applied":       applied,
-            "Interviews":    interviews,
-            "Offers":        offers,
-            "New":           new_cnt,
-            "Tailored":      tailored,
+            "Total Jobs":    k["total"],
+            "Applied":       k["applied"],
+            "Interviews":    k["interviews"],
+            "Offers":        k["offers"],
+            "New":           k["new"],
+            "Tailored":      k["tailored"],
         }]).T.reset_index()
         db_stats_df.columns = ["Metric", "Value"]
         st.dataframe(db_stats_df, use_container_width=True, hide_index=True)
@@ -1071,11 +1180,15 @@ with tab_settings:
     st.markdown("</div>", unsafe_allow_html=True)
 
 
+with tab_settings:
+    settings_tab(k)
+
+
 # ─── FOOTER ───────────────────────────────────────────────────────────────────
 st.markdown(
     f"<div style='text-align:center;color:#2a2a2a;font-size:0.65rem;"
     f"padding:16px;border-top:1px solid #151515;margin-top:12px;font-family:JetBrains Mono,monospace;'>"
-    f"JOB HUNTER AI v4.0 &nbsp;|&nbsp; {len(raw_df):,} jobs in database "
+    f"JOB HUNTER AI v4.0 &nbsp;|&nbsp; {total:,} jobs in database "
     f"&nbsp;|&nbsp; Last loaded: {datetime.now().strftime('%H:%M:%S')}</div>",
     unsafe_allow_html=True
 )
\ No newline at end of file
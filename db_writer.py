@@ -0,0 +1,118 @@
+"""
+JobWriter — streaming discovery -> DB pipeline with a batched background writer
+──────────────────────────────────────────────────────────────────────────────────
+Scrapers publish job dicts with writer.publish(job) as soon as they accept
+them -- a listing row whose detail / HTML stage is still pending goes in
+provisional and is completed by a second publish (insert_raw_jobs).  A
+consumer task drains the asyncio.Queue and hands batches to ONE dedicated
+writer thread that owns its own DatabaseManager connection.  A batch is
+written in a single transaction once it holds batch_size rows or flush_ms
+has passed since its first row, whichever comes first -- so inserts never
+run on the event loop, and a crash loses at most the batch in flight.
+
+    writer = JobWriter(db.db_path)
+    await writer.start()
+    writer.publish(job)            # non-blocking, from any coroutine
+    await writer.close()           # drains the queue, flushes, joins the thread
+    writer.inserted, writer.updated, writer.duplicates
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from local_db_manager import DatabaseManager, DB_PATH
+
+
+WRITER_BATCH_SIZE = 200
+WRITER_FLUSH_MS   = 500
+
+_STOP = object()
+
+
+class JobWriter:
+    def __init__(self, db_path: str = DB_PATH, batch_size: int = WRITER_BATCH_SIZE,
+                 flush_ms: int = WRITER_FLUSH_MS):
+        self.db_path    = db_path
+        self.batch_size = max(int(batch_size), 1)
+        self.flush_s    = max(flush_ms, 1) / 1000
+        self.inserted   = 0
+        self.updated    = 0          # already stored, content changed -> row refreshed
+        self.duplicates = 0          # already stored, unchanged -> last_seen bumped
+        self.batches    = 0
+        self.failed     = 0
+        self.failed_urls: list[str] = []             # jobs in failed batches (watermarks forget them)
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job-writer")
+        self._db: DatabaseManager | None = None     # created on the writer thread
+
+    # ──────────────────────────────────────────────────────────────────────
+    # WRITER THREAD
+    # ──────────────────────────────────────────────────────────────────────
+    def _write_batch(self, batch: list[dict]) -> tuple[int, int, int]:
+        if self._db is None:
+            self._db = DatabaseManager(self.db_path)
+        return self._db.insert_raw_jobs(batch)     # one transaction per batch
+
+    def _close_db(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    # ──────────────────────────────────────────────────────────────────────
+    # EVENT-LOOP SIDE
+    # ──────────────────────────────────────────────────────────────────────
+    async def start(self):
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task  = asyncio.create_task(self._consume())
+
+    def publish(self, job: dict):
+        if self._queue is not None:
+            self._queue.put_nowait(job)
+
+    async def _flush(self, batch: list[dict]):
+        loop = asyncio.get_running_loop()
+        try:
+            new, changed, dup = await loop.run_in_executor(self._pool, self._write_batch, batch)
+        except Exception as e:
+            self.failed += len(batch)
+            self.failed_urls.extend(job.get("url", "") for job in batch)
+            print(f"  [DB writer] Batch of {len(batch)} failed: {e}")
+            return
+        self.inserted   += new
+        self.updated    += changed
+        self.duplicates += dup
+        self.batches    += 1
+
+    async def _consume(self):
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+            batch    = [item]
+            deadline = time.monotonic() + self.flush_s
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+
+    async def close(self):
+        """Flush everything published so far and release the writer thread."""
+        if self._task is not None:
+            self._queue.put_nowait(_STOP)
+            await self._task
+            self._task = None
+        await asyncio.get_running_loop().run_in_executor(self._pool, self._close_db)
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,215 @@
+"""
+HTML parsing backends for the discovery engine
+───────────────────────────────────────────────
+All HTML work in job_discovery.py goes through this module:
+
+  html_to_text(html)            description HTML -> plain text
+                                (Greenhouse / Lever / Ashby / RemoteOK,
+                                 GitHub markdown table cells)
+  extract_linkedin_cards(html)  LinkedIn guest-API page -> card field dicts
+
+Backends (DISCOVERY_HTML_PARSER env var, default "auto"):
+
+  lxml         libxml2 via lxml.html -- fastest, optional dependency
+  stream       stdlib html.parser tokenizer, no tree is built
+               (text only; card extraction falls back to auto)
+  html.parser  BeautifulSoup's pure-Python tree -- the original behaviour
+  auto         lxml when installed, else html.parser
+
+Every backend mirrors BeautifulSoup's get_text(): script / style / template
+contents and comments are skipped, and text nodes are joined with
+`separator` (with strip=True each node is stripped and empty ones dropped).
+
+    python bench_html_parsers.py   -> per-document timings for each backend
+"""
+
+import os
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:          # optional -- html.parser / stream still work
+    lxml = None
+
+HTML_PARSER = os.getenv("DISCOVERY_HTML_PARSER", "auto")
+
+TEXT_BACKENDS = ("lxml", "stream", "html.parser")
+CARD_BACKENDS = ("lxml", "html.parser")
+
+_SKIP_TAGS = {"script", "style", "template"}
+
+
+def available_backends() -> list[str]:
+    return [b for b in TEXT_BACKENDS if b != "lxml" or lxml is not None]
+
+
+def _resolve(backend: str | None, allowed: tuple) -> str:
+    backend = backend or HTML_PARSER
+    if backend == "lxml" and lxml is None:
+        backend = "auto"
+    if backend not in allowed:
+        backend = "lxml" if lxml is not None else "html.parser"
+    return backend
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# TEXT EXTRACTION
+# ─────────────────────────────────────────────────────────────────────────────
+class _TextTokenizer(HTMLParser):
+    """Streams text nodes out of the tokenizer without building a tree."""
+
+    def __init__(self, strip: bool = True):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.strip = strip
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            if self.strip:
+                data = data.strip()
+            if data:
+                self.parts.append(data)
+
+
+def _lxml_parts(root):
+    for event, el in etree.iterwalk(root, events=("start", "end")):
+        if event == "start":
+            if isinstance(el.tag, str) and el.tag not in _SKIP_TAGS and el.text:
+                yield el.text
+        elif el is not root and el.tail:
+            yield el.tail
+
+
+def _lxml_root(html: str):
+    try:
+        return lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def html_to_text(html: str, separator: str = " ", backend: str | None = None, strip: bool = True) -> str:
+    if not html:
+        return ""
+    backend = _resolve(backend, TEXT_BACKENDS)
+
+    if backend == "lxml":
+        root = _lxml_root(html)
+        if root is None:
+            return ""
+        parts = _lxml_parts(root)
+        if strip:
+            parts = (t.strip() for t in parts)
+        return separator.join(p for p in parts if p)
+
+    if backend == "stream":
+        tok = _TextTokenizer(strip)
+        tok.feed(html)
+        tok.close()
+        return separator.join(tok.parts)
+
+    return BeautifulSoup(html, "html.parser").get_text(separator=separator, strip=strip)
+
+
+def html_batch_to_text(docs: list[str], separator: str = " ", backend: str | None = None) -> list[str]:
+    """Worker-pool entry point (must stay a module-level function to pickle)."""
+    return [html_to_text(d, separator, backend) for d in docs]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# LINKEDIN GUEST-API CARDS
+# ─────────────────────────────────────────────────────────────────────────────
+def _has_class(fragment: str) -> str:
+    return f"contains(@class, '{fragment}')"
+
+
+def _lxml_text(el) -> str:
+    return "".join(p for p in (t.strip() for t in _lxml_parts(el)) if p) if el is not None else ""
+
+
+def _first(el, *paths):
+    for path in paths:
+        found = el.xpath(path)
+        if found:
+            return found[0]
+    return None
+
+
+def _cards_lxml(html: str) -> list[dict]:
+    root = _lxml_root(html)
+    if root is None:
+        return []
+    cards = root.xpath(f"//div[{_has_class('base-card')}]") or root.xpath("//li")
+    out = []
+    for card in cards:
+        title_tag = _first(card, f".//h3[{_has_class('base-search-card__title')}]", ".//h3", ".//h4")
+        co_tag    = _first(card, f".//h4[{_has_class('base-search-card__subtitle')}]",
+                                 f".//a[{_has_class('hidden-nested-link')}]")
+        link_tag  = _first(card, f".//a[{_has_class('base-card__full-link')}]",
+                                 ".//a[contains(@href, '/jobs/view/')]")
+        loc_tag   = _first(card, f".//span[{_has_class('job-search-card__location')}]")
+        time_tag  = _first(card, ".//time")
+        out.append({
+            "title":    _lxml_text(title_tag) if title_tag is not None else None,
+            "company":  _lxml_text(co_tag) if co_tag is not None else None,
+            "href":     (link_tag.get("href") or "") if link_tag is not None else None,
+            "location": _lxml_text(loc_tag) if loc_tag is not None else None,
+            "date":     (time_tag.get("datetime") or _lxml_text(time_tag)) if time_tag is not None else None,
+        })
+    return out
+
+
+def _cards_bs4(html: str) -> list[dict]:
+    soup  = BeautifulSoup(html, "html.parser")
+    cards = soup.find_all("div", class_=lambda c: c and "base-card" in c)
+    if not cards:
+        # Older response format uses <li> wrappers
+        cards = soup.find_all("li")
+    out = []
+    for card in cards:
+        title_tag = (
+            card.find("h3", class_=lambda c: c and "base-search-card__title" in c) or
+            card.find("h3") or
+            card.find("h4")
+        )
+        # IMPORTANT: avoid bare card.find('h4') for company -- it can match the location span.
+        co_tag = (
+            card.find("h4", class_=lambda c: c and "base-search-card__subtitle" in c) or
+            card.find("a", class_=lambda c: c and "hidden-nested-link" in c)
+        )
+        link_tag = card.find("a", class_=lambda c: c and "base-card__full-link" in c)
+        if not link_tag:
+            link_tag = card.find("a", href=lambda h: h and "/jobs/view/" in h)
+        loc_tag  = card.find("span", class_=lambda c: c and "job-search-card__location" in c)
+        time_tag = card.find("time")
+        out.append({
+            "title":    title_tag.get_text(strip=True) if title_tag else None,
+            "company":  co_tag.get_text(strip=True) if co_tag else None,
+            "href":     link_tag.get("href", "") if link_tag else None,
+            "location": loc_tag.get_text(strip=True) if loc_tag else None,
+            "date":     (time_tag.get("datetime") or time_tag.get_text(strip=True)) if time_tag else None,
+        })
+    return out
+
+
+def extract_linkedin_cards(html: str, backend: str | None = None) -> list[dict]:
+    """
+    One dict per job card: title / company / href / location / date.
+    A field is None when its tag is missing, so callers keep their fallbacks.
+    """
+    if not html:
+        return []
+    if _resolve(backend, CARD_BACKENDS) == "lxml":
+        return _cards_lxml(html)
+    return _cards_bs4(html)
@@ -0,0 +1,160 @@
+"""
+ResponseCache — on-disk HTTP cache with ETag / Last-Modified revalidation
+──────────────────────────────────────────────────────────────────────────
+Sits under JobDiscovery._fetch_with_retry.  For every GET we keep the last
+body plus its validators in a small SQLite file (http_cache.db) and send
+If-None-Match / If-Modified-Since on the next run.  A 304 replays the cached
+body through CachedResponse, so fetch_* parsing and filtering run unchanged
+while the board itself costs only a few hundred bytes on the wire.
+
+Size-bounded: once the stored bodies exceed max_bytes the least recently
+used entries are evicted.  Hit / miss / bytes-saved counts are kept per
+source (the rate_limiter host group) for the end-of-run report.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlencode
+
+from multidict import CIMultiDict
+
+
+CACHE_PATH      = os.getenv("HTTP_CACHE_PATH", "http_cache.db")
+CACHE_MAX_BYTES = int(float(os.getenv("HTTP_CACHE_MAX_MB", "256")) * 1024 * 1024)
+
+# Response headers worth replaying (Link drives Greenhouse pagination)
+_REPLAY_HEADERS = ("Content-Type", "Link", "ETag", "Last-Modified")
+
+
+class CachedResponse:
+    """Minimal stand-in for aiohttp.ClientResponse built from a cached body."""
+
+    def __init__(self, url: str, body: bytes, headers: dict, status: int = 200):
+        self.url     = url
+        self.status  = status
+        self.headers = CIMultiDict(headers)
+        self.size    = len(body)
+        self._body   = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: str | None = None, errors: str = "replace") -> str:
+        return self._body.decode(encoding or "utf-8", errors=errors)
+
+    async def json(self, content_type=None, loads=json.loads, **_):
+        return loads(self._body.decode("utf-8", errors="replace"))
+
+    def release(self):
+        pass
+
+
+class ResponseCache:
+    def __init__(self, path: str = CACHE_PATH, max_bytes: int = CACHE_MAX_BYTES):
+        self.path      = path
+        self.max_bytes = max_bytes
+        self._lock     = threading.Lock()
+        self.conn      = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key           TEXT PRIMARY KEY,
+                url           TEXT,
+                headers       TEXT,
+                body          BLOB,
+                size          INTEGER,
+                stored_at     REAL,
+                last_access   REAL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)")
+        self.conn.commit()
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        # source -> {"hits": n, "misses": n, "bytes_saved": n}
+        self.stats: dict[str, dict] = {}
+
+    # ──────────────────────────────────────────────────────────────────────
+    # KEYS / STATS
+    # ──────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def key_for(url: str, params: dict | None = None) -> str:
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(sorted(params.items()))}"
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    def _count(self, source: str, field: str, n: int = 1):
+        row = self.stats.setdefault(source, {"hits": 0, "misses": 0, "bytes_saved": 0})
+        row[field] += n
+
+    def record_hit(self, source: str, saved: int):
+        self._count(source, "hits")
+        self._count(source, "bytes_saved", saved)
+
+    def record_miss(self, source: str):
+        self._count(source, "misses")
+
+    # ──────────────────────────────────────────────────────────────────────
+    # LOOKUP / STORE  (sync -- call through the async wrappers below)
+    # ──────────────────────────────────────────────────────────────────────
+    def _lookup(self, key: str):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT url, headers, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                return None
+            self.conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+            self.conn.commit()
+        return CachedResponse(row[0], row[2], json.loads(row[1] or "{}"))
+
+    def _store(self, key: str, url: str, headers, body: bytes):
+        if len(body) > self.max_bytes:
+            return
+        kept = {h: headers[h] for h in _REPLAY_HEADERS if h in headers}
+        now  = time.time()
+        with self._lock:
+            old = self.conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self.conn.execute("""
+                INSERT OR REPLACE INTO responses (key, url, headers, body, size, stored_at, last_access)
+                VALUES (?,?,?,?,?,?,?)
+            """, (key, url, json.dumps(kept), body, len(body), now, now))
+            self.total_bytes += len(body) - (old[0] if old else 0)
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        """Drop least-recently-used bodies until we are back under max_bytes."""
+        while self.total_bytes > self.max_bytes:
+            victims = self.conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access LIMIT 32"
+            ).fetchall()
+            if not victims:
+                self.total_bytes = 0
+                return
+            for key, size in victims:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.total_bytes -= size
+                if self.total_bytes <= self.max_bytes:
+                    break
+
+    async def lookup(self, key: str) -> CachedResponse | None:
+        return await asyncio.to_thread(self._lookup, key)
+
+    async def store(self, key: str, url: str, headers, body: bytes):
+        await asyncio.to_thread(self._store, key, url, headers, body)
+
+    # ──────────────────────────────────────────────────────────────────────
+    # UTILITY
+    # ──────────────────────────────────────────────────────────────────────
+    def summary(self) -> list[tuple[str, int, int, int]]:
+        """[(source, hits, misses, bytes saved)] biggest savings first."""
+        rows = [(src, s["hits"], s["misses"], s["bytes_saved"]) for src, s in self.stats.items()]
+        return sorted(rows, key=lambda r: (-r[3], -r[1]))
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -26,13 +26,25 @@ WHAT'S NEW vs v1:
 
 import asyncio
 import aiohttp
+import html
 import json
 import os
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from bs4 import BeautifulSoup
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
+from rate_limiter import HostLimiter
+from http_cache import ResponseCache, CACHE_PATH
+from board_health import BoardHealth, HEALTH_PATH
+from keyword_planner import KeywordPlanner, PLANNER_PATH
+from watermarks import Watermarks, WATERMARK_PATH
+from known_jobs import KnownJobIndex
+from local_db_manager import DB_PATH
+from db_writer import JobWriter
+from html_parsing import html_to_text, html_batch_to_text, extract_linkedin_cards, HTML_PARSER
+from token_matcher import TokenMatcher
 
 load_dotenv()
 
@@ -204,7 +216,7 @@ WORKDAY_COMPANIES = [
     {"name": "Uber",      "url": "https://www.uber.com/api/loadSearchJobsResults"},  # special
     {"name": "Lyft",      "url": "https://jobs.lever.co/lyft"},  # Already in Lever
     {"name": "Twitter/X", "url": "https://twitter.wd5.myworkdayjobs.com/Twitter"},
-    {"name": "Snap",      "url": "https://wd1.myworkdayjobs.com/en-US/snap"},
+    {"name": "Snap",      "url": "https://snapchat.wd1.myworkdayjobs.com/snap"},
     {"name": "Pinterest", "url": "https://www.pinterestcareers.com/job-search-results/"},
     {"name": "Block",     "url": "https://block.xyz/careers"},
     {"name": "Shopify",   "url": "https://jobs.lever.co/shopify"},  # Already in Lever
@@ -216,10 +228,32 @@ WORKDAY_COMPANIES = [
     {"name": "Robinhood", "url": "https://boards.greenhouse.io/robinhood"},
 ]
 
+# Workday engine fan-out: tenants crawled at once / keyword searches in flight per tenant
+WORKDAY_TENANT_CONCURRENCY  = 8
+WORKDAY_KEYWORD_CONCURRENCY = 3
+
+# HTML -> text stage: jobs carry raw `description_html` until _render_descriptions
+# converts them in batches on a worker pool, off the event loop.
+#   DISCOVERY_HTML_POOL    = process | thread   (process scales with cores)
+#   DISCOVERY_HTML_WORKERS = pool size (default: CPU count)
+#   DISCOVERY_HTML_PARSER  = auto | lxml | stream | html.parser  (see html_parsing.py)
+HTML_POOL_KIND    = os.getenv("DISCOVERY_HTML_POOL", "process")
+HTML_POOL_WORKERS = int(os.getenv("DISCOVERY_HTML_WORKERS", "0")) or (os.cpu_count() or 2)
+HTML_BATCH_SIZE   = 64
+
+# Two-phase list -> detail fetching: board listings are fetched without bodies,
+# filtered, deduped, and only the survivors get a detail request (_fetch_details).
+#   DISCOVERY_DETAIL_FETCH       = 1 | 0   (0 = old inline mode, Greenhouse ?content=true)
+#   DISCOVERY_DETAIL_CONCURRENCY = detail requests in flight across all ATSes
+DETAIL_FETCH       = os.getenv("DISCOVERY_DETAIL_FETCH", "1") != "0"
+DETAIL_CONCURRENCY = int(os.getenv("DISCOVERY_DETAIL_CONCURRENCY", "16"))
+
 # ─────────────────────────────────────────────────────────────────────────────
 
 class JobDiscovery:
-    def __init__(self, profile_path="user_profile.json", hours_back=24):
+    def __init__(self, profile_path="user_profile.json", hours_back=24, host_limits=None,
+                 http_cache=CACHE_PATH, board_health=HEALTH_PATH, keyword_stats=PLANNER_PATH,
+                 delta=False, watermarks=WATERMARK_PATH, known_jobs=DB_PATH):
         if os.path.exists(profile_path):
             with open(profile_path, "r") as f:
                 self.profile = json.load(f)
@@ -235,6 +269,29 @@ class JobDiscovery:
         self.cutoff = datetime.now(timezone.utc) - timedelta(hours=self.hours_back)
         self.yesterday = self.cutoff  # backward-compat alias
         self._stats = {s: 0 for s in ["Greenhouse","Lever","Ashby","Workable","SmartRecruiters","BambooHR","RemoteOK","Adzuna","SimplifyJobs","GitHub Lists","Workday","LinkedIn","JobRight AI","Simplify"]}
+        # Per-host concurrency + token-bucket pacing shared by every fetch_* (see rate_limiter.HOST_LIMITS)
+        self._limiter = HostLimiter(host_limits)
+        # On-disk conditional-GET cache (http_cache.py); opened by run_discovery, None disables it
+        self.http_cache_path = http_cache
+        self._cache = None
+        # Per-(ATS, slug) liveness registry -- dead slugs are skipped with exponential re-probe backoff
+        self._health = BoardHealth(board_health)
+        # Per-tenant Workday keyword ordering / pruning by historical unique yield
+        self._kw_planner = KeywordPlanner(keyword_stats)
+        # Per-board high-water marks; with delta=True postings seen on earlier runs are skipped
+        self._marks = Watermarks(watermarks, delta=delta)
+        # Fingerprints of every job already in the DB (known_jobs side table), loaded once;
+        # known jobs are dropped before any date / sponsorship / detail / render work
+        self._known = KnownJobIndex(known_jobs)
+        # Streaming DB writer (db_writer.py); set by run_discovery(db=...), None otherwise
+        self.writer = None
+        # Title filters compiled once into a single pass (token_matcher.py); memoized because
+        # the same title goes through _is_role_match in the scraper and again in _add_job
+        self._title_matcher = TokenMatcher({
+            "block":  self._SENIORITY_BLOCK,
+            "always": self._ALWAYS_MATCH,
+            "role":   self.roles,
+        }, cache_size=65536)
 
     # ─────────────────────────────────────────────────────────────────────
     # UTILITY
@@ -284,28 +341,32 @@ class JobDiscovery:
     ]
 
     def _is_role_match(self, title):
-        title_lower = str(title).lower()
         if not self.roles: return True
+        hits = self._title_matcher.scan(str(title).lower())
         # Note: seniority blocking is now the authoritative gate in _add_job._SENIORITY_BLOCK
         # This redundant check keeps fast-prefiltering at the scraper level (avoids unnecessary work)
-        if any(neg in title_lower for neg in self._SENIORITY_BLOCK):
+        if "block" in hits:
             return False
         # Always match known SWE/SDE/developer variations regardless of profile
-        if any(tok in title_lower for tok in self._ALWAYS_MATCH):
-            return True
-        return any(role.lower() in title_lower for role in self.roles)
+        return "always" in hits or "role" in hits
+
+    _SPONSOR_NO = ["no h1b", "no visa", "does not sponsor", "not sponsor",
+                   "unable to sponsor", "cannot sponsor", "citizen only",
+                   "us citizen", "clearance required"]
+    _SPONSOR_LIKELY = ["h1b sponsor likely", "visa sponsor", "h1b sponsor",
+                       "sponsorship available", "will sponsor", "open to sponsor",
+                       "sponsors h1b"]
 
     @staticmethod
     def _extract_sponsorship(text: str) -> str:
-        """Parse H1B sponsorship signal from raw text."""
+        """
+        Parse H1B sponsorship signal from raw text.  Plain containment scans:
+        on ~2 KB descriptions they beat the compiled TokenMatcher (bench_matchers.py).
+        """
         t = text.lower()
-        if any(x in t for x in ["no h1b", "no visa", "does not sponsor", "not sponsor",
-                                 "unable to sponsor", "cannot sponsor", "citizen only",
-                                 "us citizen", "clearance required"]):
+        if any(x in t for x in JobDiscovery._SPONSOR_NO):
             return "No"
-        if any(x in t for x in ["h1b sponsor likely", "visa sponsor", "h1b sponsor",
-                                 "sponsorship available", "will sponsor", "open to sponsor",
-                                 "sponsors h1b"]):
+        if any(x in t for x in JobDiscovery._SPONSOR_LIKELY):
             return "Likely"
         return ""
 
@@ -347,21 +408,21 @@ class JobDiscovery:
             pass
         return None
 
+    _NON_US_REMOTE = ["emea","apac","uk","europe","germany","india","canada","latam"]
+    _US_INDICATORS = [
+        "united states","usa","us","america",
+        " ca"," ny"," wa"," tx"," fl"," il"," ma"," co"," ga"," va",
+        "california","new york","washington","texas","seattle","san francisco",
+        "san jose","los angeles","boston","chicago","austin","denver","atlanta",
+        "remote us","us-remote","remote (us",
+    ]
+
     def _is_us_location(self, loc_str):
         if not loc_str: return True   # assume US if unknown
-        loc_lower = str(loc_str).lower()
-        if "remote" in loc_lower and not any(x in loc_lower for x in ["emea","apac","uk","europe","germany","india","canada","latam"]):
+        hits = _LOCATION_MATCHER.scan(str(loc_str).lower())
+        if "remote" in hits and "non_us" not in hits:
             return True
-        us_indicators = [
-            "united states","usa","us","america",
-            " ca"," ny"," wa"," tx"," fl"," il"," ma"," co"," ga"," va",
-            "california","new york","washington","texas","seattle","san francisco",
-            "san jose","los angeles","boston","chicago","austin","denver","atlanta",
-            "remote us","us-remote","remote (us",
-        ]
-        for ind in us_indicators:
-            if ind in loc_lower: return True
-        return False
+        return "us" in hits
 
     # Tokens that universally reject a title regardless of which scraper sends it.
     # This is the ONLY place the senior/lead blocklist lives -- every add goes through here.
@@ -372,18 +433,27 @@ class JobDiscovery:
         'architect', '5+ yr', '7+ yr', '8+ yr', '10+ yr',
     ]
 
-    def _add_job(self, job_data):
+    def _add_job(self, job_data, mark=None, posting_id=None):
+        """
+        Accept one job (True) unless it is blocked or a duplicate.  `mark` /
+        `posting_id`: the board watermark and listing ID it came from, which
+        a failure further down forgets (watermarks.py).
+        """
         title = job_data.get('title', '') or ''
         tl = title.lower()
 
         # ── UNIVERSAL SENIOR/LEAD FILTER -- applied before ANY dedup check ──
-        if any(blk in tl for blk in self._SENIORITY_BLOCK):
+        if "block" in self._title_matcher.scan(tl):
+            return False
+
+        # ── Cross-run dedup: already stored on an earlier run ──
+        url = (job_data.get('url') or '').strip().rstrip('/')
+        if self._known.known(url, job_data.get('company', ''), title):
             return False
 
         job_data['date'] = self._standardize_date(job_data.get('date', ''))
 
         # ── Primary dedup: URL (most reliable across sources) ──
-        url = (job_data.get('url') or '').strip().rstrip('/')
         if url and url in self.seen_urls:
             return False
         if url:
@@ -409,27 +479,84 @@ class JobDiscovery:
         source = job_data.get('source', '')
         if source in self._stats:
             self._stats[source] += 1
+        if mark is not None:
+            self._marks.hold(job_data.get('url', ''), mark, posting_id)
+        self._publish(job_data)
         return True
 
+    def _publish(self, job):
+        """
+        Hand a snapshot of `job` to the streaming DB writer.  A listing row
+        still waiting for its detail / HTML stage goes in as provisional
+        (see insert_raw_jobs) and is published again once those stages ran.
+        """
+        if self.writer is not None:
+            self.writer.publish(dict(job))
+
+    @staticmethod
+    def _probe_status(resp):
+        """Board-health status for a failed board fetch (None = network error)."""
+        return f"http_{resp.status}" if resp is not None else "error"
+
     async def _fetch_with_retry(self, session, url, method="GET", extra_headers=None, **kwargs):
-        """GET/POST with exponential backoff on 429 / 5xx."""
+        """
+        GET/POST with exponential backoff on 429 / 5xx.
+
+        Every request waits for a slot from self._limiter (per-host concurrency
+        cap + token bucket), and the body is buffered while the slot is held so
+        callers can still `await resp.json()` / `resp.text()` afterwards.
+        A 429 pauses the whole host group instead of just this coroutine.
+
+        GETs are revalidated against self._cache when it is open: a 304 returns
+        the stored body as a CachedResponse, so callers parse it exactly as if
+        it had been downloaded again.
+        """
         if extra_headers:
             kwargs.setdefault("headers", {})
             kwargs["headers"] = {**kwargs["headers"], **extra_headers}
+
+        cache_key = cached = None
+        if method == "GET" and self._cache is not None:
+            cache_key = ResponseCache.key_for(url, kwargs.get("params"))
+            cached = await self._cache.lookup(cache_key)
+            if cached:
+                validators = {}
+                if cached.headers.get("ETag"):
+                    validators["If-None-Match"] = cached.headers["ETag"]
+                if cached.headers.get("Last-Modified"):
+                    validators["If-Modified-Since"] = cached.headers["Last-Modified"]
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **validators}
+
         for attempt in range(4):
             try:
-                if method == "POST":
-                    resp = await session.post(url, **kwargs)
-                else:
-                    resp = await session.get(url, **kwargs)
+                async with self._limiter.slot(url) as group:
+                    if method == "POST":
+                        resp = await session.post(url, **kwargs)
+                    else:
+                        resp = await session.get(url, **kwargs)
+                    if resp.status in (304, 429) or resp.status >= 500:
+                        resp.release()
+                    else:
+                        group.bytes_in += len(await resp.read())
+                source = group.name.split(":")[0]
+                if resp.status == 304 and cached:
+                    self._cache.record_hit(source, cached.size)
+                    return cached
                 if resp.status == 429:
                     wait = 2 ** attempt
-                    print(f"  [429] Rate limited on {url[:60]}. Sleeping {wait}s...")
-                    await asyncio.sleep(wait)
+                    retry_after = resp.headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        wait = max(wait, min(int(retry_after), 60))
+                    print(f"  [429] Rate limited on {url[:60]}. Pausing host {wait}s...")
+                    self._limiter.throttle(url, wait)
                     continue
                 if resp.status >= 500:
                     await asyncio.sleep(1.5 * (attempt + 1))
                     continue
+                if cache_key and resp.status == 200:
+                    self._cache.record_miss(source)
+                    if resp.headers.get("ETag") or resp.headers.get("Last-Modified"):
+                        await self._cache.store(cache_key, url, resp.headers, await resp.read())
                 return resp
             except Exception as e:
                 if attempt == 3: raise
@@ -442,7 +569,9 @@ class JobDiscovery:
     async def fetch_greenhouse(self, session, board):
         """
         Greenhouse public Job Board API -- returns ALL jobs (handles pagination).
-        Endpoint: GET https://boards-api.greenhouse.io/v1/boards/{board}/jobs?content=true
+        Endpoint: GET https://boards-api.greenhouse.io/v1/boards/{board}/jobs
+        (?content=true only when DETAIL_FETCH is off -- otherwise the listing is
+        fetched bare and surviving jobs get GET .../jobs/{id} in _fetch_details)
 
         Improvements vs old version:
         - Uses posted_at (real post date) not updated_at (can reflect edits to old jobs)
@@ -452,15 +581,20 @@ class JobDiscovery:
         - Extracts department from job.departments[0].name
         No auth needed. Pagination via Link: <url>; rel="next" header.
         """
-        url = f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs?content=true"
+        base = f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs"
+        url = base if DETAIL_FETCH else f"{base}?content=true"
         page_count = 0
         added = 0
+        status, listed = "error", 0
+        mark, complete = self._marks.board('Greenhouse', board), False
 
         while url and page_count < 20:   # safety cap 20 pages
             page_count += 1
             try:
                 resp = await self._fetch_with_retry(session, url)
                 if not resp or resp.status != 200:
+                    if page_count == 1:
+                        status = self._probe_status(resp)
                     break
 
                 data = await resp.json()
@@ -472,6 +606,7 @@ class JobDiscovery:
                     board_company = data['company'].get('name', '')
 
                 jobs = data.get('jobs', [])
+                status, listed = "ok", listed + len(jobs)
 
                 for job in jobs:
                     try:
@@ -480,7 +615,10 @@ class JobDiscovery:
                         try:
                             posted_dt = datetime.fromisoformat(raw_posted.replace('Z', '+00:00'))
                         except Exception:
-                            posted_dt = datetime.now(timezone.utc)
+                            posted_dt = None
+                        if mark.skip(job.get('id'), posted_dt) or self._known.known(job.get('absolute_url', '')):
+                            continue
+                        posted_dt = posted_dt or datetime.now(timezone.utc)
 
                         if posted_dt < self.yesterday:
                             continue
@@ -493,9 +631,8 @@ class JobDiscovery:
                         if not self._is_us_location(loc):
                             continue
 
-                        # ── Description HTML -> plain text ──
-                        desc_html = job.get('content', '') or ''
-                        desc_text = BeautifulSoup(desc_html, 'html.parser').get_text(separator=' ', strip=True)
+                        # ── Description HTML -> plain text happens later in _render_descriptions ──
+                        desc_html = html.unescape(job.get('content', '') or '')
 
                         # ── Company name: job-level > board-level > slug ──
                         company = (
@@ -516,21 +653,21 @@ class JobDiscovery:
                         depts = job.get('departments') or []
                         department = depts[0].get('name', '') if depts else ''
 
-                        # ── Sponsorship signal from description ──
-                        sponsorship = self._extract_sponsorship(desc_text)
-
+                        # ── Sponsorship signal comes from the rendered description ──
                         if self._add_job({
                             'title': title,
                             'company': company,
                             'location': loc,
                             'url': job.get('absolute_url', ''),
                             'source': 'Greenhouse',
-                            'description': desc_text[:2000],
+                            'description': '',
+                            'description_html': desc_html,
+                            'detail_url': f"{base}/{job['id']}" if DETAIL_FETCH and job.get('id') else '',
                             'date': posted_dt.strftime('%Y-%m-%d'),
                             'salary': salary,
                             'department': department,
-                            'sponsorship': sponsorship,
-                        }):
+                            'sponsorship': '',
+                        }, mark, job.get('id')):
                             added += 1
 
                     except Exception:
@@ -546,11 +683,17 @@ class JobDiscovery:
                         if m:
                             next_url = m.group(1)
                 url = next_url
+                if not url or mark.page_done():
+                    complete = True
+                    break
 
             except Exception as e:
                 print(f'  [Greenhouse:{board}] Error: {e}')
                 break
 
+        self._health.record('Greenhouse', board, status, listed)
+        if complete:
+            self._marks.commit('Greenhouse', board, mark)
         if added:
             print(f'  Greenhouse [{board}]: +{added} jobs ({page_count} pages)')
 
@@ -572,6 +715,8 @@ class JobDiscovery:
         offset = None
         page_count = 0
         added = 0
+        status, listed = "error", 0
+        mark, complete = self._marks.board('Lever', board), False
 
         while page_count < 10:
             page_count += 1
@@ -580,6 +725,8 @@ class JobDiscovery:
             try:
                 resp = await self._fetch_with_retry(session, url)
                 if not resp or resp.status != 200:
+                    if page_count == 1:
+                        status = self._probe_status(resp)
                     break
 
                 data = await resp.json()
@@ -594,13 +741,19 @@ class JobDiscovery:
                 else:
                     break
 
+                status, listed = "ok", listed + len(jobs)
                 if not jobs:
+                    complete = True
                     break
 
                 for job in jobs:
                     # ── Date (Lever createdAt is Unix ms) ──
                     created_at = datetime.fromtimestamp(
                         job.get('createdAt', time.time() * 1000) / 1000, tz=timezone.utc)
+                    if mark.skip(job.get('id'), created_at if job.get('createdAt') else None):
+                        continue
+                    if self._known.known(job.get('hostedUrl', '')):
+                        continue
                     if created_at < self.yesterday:
                         continue
 
@@ -630,13 +783,11 @@ class JobDiscovery:
                         if mn or mx:
                             salary = f'{cur} ${mn:,}–${mx:,}' if (mn and mx) else f'{cur} ${mn or mx:,}'
 
-                    # ── Description (plain text if available) ──
+                    # ── Description (plain text if available, else HTML rendered later) ──
                     desc = job.get('descriptionPlain', '') or ''
-                    if not desc:
-                        desc_html = job.get('description', '') or ''
-                        desc = BeautifulSoup(desc_html, 'html.parser').get_text(separator=' ', strip=True)
+                    desc_html = '' if desc else (job.get('description', '') or '')
 
-                    # ── H1B sponsorship ──
+                    # ── H1B sponsorship (HTML-only descriptions get it in _render_descriptions) ──
                     sponsorship = self._extract_sponsorship(desc)
 
                     # ── Department ──
@@ -649,20 +800,25 @@ class JobDiscovery:
                         'url': job.get('hostedUrl', ''),
                         'source': 'Lever',
                         'description': desc[:2000],
+                        'description_html': desc_html,
                         'date': created_at.strftime('%Y-%m-%d'),
                         'salary': salary,
                         'department': department,
                         'sponsorship': sponsorship,
-                    }):
+                    }, mark, job.get('id')):
                         added += 1
 
-                if not offset:
-                    break  # v0 single-page or exhausted
+                if not offset or mark.page_done():
+                    complete = True
+                    break  # v0 single-page, exhausted, or only known postings left
 
             except Exception as e:
                 print(f'  [Lever:{board}] Error: {e}')
                 break
 
+        self._health.record('Lever', board, status, listed)
+        if complete:
+            self._marks.commit('Lever', board, mark)
         if added:
             print(f'  Lever [{board}]: +{added} jobs')
 
@@ -678,19 +834,25 @@ class JobDiscovery:
         url = f"https://api.ashbyhq.com/posting-api/job-board/{slug}?includeCompensation=true"
         try:
             resp = await self._fetch_with_retry(session, url)
-            if not resp or resp.status != 200: return
+            if not resp or resp.status != 200:
+                self._health.record('Ashby', slug, self._probe_status(resp))
+                return
             
             data = await resp.json()
             jobs = data.get("jobs", []) if isinstance(data, dict) else []
+            self._health.record('Ashby', slug, 'ok', len(jobs))
+            mark = self._marks.board('Ashby', slug)
             added = 0
             
             for job in jobs:
                 published = job.get('publishedAt', '') or ''
-                if published:
-                    try:
-                        pub_dt = datetime.fromisoformat(published.replace('Z', '+00:00'))
-                        if pub_dt < self.yesterday: continue
-                    except: pass
+                try:
+                    pub_dt = datetime.fromisoformat(published.replace('Z', '+00:00')) if published else None
+                except ValueError:
+                    pub_dt = None
+                if mark.skip(job.get('id'), pub_dt): continue
+                if self._known.known(job.get('jobUrl', job.get('applyUrl', ''))): continue
+                if pub_dt and pub_dt < self.yesterday: continue
                 
                 if not self._is_role_match(job.get('title', '')): continue
                 
@@ -704,7 +866,7 @@ class JobDiscovery:
                 comp = job.get('compensation', {}) or {}
                 salary = comp.get('compensationTierSummary', '') or comp.get('scrapeableCompensationSalarySummary', '') or ''
                 
-                desc_plain = job.get('descriptionPlain', '') or BeautifulSoup(job.get('descriptionHtml',''),'html.parser').get_text()
+                desc_plain = job.get('descriptionPlain', '') or ''
                 
                 if self._add_job({
                     "title": job.get('title', ''),
@@ -713,16 +875,19 @@ class JobDiscovery:
                     "url": job.get('jobUrl', job.get('applyUrl', '')),
                     "source": "Ashby",
                     "description": desc_plain[:2000],
+                    "description_html": '' if desc_plain else (job.get('descriptionHtml', '') or ''),
                     "date": published[:10] if published else datetime.now().strftime("%Y-%m-%d"),
                     "salary": salary,
                     "department": job.get('department', ''),
-                }):
+                }, mark, job.get('id')):
                     added += 1
             
+            self._marks.commit('Ashby', slug, mark)
             if added: print(f"  Ashby [{slug}]: +{added} jobs")
             
         except Exception as e:
-            pass  # many slugs won't exist -- silently skip
+            # many slugs won't exist -- the health registry backs them off
+            self._health.record('Ashby', slug, 'error')
 
     # ─────────────────────────────────────────────────────────────────────
     # WORKABLE  (public jobs API)
@@ -735,21 +900,30 @@ class JobDiscovery:
         url = f"https://apply.workable.com/api/v1/widget/accounts/{company_slug}/jobs"
         try:
             resp = await self._fetch_with_retry(session, url)
-            if not resp or resp.status != 200: return
+            if not resp or resp.status != 200:
+                self._health.record('Workable', company_slug, self._probe_status(resp))
+                return
             data = await resp.json()
             jobs = data.get("results", []) if isinstance(data, dict) else []
+            self._health.record('Workable', company_slug, 'ok', len(jobs))
+            mark = self._marks.board('Workable', company_slug)
             added = 0
             for job in jobs:
-                if not self._is_role_match(job.get('title', '')): continue
-                loc = (job.get('location') or {}).get('city', '') + ", " + (job.get('location') or {}).get('country', '')
-                if not self._is_us_location(loc): continue
                 created = job.get('published_on', '') or ''
                 try:
-                    created_dt = datetime.fromisoformat(created.replace('Z','+00:00'))
-                    if created_dt < self.yesterday: continue
-                except: pass
+                    created_dt = datetime.fromisoformat(created.replace('Z','+00:00')) if created else None
+                except ValueError:
+                    created_dt = None
+                if mark.skip(job.get('shortcode'), created_dt): continue
                 shortcode = job.get('shortcode','')
                 apply_url = f"https://apply.workable.com/{company_slug}/j/{shortcode}/" if shortcode else ''
+                if self._known.known(apply_url): continue
+                if not self._is_role_match(job.get('title', '')): continue
+                loc = (job.get('location') or {}).get('city', '') + ", " + (job.get('location') or {}).get('country', '')
+                if not self._is_us_location(loc): continue
+                try:
+                    if created_dt and created_dt < self.yesterday: continue
+                except TypeError: pass
                 if self._add_job({
                     "title": job.get('title',''),
                     "company": company_slug.replace('-',' ').replace('_',' ').title(),
@@ -759,11 +933,12 @@ class JobDiscovery:
                     "description": job.get('description','')[:2000],
                     "date": created[:10] if created else '',
                     "salary": "",
-                }):
+                }, mark, job.get('shortcode')):
                     added += 1
+            self._marks.commit('Workable', company_slug, mark)
             if added: print(f"  Workable [{company_slug}]: +{added} jobs")
         except Exception as e:
-            pass
+            self._health.record('Workable', company_slug, 'error')
 
     # ─────────────────────────────────────────────────────────────────────
     # SMARTRECRUITERS  (public search API with pagination)
@@ -783,19 +958,37 @@ class JobDiscovery:
         offset = 0
         page_limit = 100
         total_added = 0
+        status, listed = "error", 0
+        mark, complete = self._marks.board('SmartRecruiters', company_id), False
 
         while True:
             url = f'{base_url}?limit={page_limit}&offset={offset}'
             try:
                 resp = await self._fetch_with_retry(session, url)
                 if not resp or resp.status != 200:
+                    if offset == 0:
+                        status = self._probe_status(resp)
                     break
                 data = await resp.json()
                 jobs = data.get('content', []) if isinstance(data, dict) else []
+                status, listed = "ok", listed + len(jobs)
                 if not jobs:
+                    complete = True
                     break
 
                 for job in jobs:
+                    posted = job.get('releasedDate', '') or ''
+                    try:
+                        released = datetime.fromisoformat(posted.replace('Z', '+00:00')) if posted else None
+                    except ValueError:
+                        released = None
+                    if mark.skip(job.get('id'), released):
+                        continue
+                    job_id = job.get('id', '')
+                    apply_url = f'https://jobs.smartrecruiters.com/{company_id}/{job_id}'
+                    if self._known.known(apply_url):
+                        continue
+
                     title = job.get('name', '') or ''
                     if not self._is_role_match(title):
                         continue
@@ -809,18 +1002,14 @@ class JobDiscovery:
                     if not self._is_us_location(loc + ' ' + country):
                         continue
 
-                    posted = job.get('releasedDate', '') or ''
                     try:
-                        posted_dt = datetime.fromisoformat(posted.replace('Z', '+00:00'))
-                        if posted_dt < self.yesterday:
+                        if released and released < self.yesterday:
                             continue
-                    except Exception:
+                    except TypeError:
                         pass
 
-                    job_id = job.get('id', '')
-                    apply_url = f'https://jobs.smartrecruiters.com/{company_id}/{job_id}'
-
-                    # Description: jobDescription.text (direct form)
+                    # Description: jobDescription.text (direct form) -- the listing usually
+                    # omits it; the full jobAd comes from postings/{id} in _fetch_details
                     desc = ''
                     jd = job.get('jobDescription') or {}
                     if isinstance(jd, dict):
@@ -847,22 +1036,27 @@ class JobDiscovery:
                         'url': apply_url,
                         'source': 'SmartRecruiters',
                         'description': desc[:2000],
+                        'detail_url': f'{base_url}/{job_id}' if DETAIL_FETCH and job_id else '',
                         'date': posted[:10] if posted else '',
                         'salary': '',
                         'department': department,
                         'sponsorship': sponsorship,
-                    }):
+                    }, mark, job_id):
                         total_added += 1
 
                 # Pagination
                 total_found = data.get('totalFound', 0)
                 offset += page_limit
-                if offset >= total_found or offset >= 500:
+                if offset >= total_found or offset >= 500 or mark.page_done():
+                    complete = True
                     break
 
             except Exception:
                 break
 
+        self._health.record('SmartRecruiters', company_id, status, listed)
+        if complete:
+            self._marks.commit('SmartRecruiters', company_id, mark)
         if total_added:
             print(f'  SmartRecruiters [{company_id}]: +{total_added} jobs')
 
@@ -877,7 +1071,7 @@ class JobDiscovery:
 
         Improvements:
         - Date filter: skip jobs older than lookback window
-        - Description via individual job detail endpoint
+        - Description via individual job detail endpoint (careers/{id}/detail, _fetch_details)
         - Sponsorship extracted from metadata
         """
         url = f'https://{company_domain}.bamboohr.com/careers/list'
@@ -885,12 +1079,25 @@ class JobDiscovery:
             headers = {'Accept': 'application/json'}
             resp = await self._fetch_with_retry(session, url, headers=headers)
             if not resp or resp.status != 200:
+                self._health.record('BambooHR', company_domain, self._probe_status(resp))
                 return
             data = await resp.json()
             results = data.get('result', []) if isinstance(data, dict) else []
+            self._health.record('BambooHR', company_domain, 'ok', len(results))
+            mark = self._marks.board('BambooHR', company_domain)
             added = 0
 
             for job in results:
+                raw_date = job.get('datePosted', '') or job.get('createdDate', '') or ''
+                try:
+                    posted_dt = datetime.fromisoformat(raw_date[:10]).replace(tzinfo=timezone.utc) if raw_date else None
+                except ValueError:
+                    posted_dt = None  # If date unparseable, include job to be safe
+                job_id = job.get('id', '') or job.get('jobId', '')
+                apply_url = f'https://{company_domain}.bamboohr.com/careers/{job_id}' if job_id else ''
+                if mark.skip(job_id, posted_dt) or self._known.known(apply_url):
+                    continue
+
                 title = job.get('jobOpeningName', '') or ''
                 if not self._is_role_match(title):
                     continue
@@ -899,17 +1106,8 @@ class JobDiscovery:
                     continue
 
                 # ── Date filter ──
-                raw_date = job.get('datePosted', '') or job.get('createdDate', '') or ''
-                if raw_date:
-                    try:
-                        posted_dt = datetime.fromisoformat(raw_date[:10]).replace(tzinfo=timezone.utc)
-                        if posted_dt < self.yesterday:
-                            continue
-                    except Exception:
-                        pass  # If date unparseable, include job to be safe
-
-                job_id = job.get('id', '') or job.get('jobId', '')
-                apply_url = f'https://{company_domain}.bamboohr.com/careers/{job_id}' if job_id else ''
+                if posted_dt and posted_dt < self.yesterday:
+                    continue
 
                 # ── Description from listing metadata ──
                 desc = job.get('summary', '') or job.get('description', '') or ''
@@ -925,21 +1123,102 @@ class JobDiscovery:
                     'url': apply_url,
                     'source': 'BambooHR',
                     'description': desc[:2000],
+                    'detail_url': f'https://{company_domain}.bamboohr.com/careers/{job_id}/detail'
+                                  if DETAIL_FETCH and job_id else '',
                     'date': raw_date[:10] if raw_date else datetime.now().strftime('%Y-%m-%d'),
                     'salary': '',
                     'department': department,
                     'sponsorship': sponsorship,
-                }):
+                }, mark, job_id):
                     added += 1
 
+            self._marks.commit('BambooHR', company_domain, mark)
             if added:
                 print(f'  BambooHR [{company_domain}]: +{added} jobs')
         except Exception:
-            pass
+            self._health.record('BambooHR', company_domain, 'error')
 
     # ─────────────────────────────────────────────────────────────────────
     # WORKDAY  (POST-based JSON search -- handles pagination)
     # ─────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _workday_tenants(companies):
+        """
+        Split WORKDAY_COMPANIES into real Workday tenants and everything else.
+        Lever / Greenhouse entries are already covered by their own scrapers,
+        Oracle / custom career sites have no Workday API -- all are dropped up
+        front, and tenants sharing one URL (Dell / EMC) are crawled once.
+        """
+        tenants, skipped, seen = [], {}, set()
+        for company in companies:
+            url = company['url'].rstrip('/')
+            if 'myworkdayjobs.com' in url:
+                kind = 'duplicate' if url in seen else None
+            elif 'lever.co' in url:
+                kind = 'Lever'
+            elif 'greenhouse.io' in url:
+                kind = 'Greenhouse'
+            elif 'oraclecloud.com' in url:
+                kind = 'Oracle'
+            else:
+                kind = 'other'
+            if kind:
+                skipped[kind] = skipped.get(kind, 0) + 1
+                continue
+            seen.add(url)
+            tenants.append(company)
+        return tenants, skipped
+
+    async def run_workday(self, session, companies=None):
+        """
+        Workday engine -- crawls every tenant concurrently over ONE shared session.
+        At most WORKDAY_TENANT_CONCURRENCY tenants run at once, each with up to
+        WORKDAY_KEYWORD_CONCURRENCY keyword searches in flight; per-tenant
+        request pacing comes from the Workday entry in rate_limiter.HOST_LIMITS.
+        """
+        tenants, skipped = self._workday_tenants(WORKDAY_COMPANIES if companies is None else companies)
+        if skipped:
+            print(f"  Workday: {len(tenants)} tenants, skipped " +
+                  ", ".join(f"{n} {kind}" for kind, n in skipped.items()))
+
+        gate = asyncio.Semaphore(WORKDAY_TENANT_CONCURRENCY)
+
+        async def _one(company):
+            async with gate:
+                try:
+                    await self.fetch_workday(session, company)
+                except Exception as e:
+                    print(f"  [Workday:{company['name']}] Error: {e}")
+
+        await asyncio.gather(*(_one(c) for c in tenants))
+        self._kw_planner.save()
+
+    @staticmethod
+    def _workday_api_base(workday_url):
+        """
+        Career-site URL -> JSON API base.
+        https://nvidia.wd5.myworkdayjobs.com/en-US/NVIDIAExternalCareerSite
+            -> https://nvidia.wd5.myworkdayjobs.com/wday/cxs/nvidia/NVIDIAExternalCareerSite
+
+        On the bare data-centre host (wd1.myworkdayjobs.com) the host names no
+        tenant, so it is the first path segment (or the site itself when
+        that is all the path has):
+        https://wd1.myworkdayjobs.com/en-US/snapchat/snap
+            -> https://wd1.myworkdayjobs.com/wday/cxs/snapchat/snap
+        https://wd1.myworkdayjobs.com/en-US/snap
+            -> https://wd1.myworkdayjobs.com/wday/cxs/snap/snap
+        """
+        parts = urlsplit(workday_url)
+        path  = parts.path.strip('/')
+        if path.startswith('wday/cxs/'):
+            return workday_url.rstrip('/')
+        segs = [p for p in path.split('/') if p and not re.fullmatch(r'[a-z]{2}-[A-Z]{2}', p)]
+        site = segs[-1] if segs else ''
+        tenant = parts.netloc.split('.')[0]
+        if re.fullmatch(r'wd\d+', tenant):
+            tenant = segs[0] if segs else ''
+        return f"{parts.scheme}://{parts.netloc}/wday/cxs/{tenant}/{site}".rstrip('/')
+
     async def fetch_workday(self, session, company):
         """
         Workday REST search API (POST JSON) with pagination.
@@ -949,6 +1228,16 @@ class JobDiscovery:
         - Uses postedOnDate filter for freshness ('&postedOnDate=LAST_7_DAYS')
         - Salary / compensation from job detail if available
         - Pagination increased to 50 per page
+        - Search hits the /wday/cxs/{tenant}/{site} JSON API; listings carry no
+          description, so surviving postings get GET {api}{externalPath} in
+          _fetch_details (jobPostingInfo.jobDescription)
+        - Keyword searches run concurrently (WORKDAY_KEYWORD_CONCURRENCY per tenant)
+        - Per-tenant seen-externalPath set: a posting returned by several keyword
+          searches is processed once, before any filtering or dict building
+        - KeywordPlanner orders keywords by historical unique yield and drops
+          the ones whose results are fully covered by the others
+        - Delta mode: externalPaths processed on earlier runs are skipped, and a
+          keyword stops paging once a page adds nothing new
         """
         workday_url = company['url']
         company_name = company['name']
@@ -959,7 +1248,8 @@ class JobDiscovery:
         if 'myworkdayjobs.com' not in workday_url:
             return
 
-        search_url = workday_url.rstrip('/') + '/jobs'
+        api_base = self._workday_api_base(workday_url)
+        search_url = api_base + '/jobs'
         headers = {
             'Content-Type': 'application/json',
             'Accept': 'application/json',
@@ -987,9 +1277,20 @@ class JobDiscovery:
             'Platform Engineer',
         ]
 
+        planned = self._kw_planner.plan(workday_url, role_keywords)
         company_added = 0
-        for role_kw in role_keywords:
+        posts = 0
+        seen_paths: set = set()   # externalPath of every posting already handled for this tenant
+        relevant: set = set()     # ... of those, the ones that passed the filters
+        listed: dict = {}         # keyword -> every posting its search returned (successful searches only)
+        mark = self._marks.board('Workday', workday_url)
+        failed = 0
+        kw_gate = asyncio.Semaphore(WORKDAY_KEYWORD_CONCURRENCY)
+
+        async def _search(role_kw):
+            nonlocal company_added, posts, failed
             offset = 0
+            kw_keys = set()
             while True:
                 payload = {
                     'appliedFacets': {},
@@ -998,19 +1299,44 @@ class JobDiscovery:
                     'searchText': role_kw,
                 }
                 try:
+                    posts += 1
                     resp = await self._fetch_with_retry(
                         session, search_url, method='POST',
                         json=payload, headers=headers
                     )
                     if not resp or resp.status != 200:
-                        break
+                        failed += 1
+                        return
                     data = await resp.json()
                     job_postings = data.get('jobPostings', []) or []
                     if not job_postings:
                         break
 
-                    kw_added = 0
+                    # Paging depends only on this keyword's own results -- not on which
+                    # keyword happened to claim a shared posting first
+                    page_relevant = 0
                     for job in job_postings:
+                        # ── Cross-keyword dedup before any per-posting work ──
+                        ext_id = job.get('externalPath', '') or ''
+                        if not ext_id:
+                            bullets = job.get('bulletFields', []) or []
+                            ext_id = bullets[0] if bullets else ''
+                        dedup_key = ext_id or job.get('title', '')
+                        kw_keys.add(dedup_key)
+                        if dedup_key in seen_paths:
+                            page_relevant += dedup_key in relevant
+                            continue
+                        seen_paths.add(dedup_key)
+                        # postedOn is relative text ("Posted 3 Days Ago"), so Workday marks are IDs only
+                        if mark.skip(dedup_key):
+                            continue
+                        apply_url = (
+                            workday_url.rstrip('/') +
+                            (ext_id if ext_id.startswith('/') else f'/{ext_id}')
+                        )
+                        if self._known.known(apply_url):
+                            continue
+
                         title = job.get('title', '')
                         if not self._is_role_match(title):
                             continue
@@ -1027,39 +1353,52 @@ class JobDiscovery:
                         except Exception:
                             pass
 
-                        ext_id = job.get('externalPath', '') or ''
-                        if not ext_id:
-                            bullets = job.get('bulletFields', []) or []
-                            ext_id = bullets[0] if bullets else ''
-                        apply_url = (
-                            workday_url.rstrip('/') +
-                            (ext_id if ext_id.startswith('/') else f'/{ext_id}')
-                        )
-
+                        relevant.add(dedup_key)
+                        page_relevant += 1
                         if self._add_job({
                             'title': title,
                             'company': company_name,
                             'location': loc,
                             'url': apply_url,
                             'source': 'Workday',
-                            'description': str(job.get('jobDescription', ''))[:2000],
+                            'description': str(job.get('jobDescription', '') or '')[:2000],
+                            'detail_url': (api_base + (ext_id if ext_id.startswith('/') else f'/{ext_id}'))
+                                          if DETAIL_FETCH and ext_id else '',
                             'date': posted_on[:10] if posted_on else datetime.now().strftime('%Y-%m-%d'),
                             'salary': '',
                             'sponsorship': '',
-                        }):
-                            kw_added += 1
+                        }, mark, dedup_key):
                             company_added += 1
 
                     total = data.get('total', 0)
                     offset += 50
-                    if offset >= min(total, 200) or not kw_added:
+                    if offset >= min(total, 200) or not page_relevant:
                         break
 
                 except Exception:
-                    break
+                    failed += 1
+                    return
+            listed[role_kw] = kw_keys
+
+        async def _bounded(role_kw):
+            async with kw_gate:
+                await _search(role_kw)
+
+        # gather() starts coroutines in order, so the highest-yield keywords claim postings first
+        await asyncio.gather(*(_bounded(kw) for kw in planned))
+        # Unique yield is credited in planned order, whatever order the searches finished in;
+        # a failed search is not recorded at all (it would read as "covered by the others")
+        credited: set = set()
+        for kw in planned:
+            if kw in listed:
+                self._kw_planner.record(workday_url, kw, len(listed[kw] - credited))
+                credited |= listed[kw]
+        if not failed:
+            self._marks.commit('Workday', workday_url, mark)
 
         if company_added:
-            print(f'  Workday [{company_name}]: +{company_added} jobs')
+            print(f'  Workday [{company_name}]: +{company_added} jobs '
+                  f'({len(planned)}/{len(role_keywords)} keywords, {posts} POSTs)')
 
     # ─────────────────────────────────────────────────────────────────────
     # ADZUNA
@@ -1204,7 +1543,7 @@ class JobDiscovery:
     # ─────────────────────────────────────────────────────────────────────
     # SIMPLIFY REST API  (Phase B -- no login, JSON, fast)
     # ─────────────────────────────────────────────────────────────────────
-    async def fetch_simplify_api(self, session, db=None):
+    async def fetch_simplify_api(self, session):
         """
         Simplify 'API' -- expanded multi-repo GitHub JSON fetcher.
 
@@ -1375,10 +1714,6 @@ class JobDiscovery:
                     }):
                         feed_added += 1
                         total_added += 1
-                        if db:
-                            db.insert_raw_job({'title': title, 'company': company,
-                                               'location': loc, 'url': job_url,
-                                               'source': 'SimplifyJobs', 'date': posted.strftime('%Y-%m-%d')})
 
                 if feed_added:
                     print(f'  [Simplify GitHub] {label}: +{feed_added} jobs')
@@ -1412,7 +1747,8 @@ class JobDiscovery:
                     "location": loc,
                     "url": job.get('url',''),
                     "source": "RemoteOK",
-                    "description": BeautifulSoup(job.get('description',''),'html.parser').get_text()[:2000],
+                    "description": '',
+                    "description_html": job.get('description', '') or '',
                     "date": job.get('date','')[:10],
                     "salary": job.get('salary',''),
                 }):
@@ -1471,8 +1807,7 @@ class JobDiscovery:
                 # Extract text columns
                 text_cols = []
                 for p in parts[1:-1]:
-                    soup = BeautifulSoup(p, "html.parser")
-                    txt = soup.get_text().strip().replace("**","").replace("__","")
+                    txt = html_to_text(p, separator="", strip=False).strip().replace("**","").replace("__","")
                     if txt and len(txt) > 1 and not ("http" in txt.lower()):
                         text_cols.append(txt)
                 
@@ -1561,7 +1896,7 @@ class JobDiscovery:
     # ─────────────────────────────────────────────────────────────────────
     # LINKEDIN PHASE A -- Guest JSON API (no login, fast, structured)
     # ─────────────────────────────────────────────────────────────────────
-    async def fetch_linkedin_api(self, session, db=None):
+    async def fetch_linkedin_api(self, session):
         """
         LinkedIn public guest API -- no cookies, no Playwright, 25 jobs/page.
 
@@ -1658,14 +1993,8 @@ class JobDiscovery:
                     if not html.strip():
                         break
 
-                    # Parse HTML -- each job is in <li class="...">
-                    from bs4 import BeautifulSoup as _BS
-                    soup = _BS(html, "html.parser")
-                    cards = soup.find_all("div", class_=lambda c: c and "base-card" in c)
-                    if not cards:
-                        # Older response format uses <li> wrappers
-                        cards = soup.find_all("li")
-
+                    # Parse HTML -- each job is a base-card <div> (older format: <li>)
+                    cards = extract_linkedin_cards(html)
                     if not cards:
                         break  # empty page -- done for this query
 
@@ -1673,48 +2002,22 @@ class JobDiscovery:
                     for card in cards:
                         try:
                             # ── Title ──────────────────────────────────────
-                            title_tag = (
-                                card.find("h3", class_=lambda c: c and "base-search-card__title" in c) or
-                                card.find("h3") or
-                                card.find("h4")
-                            )
-                            if not title_tag:
-                                continue
-                            title = title_tag.get_text(strip=True)
+                            title = card["title"]
                             if not title or len(title) < 3:
                                 continue
 
-                            # ── Company ──
-                            # IMPORTANT: avoid bare card.find('h4') -- it can match the location span.
-                            # Only trust explicit class-based lookups.
-                            co_tag = (
-                                card.find("h4", class_=lambda c: c and "base-search-card__subtitle" in c) or
-                                card.find("a", class_=lambda c: c and "hidden-nested-link" in c)
-                            )
-                            company = co_tag.get_text(strip=True) if co_tag else "Unknown"
+                            # ── Company ── (class-based lookups only, never a bare <h4>)
+                            company = card["company"] if card["company"] is not None else "Unknown"
 
                             # ── URL ────────────────────────────────────────
-                            link_tag = card.find("a", class_=lambda c: c and "base-card__full-link" in c)
-                            if not link_tag:
-                                link_tag = card.find("a", href=lambda h: h and "/jobs/view/" in h)
-                            if not link_tag:
-                                continue
-                            raw_url = link_tag.get("href", "")
-                            job_url = raw_url.split("?")[0]  # strip tracking params
+                            job_url = (card["href"] or "").split("?")[0]  # strip tracking params
                             if not job_url or job_url in li_seen_urls:
                                 continue
                             li_seen_urls.add(job_url)
 
-                            # ── Location ───────────────────────────────────
-                            loc_tag = card.find("span", class_=lambda c: c and "job-search-card__location" in c)
-                            location = loc_tag.get_text(strip=True) if loc_tag else "United States"
-
-                            # ── Date ───────────────────────────────────────
-                            time_tag = card.find("time")
-                            if time_tag:
-                                date_str = time_tag.get("datetime") or time_tag.get_text(strip=True)
-                            else:
-                                date_str = "today"
+                            # ── Location / Date ────────────────────────────
+                            location = card["location"] if card["location"] is not None else "United States"
+                            date_str = card["date"] if card["date"] is not None else "today"
 
                             # ── Filters ────────────────────────────────────
                             if not self._is_role_match(title):
@@ -1735,8 +2038,6 @@ class JobDiscovery:
                                 total_added += 1
                                 query_added += 1
                                 page_new += 1
-                                if db:
-                                    db.insert_raw_job(job_data)
 
                         except Exception:
                             continue
@@ -1745,8 +2046,7 @@ class JobDiscovery:
 
                     if page_new == 0 and start > 0:
                         break  # no new jobs on this page -- done paginating this query
-
-                    await asyncio.sleep(0.8)  # polite pause between pages
+                    # Pacing between pages comes from the LinkedIn bucket in rate_limiter.HOST_LIMITS
 
                 except Exception as e:
                     print(f"  [LinkedIn API] Error on '{query}' start={start}: {e}")
@@ -1760,7 +2060,7 @@ class JobDiscovery:
     # ─────────────────────────────────────────────────────────────────────
     # LINKEDIN PHASE B -- Headed Playwright (supplement, logged-in session)
     # ─────────────────────────────────────────────────────────────────────
-    async def fetch_linkedin_playwright(self, db=None):
+    async def fetch_linkedin_playwright(self):
         """
         LinkedIn headed Playwright scraper -- supplements the API scraper.
 
@@ -1995,8 +2295,6 @@ class JobDiscovery:
                                     total_added += 1
                                     query_added += 1
                                     page_new += 1
-                                    if db:
-                                        db.insert_raw_job(job_data)
                                     print(f"  [DEBUG] Found: {company} - {title[:20]} - {job_url}")
 
                             except Exception:
@@ -2032,7 +2330,7 @@ class JobDiscovery:
     # ─────────────────────────────────────────────────────────────────────
     # PLAYWRIGHT: JOBRIGHT AI
     # ─────────────────────────────────────────────────────────────────────
-    async def fetch_jobright_playwright(self, db=None):
+    async def fetch_jobright_playwright(self):
         """
         Jobright scraper with entry-level filter and proper card extraction.
 
@@ -2130,7 +2428,7 @@ class JobDiscovery:
                         else:
                             break   # No load more button
 
-                    n = await self._process_jobright_page(page, db=db)
+                    n = await self._process_jobright_page(page)
                     added += n
                     print(f"    → +{n} jobs extracted")
                     await page.wait_for_timeout(random.randint(1500, 3000))
@@ -2141,7 +2439,7 @@ class JobDiscovery:
         except Exception as e:
             print(f"  [Jobright] Failed: {e}")
 
-    async def _process_jobright_page(self, page, db=None):
+    async def _process_jobright_page(self, page):
         """
         Extract jobs from Jobright using page.evaluate() JS -- bypasses Playwright
         locator chain issues. Reads DOM directly like a browser script.
@@ -2220,8 +2518,6 @@ class JobDiscovery:
                 }
                 if self._add_job(job_data):
                     added += 1
-                    if db:
-                        db.insert_raw_job(job_data)
 
             except Exception:
                 continue
@@ -2231,7 +2527,7 @@ class JobDiscovery:
     # ─────────────────────────────────────────────────────────────────────
     # PLAYWRIGHT: SIMPLIFY.JOBS
     # ─────────────────────────────────────────────────────────────────────
-    async def fetch_simplify_playwright(self, db=None):
+    async def fetch_simplify_playwright(self):
         """
         Simplify.jobs Playwright browser scraper -- Phase C supplement.
 
@@ -2444,8 +2740,6 @@ class JobDiscovery:
                             if self._add_job(job_data):
                                 total_added += 1
                                 query_added += 1
-                                if db:
-                                    db.insert_raw_job(job_data)
                         except Exception as e:
                             print(f"  [Simplify API parsing] Error: {e}")
                             continue
@@ -2458,24 +2752,209 @@ class JobDiscovery:
         except Exception as e:
             print(f'  [Simplify Playwright] Failed: {e}')
 
+    # ─────────────────────────────────────────────────────────────────────
+    # DETAIL STAGE  (two-phase list -> detail)
+    # ─────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _greenhouse_detail(job, data):
+        # Greenhouse entity-escapes `content`
+        job['description_html'] = html.unescape(data.get('content', '') or '')
+        depts = data.get('departments') or []
+        if depts and not job.get('department'):
+            job['department'] = depts[0].get('name', '') or ''
+        if not job.get('salary'):
+            for meta in (data.get('metadata') or []):
+                nm = str(meta.get('name', '')).lower()
+                if any(w in nm for w in ['salary', 'compensation', 'pay']):
+                    job['salary'] = str(meta.get('value', '') or '')
+                    break
+
+    @staticmethod
+    def _workday_detail(job, data):
+        info = data.get('jobPostingInfo') or {}
+        job['description_html'] = info.get('jobDescription', '') or ''
+
+    @staticmethod
+    def _smartrecruiters_detail(job, data):
+        sections = (data.get('jobAd') or {}).get('sections') or {}
+        job['description_html'] = ''.join(
+            (sections.get(key) or {}).get('text', '') or ''
+            for key in ('jobDescription', 'qualifications', 'additionalInformation')
+        )
+
+    @staticmethod
+    def _bamboohr_detail(job, data):
+        opening = (data.get('result') or {}).get('jobOpening') or {}
+        job['description_html'] = opening.get('description', '') or ''
+        if opening.get('compensation') and not job.get('salary'):
+            job['salary'] = str(opening['compensation'])
+
+    _DETAIL_PARSERS = {
+        'Greenhouse':      _greenhouse_detail,
+        'Workday':         _workday_detail,
+        'SmartRecruiters': _smartrecruiters_detail,
+        'BambooHR':        _bamboohr_detail,
+    }
+
+    async def _fetch_details(self, session):
+        """
+        Second phase of the list -> detail mode: one detail request per job that
+        survived the listing filters and dedup (jobs carrying `detail_url`).
+
+        At most DETAIL_CONCURRENCY requests are in flight; each still goes
+        through _fetch_with_retry, so per-host pacing and the conditional-GET
+        cache apply.  Parsers fill `description_html` (rendered afterwards by
+        _render_descriptions) plus any department / salary the listing lacked.
+        A failed detail keeps whatever the listing provided, and its posting
+        is left out of the board's watermark so the next --delta run retries it.
+        """
+        pending = [(j, j.pop('detail_url')) for j in self.found_jobs if j.get('detail_url')]
+        for job in self.found_jobs:
+            job.pop('detail_url', None)
+        if not pending:
+            return
+
+        gate = asyncio.Semaphore(DETAIL_CONCURRENCY)
+        failed = 0
+        t0 = time.perf_counter()
+
+        async def _one(job, url):
+            nonlocal failed
+            async with gate:
+                try:
+                    resp = await self._fetch_with_retry(session, url, headers={'Accept': 'application/json'})
+                    if not resp or resp.status != 200:
+                        failed += 1
+                        self._marks.forget(job.get('url', ''))
+                        return
+                    data = await resp.json(content_type=None)
+                    self._DETAIL_PARSERS[job['source']](job, data)
+                except Exception:
+                    failed += 1
+                    self._marks.forget(job.get('url', ''))
+                finally:
+                    if not job.get('description_html'):    # else _render_descriptions publishes it
+                        self._publish(job)
+
+        await asyncio.gather(*(_one(job, url) for job, url in pending))
+        print(f"  Fetched {len(pending) - failed}/{len(pending)} job details "
+              f"({time.perf_counter() - t0:.1f}s, {failed} failed)")
+
+    # ─────────────────────────────────────────────────────────────────────
+    # HTML -> TEXT STAGE  (batched, on a worker pool)
+    # ─────────────────────────────────────────────────────────────────────
+    async def _render_descriptions(self):
+        """
+        Convert every pending `description_html` in self.found_jobs to plain text.
+
+        Runs after the fetchers so HTML parsing never blocks the event loop,
+        and only for jobs that survived title/location/date filters and dedup.
+        Batches of HTML_BATCH_SIZE docs go to a ProcessPoolExecutor (or a
+        thread pool), and results are merged back into the job dicts along
+        with the sponsorship signal extracted from the full text.
+        """
+        pending = [j for j in self.found_jobs if j.get('description_html')]
+        for job in self.found_jobs:
+            if not job.get('description_html'):
+                job.pop('description_html', None)
+        if not pending:
+            return
+
+        batches = [pending[i:i + HTML_BATCH_SIZE] for i in range(0, len(pending), HTML_BATCH_SIZE)]
+        loop = asyncio.get_running_loop()
+        t0 = time.perf_counter()
+        try:
+            pool = (ProcessPoolExecutor if HTML_POOL_KIND == 'process' else ThreadPoolExecutor)(HTML_POOL_WORKERS)
+        except (OSError, NotImplementedError):
+            pool = ThreadPoolExecutor(HTML_POOL_WORKERS)
+        with pool:
+            try:
+                texts = await asyncio.gather(*(
+                    loop.run_in_executor(pool, html_batch_to_text, [j['description_html'] for j in b])
+                    for b in batches
+                ))
+            except Exception as e:
+                print(f"  [HTML] Worker pool failed ({e}) -- rendering inline")
+                texts = [html_batch_to_text([j['description_html'] for j in b]) for b in batches]
+
+        for batch, batch_texts in zip(batches, texts):
+            for job, text in zip(batch, batch_texts):
+                job.pop('description_html', None)
+                job['description'] = text[:2000]
+                if not job.get('sponsorship'):
+                    job['sponsorship'] = self._extract_sponsorship(text)
+                self._publish(job)
+
+        print(f"  Rendered {len(pending)} HTML descriptions in {len(batches)} batches "
+              f"({time.perf_counter() - t0:.2f}s, {HTML_POOL_KIND} pool x{HTML_POOL_WORKERS}, parser={HTML_PARSER})")
+
     # ─────────────────────────────────────────────────────────────────────
     # MAIN ORCHESTRATOR
     # ─────────────────────────────────────────────────────────────────────
     async def run_discovery(self, lookback_hours=168, db=None):
         """
-        db= optional DatabaseManager instance. When passed, browser scrapers
-        (LinkedIn, Jobright) flush jobs to DB immediately so closing the browser
-        mid-run doesn't lose scraped data.
+        db= optional DatabaseManager instance. When passed, every scraper streams
+        its accepted jobs to a JobWriter (db_writer.py) on db's database: a
+        background thread commits them in batches while discovery is still
+        running, so an interrupted run keeps what it found and the caller has
+        nothing left to sync.  Counts are on self.writer afterwards.
+
+        The HTTP cache is opened here and closed (with its summary) however
+        the run ends, Ctrl+C included.  Board watermarks are saved only when
+        the run completes, after the writer: jobs in failed batches are
+        forgotten first, so --delta retries them.
         """
+        if self.http_cache_path and self._cache is None:
+            self._cache = ResponseCache(self.http_cache_path)
+        try:
+            if db is None:
+                found = await self._discover(lookback_hours)
+            else:
+                self.writer = JobWriter(db.db_path)
+                await self.writer.start()
+                try:
+                    found = await self._discover(lookback_hours)
+                finally:
+                    await self.writer.close()
+                    w = self.writer
+                    print(f"  DB writer: {w.inserted} new / {w.updated} refreshed / {w.duplicates} unchanged rows "
+                          f"in {w.batches} batches"
+                          + (f", {w.failed} FAILED" if w.failed else ""))
+                for url in self.writer.failed_urls:
+                    self._marks.forget(url)
+            self._save_marks()
+            return found
+        finally:
+            self._close_cache()
+
+    def _save_marks(self):
+        self._marks.save()
+        if self._marks.skipped:
+            print(f"  Delta: skipped {sum(self._marks.skipped.values())} already-seen postings (" +
+                  ", ".join(f"{ats} {n}" for ats, n in self._marks.skipped.items()) + ")")
+
+    def _close_cache(self):
+        if self._cache is None:
+            return
+        print(f"  HTTP Cache (304 hits / misses / MB saved):")
+        for src, hits, misses, saved in self._cache.summary():
+            print(f"    {src:.<30} {hits} / {misses} / {saved / 1_048_576:.1f}")
+        self._cache.close()
+        self._cache = None
+
+    async def _discover(self, lookback_hours):
         print(f"\n{'='*65}")
         print(f"  JOB HUNTER ULTRA -- Discovery Run | Lookback: {lookback_hours}h")
         print(f"  Roles: {self.roles}")
+        if self._marks.delta:
+            print(f"  Delta mode: skipping postings already seen on earlier runs")
         print(f"{'='*65}\n")
         
         self.yesterday = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
         
         timeout = aiohttp.ClientTimeout(total=30, connect=10)
-        conn = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300)
+        # Per-host limits live in self._limiter -- the connector only caps total sockets
+        conn = aiohttp.TCPConnector(limit=100, limit_per_host=0, ttl_dns_cache=300)
         
         headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
@@ -2489,18 +2968,23 @@ class JobDiscovery:
             print("── Phase 1: API Scrapers (parallel) ──")
             tasks = []
             
-            for board in GREENHOUSE_BOARDS:
-                tasks.append(self.fetch_greenhouse(session, board))
-            for board in LEVER_BOARDS:
-                tasks.append(self.fetch_lever(session, board))
-            for slug in ASHBY_BOARDS:
-                tasks.append(self.fetch_ashby(session, slug))
-            for slug in WORKABLE_BOARDS:
-                tasks.append(self.fetch_workable(session, slug))
-            for company_id in SMARTRECRUITERS_BOARDS:
-                tasks.append(self.fetch_smartrecruiters(session, company_id))
-            for domain in BAMBOOHR_BOARDS:
-                tasks.append(self.fetch_bamboohr(session, domain))
+            # Board lists are de-duplicated, and slugs inside their board-health
+            # backoff window (404 / 410 on recent runs) are skipped entirely.
+            board_fetchers = [
+                ("Greenhouse",      GREENHOUSE_BOARDS,      self.fetch_greenhouse),
+                ("Lever",           LEVER_BOARDS,           self.fetch_lever),
+                ("Ashby",           ASHBY_BOARDS,           self.fetch_ashby),
+                ("Workable",        WORKABLE_BOARDS,        self.fetch_workable),
+                ("SmartRecruiters", SMARTRECRUITERS_BOARDS, self.fetch_smartrecruiters),
+                ("BambooHR",        BAMBOOHR_BOARDS,        self.fetch_bamboohr),
+            ]
+            for ats, slugs, fetch in board_fetchers:
+                for slug in dict.fromkeys(slugs):
+                    if self._health.should_probe(ats, slug):
+                        tasks.append(fetch(session, slug))
+            if self._health.skipped:
+                skipped = ", ".join(f"{ats} {n}" for ats, n in self._health.skipped.items())
+                print(f"  Skipping {sum(self._health.skipped.values())} dead/backed-off boards ({skipped})")
             
             tasks.append(self.fetch_simplify_github(session))
             tasks.append(self.fetch_remoteok(session))
@@ -2531,36 +3015,44 @@ class JobDiscovery:
                 tasks.append(self.fetch_github_markdown(session, url, label))
             
             # LinkedIn guest API (no login, runs in parallel with other API scrapers)
-            tasks.append(self.fetch_linkedin_api(session, db=db))
+            tasks.append(self.fetch_linkedin_api(session))
             # Simplify REST API (no login, POST JSON, runs in parallel)
-            tasks.append(self.fetch_simplify_api(session, db=db))
+            tasks.append(self.fetch_simplify_api(session))
             
             print(f"  Launching {len(tasks)} parallel API tasks...")
             await asyncio.gather(*tasks, return_exceptions=True)
         
-        print(f"\n── Phase 2: Workday API (sequential) ──")
-        for company in WORKDAY_COMPANIES[:15]:
-            try:
-                async with aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=15), headers=headers
-                ) as session:
-                    await self.fetch_workday(session, company)
-            except Exception:
-                pass
+        print(f"\n── Phase 2: Workday API (concurrent, shared pool) + details + HTML rendering ──")
+        # One connection pool for every tenant; per-tenant pacing is in self._limiter.
+        # Phase 1 details are fetched and rendered on the worker pool while Workday
+        # is on the wire; Workday's own details follow once its listings are in.
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=15), headers=headers,
+            connector=aiohttp.TCPConnector(limit=60, limit_per_host=0, ttl_dns_cache=300),
+        ) as session:
+            async def _phase1_tail():
+                await self._fetch_details(session)
+                await self._render_descriptions()
+
+            async def _workday():
+                await self.run_workday(session)
+                await self._fetch_details(session)
+
+            await asyncio.gather(_workday(), _phase1_tail())
+            await self._render_descriptions()
         
         print(f"\n── Phase 3: Browser Scrapers (Playwright) ──")
-        # Pass db= so these scrapers flush to disk immediately -- no data loss on Ctrl+C
         # [Temporarily disabled due to headless bot protection]
         # try:
-        #     await self.fetch_jobright_playwright(db=db)
+        #     await self.fetch_jobright_playwright()
         # except Exception as e:
         #     print(f"  Jobright failed: {e}")
         try:
-            await self.fetch_simplify_playwright(db=db)  # pass db so jobs sync immediately
+            await self.fetch_simplify_playwright()
         except Exception as e:
             print(f"  Simplify failed: {e}")
         try:
-            await self.fetch_linkedin_playwright(db=db)
+            await self.fetch_linkedin_playwright()
         except Exception as e:
             print(f"  LinkedIn failed: {e}")
         
@@ -2569,11 +3061,29 @@ class JobDiscovery:
         print(f"\n  Source Breakdown:")
         for src, count in sorted(self._stats.items(), key=lambda x: -x[1]):
             if count: print(f"    {src:.<30} {count}")
+        print(f"\n  HTTP Load (requests / 429s / MB received):")
+        for host, sent, throttled, received in self._limiter.summary()[:10]:
+            print(f"    {host:.<30} {sent} / {throttled} / {received / 1_048_576:.1f}")
+        if self._known.skipped:
+            print(f"\n  Already in DB: {self._known.skipped} postings skipped "
+                  f"(index of {len(self._known)} fingerprints)")
+        self._health.save()
+        dead = self._health.dead()
+        if dead:
+            print(f"\n  Dead boards: {len(dead)} (run `python board_health.py` for the list)")
         print(f"{'='*65}\n")
         
         return self.found_jobs
 
 
+# Profile-independent filters, compiled once per process (see token_matcher.py)
+_LOCATION_MATCHER = TokenMatcher({
+    "remote": ["remote"],
+    "non_us": JobDiscovery._NON_US_REMOTE,
+    "us":     JobDiscovery._US_INDICATORS,
+}, cache_size=16384)
+
+
 if __name__ == "__main__":
     if not os.path.exists("user_profile.json"):
         # Create a default profile
@@ -0,0 +1,400 @@
+"""
+Dashboard read queries — the Jobs Board filter bar as parameterized SQL
+────────────────────────────────────────────────────────────────────────
+The dashboard used to pull every jobs ⋈ applications row (descriptions and
+PDF paths included) into pandas and filter / sort it on every rerun.  Here
+the filter bar becomes one WHERE clause and the grid reads one page:
+
+    f = {"statuses": ["NEW"], "sources": [], "modes": ["Remote"], "h1b": [],
+         "ats": (0.0, 10.0), "since": "2026-01-01 00:00:00",
+         "entry_level": True, "search": "data eng"}
+    page, cursor = fetch_page(conn, f, "Newest First")
+    page, cursor = fetch_page(conn, f, "Newest First", after=cursor)
+
+Pages use keyset pagination -- WHERE (sort key, rowid) is past the last row
+of the previous page -- so page 50 costs what page 1 does.  Relevance
+order (full-text rank) is the exception: it pages by OFFSET, over a result
+set that the search already narrowed.  Heavy columns (description, PDF
+paths, applied date) are only read by job_detail() when a job is opened.
+
+A page already on screen is kept current through the change feed
+(migration 7): data_version() says whether anything changed, and
+changes_since() + patch_page() apply in-place edits without a re-read.
+"""
+
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from local_db_manager import ATS_BUCKET, fts_query
+
+
+PAGE_SIZE = 200
+
+# Title fragments hidden by "Entry Level Only" (plain substring, case-insensitive)
+SENIOR_TOKENS = ["senior", " sr ", "sr.", "staff", "principal", "director",
+                 " vp ", "v.p.", "head of", "manager", "lead engineer", "tech lead",
+                 "distinguished", "fellow", "architect"]
+
+STATUS_PRIORITY = ["INTERVIEW", "OFFER", "APPLIED", "MANUAL_NEEDED", "NEW", "REJECTED", "SKIPPED"]
+
+STATUS_SQL    = "COALESCE(a.status, 'NEW')"
+WORK_MODE_SQL = """CASE WHEN instr(lower(COALESCE(j.location, '')), 'remote') THEN 'Remote'
+                        WHEN instr(lower(COALESCE(j.location, '')), 'hybrid') THEN 'Hybrid'
+                        ELSE 'On-site' END"""
+
+# sort name -> (key expression, descending); ties broken by j.rowid in the same direction
+SORTS = {
+    "Newest First":            ("j.scraped_date", True),
+    "Relevance (Search)":      ("rank", False),
+    "ATS Score (High to Low)": ("COALESCE(a.ats_score, -1)", True),
+    "Company A-Z":             ("COALESCE(j.company, '')", False),
+    "Status Priority":         ("CASE " + STATUS_SQL + " " +
+                                " ".join(f"WHEN '{s}' THEN {i}" for i, s in enumerate(STATUS_PRIORITY)) +
+                                " ELSE 9 END", False),
+    "Source":                  ("COALESCE(j.source, '')", False),
+}
+
+# Grid columns -- everything the Jobs Board shows, nothing it doesn't
+_LIST_COLUMNS = f"""
+    j.id, j.company, j.title, j.location, j.source, j.url, j.date_posted, j.scraped_date,
+    COALESCE(j.salary, '')      AS salary,
+    COALESCE(j.sponsorship, '') AS sponsorship,
+    COALESCE(j.department, '')  AS department,
+    {STATUS_SQL}                AS status,
+    a.ats_score, a.notes,
+    {WORK_MODE_SQL}             AS work_mode
+"""
+
+_FROM = "FROM jobs j LEFT JOIN applications a ON j.id = a.job_id"
+
+
+def _has_fts(conn: sqlite3.Connection) -> bool:
+    return bool(conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'").fetchone())
+
+
+def _match(conn: sqlite3.Connection, f: dict) -> str:
+    """
+    The FTS5 MATCH expression for f["search"]; '' when jobs_fts can't answer
+    it -- SQLite without FTS5, or text with no word characters (".net" works,
+    "++" does not) -- and _where falls back to a substring scan.
+    """
+    return fts_query(f.get("search", "")) if f.get("search") and _has_fts(conn) else ""
+
+
+def _where(conn: sqlite3.Connection, f: dict) -> tuple[list[str], list]:
+    """Filter dict -> (AND-ed SQL terms, params).  Empty / missing keys don't filter."""
+    terms, params = [], []
+
+    def _any_in(expr: str, needles: list[str]) -> str:
+        # LIKE is ASCII case-insensitive already: no lower(expr) per needle (needles hold no % / _)
+        params.extend(f"%{n}%" for n in needles)
+        return "(" + " OR ".join(f"{expr} LIKE ?" for _ in needles) + ")"
+
+    if f.get("since"):
+        terms.append("j.scraped_date >= ?")
+        params.append(f["since"])
+    if f.get("statuses"):
+        terms.append(f"{STATUS_SQL} IN ({','.join('?' * len(f['statuses']))})")
+        params.extend(f["statuses"])
+    if f.get("sources"):
+        terms.append(f"j.source IN ({','.join('?' * len(f['sources']))})")
+        params.extend(f["sources"])
+    if f.get("modes"):
+        terms.append(f"{WORK_MODE_SQL} IN ({','.join('?' * len(f['modes']))})")
+        params.extend(f["modes"])
+    if f.get("h1b"):
+        spons, alts = "lower(COALESCE(j.sponsorship, ''))", []
+        if "Likely" in f["h1b"]:
+            alts.append(_any_in("COALESCE(j.sponsorship, '')", ["likely", "yes", "sponsor"]))
+        if "No" in f["h1b"]:
+            alts.append(f"({spons} = 'no' OR instr({spons}, 'does not'))")
+        if "Unknown" in f["h1b"]:
+            alts.append(f"{spons} = ''")
+        if alts:
+            terms.append("(" + " OR ".join(alts) + ")")
+    lo, hi = f.get("ats") or (0.0, 10.0)
+    if (lo, hi) != (0.0, 10.0):
+        terms.append("(a.ats_score IS NULL OR a.ats_score BETWEEN ? AND ?)")
+        params.extend([lo, hi])
+    if f.get("entry_level"):
+        terms.append("NOT " + _any_in("COALESCE(j.title, '')", SENIOR_TOKENS))
+    if f.get("search"):
+        match = _match(conn, f)
+        if match:
+            terms.append("j.rowid IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+            params.append(match)
+        else:
+            q = f["search"].lower()
+            terms.append("(" + " OR ".join(f"instr(lower(COALESCE(j.{c}, '')), ?)"
+                                           for c in ("company", "title", "location", "description")) + ")")
+            params.extend([q] * 4)
+    return terms, params
+
+
+def count_jobs(conn: sqlite3.Connection, f: dict) -> tuple[int, int, int]:
+    """(jobs, companies, sources) matching the filters."""
+    terms, params = _where(conn, f)
+    where = ("WHERE " + " AND ".join(terms)) if terms else ""
+    return tuple(conn.execute(
+        f"SELECT COUNT(*), COUNT(DISTINCT j.company), COUNT(DISTINCT j.source) {_FROM} {where}", params
+    ).fetchone())
+
+
+def _by_relevance(conn: sqlite3.Connection, f: dict, sort: str) -> bool:
+    return SORTS.get(sort, ("",))[0] == "rank" and bool(_match(conn, f))
+
+
+def page_sql(conn: sqlite3.Connection, f: dict, sort: str, after=None,
+             limit: int = PAGE_SIZE) -> tuple[str, list]:
+    """SQL + params for one grid page (exposed for check_query_plans.py)."""
+    if _by_relevance(conn, f, sort):
+        # rank is only defined inside a MATCH query: drive the page from jobs_fts
+        terms, params = _where(conn, {**f, "search": ""})
+        sql = (f"SELECT {_LIST_COLUMNS}, j.rowid AS _rowid, jobs_fts.rank AS _key "
+               f"FROM jobs_fts JOIN jobs j ON j.rowid = jobs_fts.rowid "
+               f"LEFT JOIN applications a ON j.id = a.job_id "
+               f"WHERE jobs_fts MATCH ? " + "".join(f"AND {t} " for t in terms) +
+               "ORDER BY jobs_fts.rank, j.rowid LIMIT ? OFFSET ?")
+        return sql, [_match(conn, f)] + params + [limit, int(after or 0)]
+
+    terms, params = _where(conn, f)
+    key, desc = SORTS.get(sort, SORTS["Newest First"])
+    if key == "rank":
+        key, desc = SORTS["Newest First"]
+    if after is not None:
+        terms.append(f"({key}, j.rowid) {'<' if desc else '>'} (?, ?)")
+        params.extend(after)
+    order = "DESC" if desc else "ASC"
+    where = ("WHERE " + " AND ".join(terms)) if terms else ""
+    sql = (f"SELECT {_LIST_COLUMNS}, j.rowid AS _rowid, {key} AS _key {_FROM} {where} "
+           f"ORDER BY {key} {order}, j.rowid {order} LIMIT ?")
+    return sql, params + [limit]
+
+
+def fetch_page(conn: sqlite3.Connection, f: dict, sort: str, after=None,
+               limit: int = PAGE_SIZE) -> tuple[pd.DataFrame, object]:
+    """
+    One page of the filtered, sorted grid and the cursor for the next page
+    (None on the last page).  `after` is the cursor returned for the
+    previous page -- None for the first.  Rows carry _rowid and their sort
+    key _key (what patch_page needs).
+    """
+    sql, params = page_sql(conn, f, sort, after, limit)
+    df = pd.read_sql_query(sql, conn, params=params)
+    if len(df) < limit:
+        cursor = None
+    elif _by_relevance(conn, f, sort):
+        cursor = int(after or 0) + limit
+    else:
+        key = df["_key"].iloc[-1]
+        # numpy scalars would bind as BLOBs -- back to plain Python before they reach SQLite
+        cursor = (key.item() if hasattr(key, "item") else key, int(df["_rowid"].iloc[-1]))
+    return df, cursor
+
+
+def data_version(conn: sqlite3.Connection) -> int:
+    """The DB's change version (migration 7): moves on with every insert / update / delete readers see."""
+    return conn.execute("SELECT version FROM change_version").fetchone()[0]
+
+
+def changes_since(conn: sqlite3.Connection, since: int, f: dict, sort: str) -> tuple[pd.DataFrame, set[str]]:
+    """
+    The change feed past version `since`: (the changed jobs that still
+    match the filters, as page rows with their sort key; the id of every
+    job inserted, updated or deleted since).
+    """
+    touched = """
+        SELECT id FROM jobs WHERE row_version > :v
+        UNION SELECT job_id FROM applications WHERE row_version > :v
+        UNION SELECT job_id FROM job_tombstones WHERE version > :v
+    """
+    ids = {r[0] for r in conn.execute(touched, {"v": since})}
+    if not ids:
+        return pd.DataFrame(), ids
+    terms, params = _where(conn, f)
+    key, _ = SORTS.get(sort, SORTS["Newest First"])
+    key = "NULL" if key == "rank" else key
+    where = "".join(f" AND {t}" for t in terms)
+    rows = pd.read_sql_query(
+        f"SELECT {_LIST_COLUMNS}, j.rowid AS _rowid, {key} AS _key {_FROM} "
+        f"WHERE j.id IN ({','.join('?' * len(ids))}){where}", conn, params=list(ids) + params)
+    return rows, ids
+
+
+def patch_page(page: pd.DataFrame, changed: pd.DataFrame, touched: set[str]) -> pd.DataFrame | None:
+    """
+    Apply changes_since() to a page already on screen instead of re-reading
+    it.  Only possible when every touched job is on the page, still matches
+    the filters and kept its sort key (a status or notes edit); otherwise
+    None -- the page has to be fetched again.
+    """
+    if not touched or not touched <= set(page["id"]) or len(changed) != len(touched):
+        return None
+    if changed["_key"].isna().any():                   # relevance order: rank is per query
+        return None
+    out = page.set_index("id")
+    new = changed.set_index("id")[out.columns]
+    if list(out.loc[new.index, "_key"]) != list(new["_key"]):
+        return None
+    out = pd.concat([out.drop(index=new.index), new]).loc[out.index]
+    return out.reset_index()[page.columns]
+
+
+def snippets(conn: sqlite3.Connection, search: str, rowids: list[int]) -> dict[int, str]:
+    """
+    rowid -> highlighted match snippet, for the rows of one page only.
+
+    `+rowid` keeps the planner from seeking jobs_fts once per page rowid: a
+    prefix query ("kub"*) re-expands its terms on every seek, while one pass
+    over the match with the IN list as a filter costs about as much as a count.
+    """
+    match = _match(conn, {"search": search})
+    if not match or not rowids:
+        return {}
+    rows = conn.execute(f"""
+        SELECT rowid, snippet(jobs_fts, -1, '**', '**', ' … ', 12) FROM jobs_fts
+        WHERE jobs_fts MATCH ? AND +rowid IN ({','.join('?' * len(rowids))})
+    """, [match] + list(rowids)).fetchall()
+    return {r[0]: r[1] for r in rows}
+
+
+# timeago's units (its SEC_ARRAY: second, minute, hour, day, week, month, 365-day year) and English labels
+_AGE_STEPS = [60.0, 60.0, 24.0, 7.0, 365.0 / 7.0 / 12.0, 12.0]
+_AGE_UNITS = np.array(["seconds", "minutes", "hours", "days", "weeks", "months", "years"], dtype=object)
+_AGE_ONE   = np.array(["", "1 minute", "1 hour", "1 day", "1 week", "1 month", "1 year"], dtype=object)
+
+
+def posted_labels(when: pd.Series, now) -> pd.Series:
+    """
+    timeago.format(t, now) for a whole datetime column at once ('' for NaT):
+    the age is bucketed by the same unit steps and truncation, as array
+    operations instead of one Python call per row.
+    """
+    secs   = np.trunc((now - when).dt.total_seconds().to_numpy(dtype=float, na_value=np.nan))
+    future = secs < 0
+    value  = np.abs(secs)
+    unit   = np.zeros(len(value), dtype=int)
+    going  = ~np.isnan(value)
+    for step in _AGE_STEPS:
+        going &= value >= step
+        value  = np.where(going, value / step, value)
+        unit  += going
+    n      = np.nan_to_num(np.trunc(value)).astype(np.int64)
+    plural = n > np.where(unit == 0, 9, 1)
+
+    body  = np.where(plural, n.astype(str).astype(object) + " " + _AGE_UNITS[unit], _AGE_ONE[unit])
+    label = np.where(future, "in " + body, body + " ago")
+    label = np.where((unit == 0) & ~plural, np.where(future, "a while", "just now"), label)
+    return pd.Series(np.where(np.isnan(secs), "", label), index=when.index, dtype=object)
+
+
+def job_detail(conn: sqlite3.Connection, job_id: str) -> dict:
+    """The heavy columns of one job, read when its detail panel opens."""
+    row = conn.execute(f"""
+        SELECT j.id, j.company, j.title, j.location, j.url, j.description, j.hiring_manager,
+               j.salary, j.department, j.sponsorship, j.date_posted, j.scraped_date,
+               {STATUS_SQL} AS status, a.ats_score, a.notes, a.applied_date,
+               a.resume_pdf_path, a.cover_letter_pdf_path
+        {_FROM} WHERE j.id = ?
+    """, (job_id,)).fetchone()
+    if row is None:
+        return {}
+    cols = ["id", "company", "title", "location", "url", "description", "hiring_manager",
+            "salary", "department", "sponsorship", "date_posted", "scraped_date",
+            "status", "ats_score", "notes", "applied_date", "resume_pdf_path", "cover_letter_pdf_path"]
+    return dict(zip(cols, row))
+
+
+def kpis(conn: sqlite3.Connection) -> dict:
+    row = conn.execute(f"""
+        SELECT COUNT(*),
+               SUM({STATUS_SQL} = 'NEW'), SUM(a.status = 'APPLIED'),
+               SUM(a.status = 'INTERVIEW'), SUM(a.status = 'OFFER'),
+               AVG(a.ats_score), SUM(COALESCE(a.resume_pdf_path, '') != '')
+        {_FROM}
+    """).fetchone()
+    keys = ["total", "new", "applied", "interviews", "offers", "avg_ats", "tailored"]
+    return {k: (v if v is not None or k == "avg_ats" else 0) for k, v in zip(keys, row)}
+
+
+def tailoring_queue(conn: sqlite3.Connection, limit: int = 1000) -> tuple[pd.DataFrame, int]:
+    """NEW jobs without a tailored resume, newest first: (first `limit` rows, total)."""
+    cond = f"{STATUS_SQL} = 'NEW' AND COALESCE(a.resume_pdf_path, '') = ''"
+    total = conn.execute(f"SELECT COUNT(*) {_FROM} WHERE {cond}").fetchone()[0]
+    df = pd.read_sql_query(f"""
+        SELECT j.company, j.title, j.source, j.scraped_date, COALESCE(j.salary, '') AS salary, j.url
+        {_FROM} WHERE {cond} ORDER BY j.scraped_date DESC LIMIT ?
+    """, conn, params=[limit])
+    return df, total
+
+
+def applied_jobs(conn: sqlite3.Connection) -> pd.DataFrame:
+    return pd.read_sql_query(f"""
+        SELECT j.company, j.title, a.status, a.applied_date, a.ats_score,
+               a.resume_pdf_path, a.cover_letter_pdf_path, a.notes, j.url
+        {_FROM} WHERE a.status IN ('APPLIED', 'INTERVIEW', 'OFFER')
+        ORDER BY a.applied_date DESC
+    """, conn)
+
+
+def documents(conn: sqlite3.Connection) -> pd.DataFrame:
+    """Jobs with a tailored resume -- the document viewer's picker."""
+    return pd.read_sql_query(f"""
+        SELECT j.id, j.company, j.title, a.resume_pdf_path, a.cover_letter_pdf_path
+        {_FROM} WHERE COALESCE(a.resume_pdf_path, '') != ''
+        ORDER BY j.scraped_date DESC
+    """, conn)
+
+
+def thumbnail_path(pdf_path: str) -> str:
+    """Where resume_tailor writes a tailored PDF's first-page PNG: next to it, same name."""
+    return os.path.splitext(pdf_path)[0] + ".png"
+
+
+def distinct_values(conn: sqlite3.Connection, column: str) -> list[str]:
+    """Filter-bar options: `status` or `source`."""
+    expr = {"status": STATUS_SQL, "source": "j.source"}[column]
+    return [r[0] for r in conn.execute(f"SELECT DISTINCT {expr} {_FROM} WHERE {expr} IS NOT NULL ORDER BY 1")]
+
+
+def analytics_counts(conn: sqlite3.Connection, f: dict | None, *columns: str) -> pd.DataFrame:
+    """
+    Job counts by day / source / status / h1b from job_counts (migration 8),
+    never from jobs -- a few hundred cells whatever the history size.  Only
+    the filters the table can answer apply: since (whole days), statuses
+    and sources.
+    """
+    f, terms, params = f or {}, [], []
+    if f.get("since"):
+        terms.append("day >= ?")
+        params.append(f["since"][:10])
+    for key, column in (("statuses", "status"), ("sources", "source")):
+        if f.get(key):
+            terms.append(f"{column} IN ({','.join('?' * len(f[key]))})")
+            params.extend(f[key])
+    where = ("WHERE " + " AND ".join(terms)) if terms else ""
+    cols  = ", ".join(columns)
+    return pd.read_sql_query(
+        f"SELECT {cols}, SUM(n) AS count FROM job_counts {where} GROUP BY {cols} HAVING SUM(n) > 0",
+        conn, params=params)
+
+
+def ats_histogram(conn: sqlite3.Connection) -> pd.DataFrame:
+    """Scored jobs per ATS_BUCKET-wide score bin, by bin centre (ats_buckets, migration 8)."""
+    return pd.read_sql_query(f"""
+        SELECT bucket + {ATS_BUCKET / 2} AS ats_score, n AS count FROM ats_buckets WHERE n > 0 ORDER BY bucket
+    """, conn)
+
+
+def export_csv(conn: sqlite3.Connection, f: dict | None = None) -> str:
+    """Filtered (or, with f=None, every) job as CSV -- built only when the download is clicked."""
+    terms, params = _where(conn, f or {})
+    where = ("WHERE " + " AND ".join(terms)) if terms else ""
+    df = pd.read_sql_query(f"""
+        SELECT {_LIST_COLUMNS}, j.description, a.resume_pdf_path, a.cover_letter_pdf_path, a.applied_date
+        {_FROM} {where} ORDER BY j.scraped_date DESC
+    """, conn, params=params)
+    return df.drop(columns=["id"]).to_csv(index=False)
@@ -0,0 +1,68 @@
+"""
+KeywordPlanner — orders / prunes per-tenant search keywords by unique yield
+────────────────────────────────────────────────────────────────────────────
+fetch_workday runs ~15 keyword searches per tenant and most of them return
+postings an earlier keyword already saw.  After each run we record, per
+(tenant, keyword), how many postings that keyword was FIRST to surface,
+counting keywords in planned order (the searches run concurrently; the
+credit does not depend on which finished first).  A search that failed is
+not recorded.  The next run:
+
+  - searches keywords in descending average unique yield (untried first),
+  - drops keywords that surfaced nothing new for DROP_AFTER runs in a row,
+    i.e. whose results are fully covered by the others,
+  - re-probes a dropped keyword every REPROBE_EVERY runs so it can come back.
+
+State lives in workday_keywords.json.
+"""
+
+import json
+import os
+
+
+PLANNER_PATH  = os.getenv("KEYWORD_PLANNER_PATH", "workday_keywords.json")
+DROP_AFTER    = 3
+REPROBE_EVERY = 5
+
+
+class KeywordPlanner:
+    def __init__(self, path: str = PLANNER_PATH):
+        self.path  = path
+        # tenant -> {"runs": n, "keywords": {kw: {"runs": n, "unique": n, "zero_streak": n}}}
+        self.stats: dict[str, dict] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    self.stats = json.load(f)
+            except (OSError, ValueError):
+                self.stats = {}
+
+    def plan(self, tenant: str, keywords: list[str]) -> list[str]:
+        """Keywords worth searching this run, best expected unique yield first."""
+        t       = self.stats.setdefault(tenant, {"runs": 0, "keywords": {}})
+        reprobe = t["runs"] % REPROBE_EVERY == REPROBE_EVERY - 1
+        t["runs"] += 1
+
+        def _yield(kw):
+            k = t["keywords"].get(kw)
+            return float("inf") if not k or not k["runs"] else k["unique"] / k["runs"]
+
+        keep = [kw for kw in keywords
+                if reprobe or t["keywords"].get(kw, {}).get("zero_streak", 0) < DROP_AFTER]
+        return sorted(keep, key=lambda kw: (-_yield(kw), keywords.index(kw)))
+
+    def record(self, tenant: str, keyword: str, unique: int):
+        """`unique` = postings this keyword surfaced that no earlier keyword had."""
+        t = self.stats.setdefault(tenant, {"runs": 1, "keywords": {}})
+        k = t["keywords"].setdefault(keyword, {"runs": 0, "unique": 0, "zero_streak": 0})
+        k["runs"]       += 1
+        k["unique"]     += unique
+        k["zero_streak"] = 0 if unique else k["zero_streak"] + 1
+
+    def save(self):
+        if not self.path:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.stats, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
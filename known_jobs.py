@@ -0,0 +1,144 @@
+"""
+KnownJobIndex — persistent cross-run index of jobs already in the database
+───────────────────────────────────────────────────────────────────────────
+JobDiscovery's seen_urls / seen_signatures start empty every run, so a job
+stored last week used to be rebuilt in full (date, sponsorship, detail
+fetch, HTML render) only to bounce off `jobs.url UNIQUE` in insert_raw_job.
+
+Every stored job gets two 64-bit fingerprints (blake2b, signed to fit
+SQLite INTEGER) in the `known_jobs` side table of the jobs database,
+written by DatabaseManager in the same transaction as the job row:
+
+    kind 0   canonical URL            kept KNOWN_URL_DAYS
+    kind 1   company::title           kept KNOWN_SIGNATURE_DAYS -- a company
+                                      re-opening the same title later is a
+                                      new job, a repost on another board
+                                      within days is not
+
+At startup the live fingerprints are streamed (already in key order) into
+one sorted array('q'): 8 bytes per fingerprint, ~8 MB for 500k jobs, no
+per-entry Python objects.  Membership is a bisect.
+
+`added` is bumped every time a job is written, and a fingerprint not
+written for KNOWN_REFRESH_DAYS is left out of the index: each stored job is
+let through discovery again about once a week, and the write path then
+compares content_hash() and refreshes the row only if the posting changed
+(salary band, location, description ...).  KNOWN_REFRESH_DAYS=0 disables
+the revisit.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from array import array
+from bisect import bisect_left
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+KNOWN_URL_DAYS       = int(os.getenv("KNOWN_URL_DAYS", "365"))
+KNOWN_SIGNATURE_DAYS = int(os.getenv("KNOWN_SIGNATURE_DAYS", "30"))
+KNOWN_REFRESH_DAYS   = int(os.getenv("KNOWN_REFRESH_DAYS", "7"))
+
+KIND_URL       = 0
+KIND_SIGNATURE = 1
+
+# Query parameters that only carry tracking -- everything else can identify the job
+_TRACKING_PARAMS = ("utm_", "trk", "ref", "src", "source", "gh_src", "lever-source", "tracking")
+
+# Job fields that make up a posting's content (jobs.content_hash); identity (url)
+# and per-run values (date, scraped_date) are deliberately left out
+CONTENT_FIELDS = ("company", "title", "location", "description", "salary",
+                  "department", "sponsorship", "hiring_manager")
+
+
+def today() -> int:
+    """Days since the epoch -- the `added` column."""
+    return int(time.time() // 86400)
+
+
+def canonical_url(url: str) -> str:
+    url = (url or "").strip()
+    if not url:
+        return ""
+    if "?" not in url and "#" not in url and "://" in url:
+        # fast path (most ATS URLs): lower-case scheme + host, drop trailing slashes
+        scheme, _, rest = url.partition("://")
+        host, slash, path = rest.partition("/")
+        return f"{scheme.lower()}://{host.lower()}{slash}{path}".rstrip("/")
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith(_TRACKING_PARAMS)]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"),
+                       urlencode(query), ""))
+
+
+def fingerprint(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big", signed=True)
+
+
+def url_fingerprint(url: str) -> int | None:
+    url = canonical_url(url)
+    return fingerprint(url) if url else None
+
+
+def signature_fingerprint(company: str, title: str) -> int | None:
+    company, title = (company or "").lower().strip(), (title or "").lower()
+    return fingerprint(f"{company}::{title}") if company and title else None
+
+
+def content_hash(job: dict) -> str:
+    """Hash of a job's CONTENT_FIELDS, whitespace-normalized -- equal hash, nothing to update."""
+    text = "\x1f".join(" ".join(str(job.get(f) or "").split()) for f in CONTENT_FIELDS)
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def job_fingerprints(job: dict) -> list[tuple[int, int]]:
+    """[(fingerprint, kind)] for a job dict / jobs row."""
+    out = []
+    fp = url_fingerprint(job.get("url", ""))
+    if fp is not None:
+        out.append((fp, KIND_URL))
+    fp = signature_fingerprint(job.get("company", ""), job.get("title", ""))
+    if fp is not None:
+        out.append((fp, KIND_SIGNATURE))
+    return out
+
+
+class KnownJobIndex:
+    def __init__(self, db_path: str | None):
+        self.fps     = array("q")
+        self.skipped = 0
+        if not db_path or not os.path.exists(db_path):
+            return
+        try:
+            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+            now  = today()
+            url_days, sig_days = KNOWN_URL_DAYS, KNOWN_SIGNATURE_DAYS
+            if KNOWN_REFRESH_DAYS > 0:
+                url_days, sig_days = min(url_days, KNOWN_REFRESH_DAYS), min(sig_days, KNOWN_REFRESH_DAYS)
+            rows = conn.execute("""
+                SELECT fp FROM known_jobs
+                WHERE (kind = ? AND added >= ?) OR (kind = ? AND added >= ?)
+                ORDER BY fp
+            """, (KIND_URL, now - url_days, KIND_SIGNATURE, now - sig_days))
+            self.fps.extend(fp for (fp,) in rows)
+            conn.close()
+        except sqlite3.Error:
+            self.fps = array("q")      # no side table yet -- first run after upgrade
+
+    def __len__(self) -> int:
+        return len(self.fps)
+
+    def _has(self, fp: int | None) -> bool:
+        if fp is None:
+            return False
+        i = bisect_left(self.fps, fp)
+        return i < len(self.fps) and self.fps[i] == fp
+
+    def known(self, url: str = "", company: str = "", title: str = "") -> bool:
+        """True when the URL or company::title belongs to a job already stored."""
+        hit = self._has(url_fingerprint(url)) or self._has(signature_fingerprint(company, title))
+        if hit:
+            self.skipped += 1
+        return hit
@@ -4,70 +4,118 @@ DatabaseManager — local SQLite tracker for Job Hunter Agent
 Key fix: get_new_applications() now returns ONLY jobs where
   status = 'NEW'  AND  (resume_pdf_path IS NULL OR resume_pdf_path = '')
 This prevents re-tailoring on every run (the duplicate PDF problem).
+
+Every connection to the jobs DB -- runner, discovery writer thread,
+dashboard -- comes from connect(), so they all share one tuning profile:
+
+    journal_mode = WAL      readers never block the writer and vice versa
+    synchronous  = NORMAL   fsync at checkpoints, not per commit (safe in WAL)
+    busy_timeout            wait instead of failing with "database is locked"
+    cache_size / mmap_size  page cache and memory-mapped reads
+    temp_store   = MEMORY   sorts / temp b-trees off disk
+
+Writers get a dedicated read-write connection (DatabaseManager); readers
+(dashboard) use connect(readonly=True), a read-only connection that cannot
+take the write lock.  WAL needs a local filesystem -- keep the DB off
+network shares.
+
+    python local_db_manager.py --rebuild-aggregates     -> recount the analytics tables
+    python local_db_manager.py --rebuild-search-index   -> re-index jobs_fts
 """
 
+import re
 import sqlite3
 import uuid
 import os
 from datetime import datetime
 
+from known_jobs import content_hash, job_fingerprints, today
+
 
 DB_PATH = os.getenv("JOB_DB_PATH", "applications.db")
 
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "15000"))
+SQLITE_CACHE_MB        = int(os.getenv("SQLITE_CACHE_MB", "32"))
+SQLITE_MMAP_MB         = int(os.getenv("SQLITE_MMAP_MB", "256"))
+
+
+def fts_query(text: str) -> str:
+    """
+    Free text from the search box -> FTS5 MATCH expression: every word must
+    start a token in some indexed column -- "soft eng" -> '"soft"* "eng"*'.
+    Words are quoted, so FTS5 syntax in the input is inert.
+    """
+    return " ".join(f'"{w}"*' for w in re.findall(r"\w+", (text or "").lower()))
+
+
+def connect(db_path: str = DB_PATH, readonly: bool = False) -> sqlite3.Connection:
+    """
+    Open a tuned connection to the jobs DB (see module docstring).
+
+    readonly=True opens it with mode=ro + query_only; the DB must already
+    exist in WAL mode, i.e. have been opened once by a writer.
+    """
+    if readonly:
+        conn = sqlite3.connect(f"file:{os.path.abspath(db_path)}?mode=ro", uri=True,
+                               timeout=SQLITE_BUSY_TIMEOUT_MS / 1000, check_same_thread=False)
+        conn.execute("PRAGMA query_only = ON")
+    else:
+        conn = sqlite3.connect(db_path, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode = WAL")      # persistent -- stored in the DB file
+        conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+    conn.execute(f"PRAGMA cache_size = -{SQLITE_CACHE_MB * 1024}")
+    conn.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_MB * 1024 * 1024}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
 
 class DatabaseManager:
     def __init__(self, db_path: str = DB_PATH):
         self.db_path = db_path
-        self.conn    = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn    = connect(db_path)
         self.conn.row_factory = sqlite3.Row
         self._init_schema()
+        self._has_search_index = bool(self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'").fetchone())
 
+    # ──────────────────────────────────────────────────────────────────────
+    # SCHEMA (versioned migrations -- see MIGRATIONS at the bottom)
+    # ──────────────────────────────────────────────────────────────────────
     def _init_schema(self):
-        cur = self.conn.cursor()
-
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                id             TEXT PRIMARY KEY,
-                company        TEXT,
-                title          TEXT,
-                location       TEXT,
-                source         TEXT,
-                url            TEXT UNIQUE,
-                description    TEXT,
-                date_posted    TEXT,
-                scraped_date   TEXT,
-                hiring_manager TEXT,
-                salary         TEXT DEFAULT '',
-                department     TEXT DEFAULT '',
-                sponsorship    TEXT DEFAULT ''
-            )
-        """)
-
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS applications (
-                job_id              TEXT PRIMARY KEY REFERENCES jobs(id),
-                status              TEXT DEFAULT 'NEW',
-                ats_score           REAL,
-                resume_pdf_path     TEXT DEFAULT '',
-                cover_letter_pdf_path TEXT DEFAULT '',
-                applied_date        TEXT,
-                notes               TEXT DEFAULT ''
+        """Apply every migration newer than the DB's schema_version, one transaction each."""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version     INTEGER PRIMARY KEY,
+                description TEXT,
+                applied     TEXT
             )
         """)
-
-        # Add columns that may be missing in older DBs (safe to run repeatedly)
-        for col_def in [
-            ("jobs",         "salary",     "TEXT DEFAULT ''"),
-            ("jobs",         "department", "TEXT DEFAULT ''"),
-            ("jobs",         "sponsorship", "TEXT DEFAULT ''"),
-            ("applications", "cover_letter_pdf_path", "TEXT DEFAULT ''"),
-        ]:
+        current = self.conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version").fetchone()[0]
+        pending = [m for m in MIGRATIONS if m[0] > current]
+        for version, description, migrate in pending:
+            cur = self.conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")      # another process may be migrating the same DB
             try:
-                cur.execute(f"ALTER TABLE {col_def[0]} ADD COLUMN {col_def[1]} {col_def[2]}")
-            except sqlite3.OperationalError:
-                pass   # column already exists
+                if cur.execute("SELECT 1 FROM schema_version WHERE version = ?", (version,)).fetchone():
+                    self.conn.rollback()
+                    continue
+                migrate(cur)
+                cur.execute("INSERT INTO schema_version (version, description, applied) VALUES (?,?,?)",
+                            (version, description, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+        if pending:
+            # Fresh planner statistics for the new indexes (bounded scan per index)
+            self.conn.execute("PRAGMA analysis_limit = 1000")
+            self.conn.execute("ANALYZE")
+            self.conn.commit()
 
-        self.conn.commit()
+    @property
+    def schema_version(self) -> int:
+        return self.conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version").fetchone()[0]
 
     # ──────────────────────────────────────────────────────────────────────
     # INSERT
@@ -75,45 +123,132 @@ class DatabaseManager:
     def insert_raw_job(self, job: dict) -> bool:
         """
         Insert a discovered job.  Returns True if it was a brand-new insert,
-        False if the URL already existed (duplicate).
+        False if the URL already existed (duplicate -- refreshed if its content changed).
         """
-        job_id = str(uuid.uuid4())
-        cur    = self.conn.cursor()
+        new, _, _ = self.insert_raw_jobs([job])
+        return bool(new)
 
-        try:
-            cur.execute("""
+    def insert_raw_jobs(self, jobs) -> tuple[int, int, int]:
+        """
+        Bulk insert / refresh: every job in `jobs` in ONE transaction.
+        Returns (new, changed, unchanged) counts.
+
+        Rows go in with executemany + ON CONFLICT(url) DO NOTHING, so a URL
+        already stored (or repeated within the batch) is skipped without an
+        exception; the NEW applications row is then added only for the ids
+        that actually landed in `jobs`.
+
+        A URL already stored is compared by content_hash (known_jobs.py):
+        only rows whose posting changed get their content columns rewritten
+        (an empty incoming field keeps the stored value -- a failed detail
+        fetch must not wipe a description); the rest just get last_seen.
+
+        A job still carrying `detail_url` / `description_html` is a listing
+        row whose detail stage has not run yet (job_discovery.py publishes
+        it right away so a crash cannot lose it).  It is inserted with a
+        NULL content_hash and never refreshes a stored row; the completed
+        job published afterwards fills it in.  Provisional rows only count
+        towards `new`, and completing one counts as neither changed nor
+        unchanged.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return 0, 0, 0
+        now     = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        ids     = [str(uuid.uuid4()) for _ in jobs]
+        pending = [bool(job.get("detail_url") or job.get("description_html")) for job in jobs]
+        hashes  = [None if p else content_hash(job) for job, p in zip(jobs, pending)]
+        rows    = [(
+            job_id,
+            job.get("company", ""),
+            job.get("title",   ""),
+            job.get("location",""),
+            job.get("source",  ""),
+            job.get("url",     ""),
+            job.get("description", ""),
+            job.get("date",    ""),
+            now,
+            job.get("hiring_manager", ""),
+            job.get("salary",  ""),
+            job.get("department", ""),
+            job.get("sponsorship", ""),
+            digest,
+            now,
+        ) for job_id, job, digest in zip(ids, jobs, hashes)]
+        final = [r for r, p in zip(rows, pending) if not p]
+        added = today()
+
+        with self.conn:
+            cur = self.conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")      # take the write lock before reading MAX(rowid)
+            last_rowid = cur.execute("SELECT COALESCE(MAX(rowid), 0) FROM jobs").fetchone()[0]
+            insert = """
                 INSERT INTO jobs
                     (id, company, title, location, source, url, description,
-                     date_posted, scraped_date, hiring_manager, salary, department, sponsorship)
-                VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """, (
-                job_id,
-                job.get("company", ""),
-                job.get("title",   ""),
-                job.get("location",""),
-                job.get("source",  ""),
-                job.get("url",     ""),
-                job.get("description", ""),
-                job.get("date",    ""),
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                job.get("hiring_manager", ""),
-                job.get("salary",  ""),
-                job.get("department", ""),
-                job.get("sponsorship", ""),
-            ))
-
-            # Create a matching application row with status NEW
-            cur.execute("""
+                     date_posted, scraped_date, hiring_manager, salary, department, sponsorship,
+                     content_hash, last_seen)
+                VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+                ON CONFLICT(url) DO NOTHING
+            """
+            cur.executemany(insert, [r for r, p in zip(rows, pending) if p])
+            new = cur.rowcount
+            cur.executemany(insert, final)
+            new_final = cur.rowcount
+            new += new_final
+            cur.executemany("""
                 INSERT INTO applications (job_id, status)
-                VALUES (?, 'NEW')
-            """, (job_id,))
+                SELECT id, 'NEW' FROM jobs WHERE id = ?
+            """, ((job_id,) for job_id in ids))
+            if new:
+                self._index_new_rows(cur, last_rowid)
 
-            self.conn.commit()
-            return True
+            # Completed provisional rows, then re-seen URLs: rewrite content only where the hash moved ...
+            refresh = """
+                UPDATE jobs SET
+                    company        = COALESCE(NULLIF(?, ''), company),
+                    title          = COALESCE(NULLIF(?, ''), title),
+                    location       = COALESCE(NULLIF(?, ''), location),
+                    description    = COALESCE(NULLIF(?, ''), description),
+                    hiring_manager = COALESCE(NULLIF(?, ''), hiring_manager),
+                    salary         = COALESCE(NULLIF(?, ''), salary),
+                    department     = COALESCE(NULLIF(?, ''), department),
+                    sponsorship    = COALESCE(NULLIF(?, ''), sponsorship),
+                    content_hash   = ?,
+                    last_seen      = ?
+                WHERE url = ? AND content_hash IS {}
+            """
+            params = [(r[1], r[2], r[3], r[6], r[9], r[10], r[11], r[12], r[13], now, r[5], r[13])
+                      for r in final]
+            cur.executemany(refresh.format("NULL AND ? IS NOT NULL"), params)
+            completed = cur.rowcount
+            cur.executemany(refresh.format("NOT ?"), params)
+            changed = cur.rowcount
+            # ... and only bump last_seen for the rest
+            cur.executemany("UPDATE jobs SET last_seen = ? WHERE url = ? AND last_seen IS NOT ?",
+                            ((now, r[5], now) for r in rows))
+
+            cur.executemany("""
+                INSERT INTO known_jobs (fp, kind, added) VALUES (?,?,?)
+                ON CONFLICT(fp) DO UPDATE SET added = MAX(added, excluded.added)
+            """, ((fp, kind, added) for job in jobs for fp, kind in job_fingerprints(job)))
+        return new, changed, len(final) - new_final - completed - changed
 
-        except sqlite3.IntegrityError:
-            # URL already in DB — not a new job
-            return False
+    def _index_new_rows(self, cur, last_rowid: int):
+        """
+        Everything a bulk insert owes the jobs rows past `last_rowid` (the
+        batch's rows are exactly those past the old MAX(rowid)): their
+        jobs_fts entries, one change version, their job_counts cells.  Done
+        per batch rather than by insert triggers -- see migrations 5, 7, 8.
+        """
+        if self._has_search_index:
+            cur.execute("""
+                INSERT INTO jobs_fts(rowid, title, company, location, description)
+                SELECT rowid, title, company, location, description FROM jobs WHERE rowid > ?
+            """, (last_rowid,))
+        cur.execute("UPDATE change_version SET version = version + 1")
+        cur.execute("UPDATE jobs SET row_version = (SELECT version FROM change_version) WHERE rowid > ?",
+                    (last_rowid,))
+        cur.execute(COUNT_JOBS_SQL, (last_rowid,))
 
     # ──────────────────────────────────────────────────────────────────────
     # QUERY: jobs that NEED tailoring
@@ -230,12 +365,409 @@ class DatabaseManager:
         cur.execute("SELECT status, COUNT(*) FROM applications GROUP BY status")
         return dict(cur.fetchall())
 
+    def rebuild_search_index(self):
+        """Re-index jobs_fts from jobs -- needed after a VACUUM, which may renumber jobs.rowid."""
+        with self.conn:
+            self.conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+
+    def rebuild_aggregates(self):
+        """Recount the analytics tables (job_counts, ats_buckets) from jobs + applications."""
+        with self.conn:
+            _backfill_aggregates(self.conn.cursor())
+
+    def checkpoint(self) -> bool:
+        """
+        Fold the WAL back into the main database file and truncate it, so the
+        .db file alone is complete (before copying it anywhere).  False if a
+        reader kept some frames from being copied within the busy timeout.
+        """
+        busy, _, _ = self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        return not busy
+
     def clear_all_data(self):
         """Truncate all data from jobs and applications tables."""
         cur = self.conn.cursor()
         cur.execute("DELETE FROM applications")
         cur.execute("DELETE FROM jobs")
+        cur.execute("DELETE FROM known_jobs")
         self.conn.commit()
 
     def close(self):
-        self.conn.close()
\ No newline at end of file
+        self.conn.close()
+
+
+# ──────────────────────────────────────────────────────────────────────────
+# MIGRATIONS -- append only; never edit one that has shipped
+# ──────────────────────────────────────────────────────────────────────────
+def _add_missing_columns(cur, table: str, columns: list[tuple[str, str]]):
+    have = {row[1] for row in cur.execute(f"PRAGMA table_info({table})")}
+    for name, decl in columns:
+        if name not in have:
+            cur.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+
+
+def _backfill_known_jobs(cur):
+    """One-off fill of known_jobs from existing rows (first run after upgrade)."""
+    rows = []
+    for row in cur.execute("SELECT url, company, title, scraped_date FROM jobs").fetchall():
+        try:
+            added = int(datetime.strptime((row[3] or "")[:10], "%Y-%m-%d").timestamp() // 86400)
+        except ValueError:
+            added = today()
+        job = {"url": row[0], "company": row[1], "title": row[2]}
+        rows.extend((fp, kind, added) for fp, kind in job_fingerprints(job))
+    cur.executemany("INSERT OR IGNORE INTO known_jobs (fp, kind, added) VALUES (?,?,?)", rows)
+
+
+def _m001_baseline(cur):
+    """jobs + applications, including columns older DBs were created without."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id             TEXT PRIMARY KEY,
+            company        TEXT,
+            title          TEXT,
+            location       TEXT,
+            source         TEXT,
+            url            TEXT UNIQUE,
+            description    TEXT,
+            date_posted    TEXT,
+            scraped_date   TEXT,
+            hiring_manager TEXT,
+            salary         TEXT DEFAULT '',
+            department     TEXT DEFAULT '',
+            sponsorship    TEXT DEFAULT ''
+        )
+    """)
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS applications (
+            job_id              TEXT PRIMARY KEY REFERENCES jobs(id),
+            status              TEXT DEFAULT 'NEW',
+            ats_score           REAL,
+            resume_pdf_path     TEXT DEFAULT '',
+            cover_letter_pdf_path TEXT DEFAULT '',
+            applied_date        TEXT,
+            notes               TEXT DEFAULT ''
+        )
+    """)
+    _add_missing_columns(cur, "jobs", [
+        ("salary",      "TEXT DEFAULT ''"),
+        ("department",  "TEXT DEFAULT ''"),
+        ("sponsorship", "TEXT DEFAULT ''"),
+    ])
+    _add_missing_columns(cur, "applications", [("cover_letter_pdf_path", "TEXT DEFAULT ''")])
+
+
+def _m002_known_jobs(cur):
+    """Fingerprints of stored jobs for JobDiscovery's cross-run dedup (see known_jobs.py)."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS known_jobs (
+            fp     INTEGER PRIMARY KEY,
+            kind   INTEGER NOT NULL,
+            added  INTEGER NOT NULL
+        ) WITHOUT ROWID
+    """)
+    if not cur.execute("SELECT 1 FROM known_jobs LIMIT 1").fetchone():
+        _backfill_known_jobs(cur)
+
+
+def _m003_content_hash(cur):
+    """Change detection for re-seen postings (insert_raw_jobs)."""
+    _add_missing_columns(cur, "jobs", [
+        ("content_hash", "TEXT DEFAULT ''"),
+        ("last_seen",    "TEXT DEFAULT ''"),
+    ])
+
+
+def _m004_hot_query_indexes(cur):
+    """
+    Indexes for the hot read paths (check_query_plans.py asserts they are used):
+
+      idx_jobs_scraped_date   ORDER BY j.scraped_date DESC  -- dashboard Jobs Board
+                              pages walk jobs in index order, no temp sort
+      idx_applications_todo   partial index for get_new_applications: only the
+                              NEW, untailored rows are in it, so the runner
+                              reads its backlog without scanning applications
+
+    No plain index on applications.status: with only a handful of distinct
+    values the planner prefers it over idx_applications_todo.
+    """
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_jobs_scraped_date ON jobs(scraped_date)")
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_applications_todo ON applications(job_id)
+        WHERE status = 'NEW' AND (resume_pdf_path IS NULL OR resume_pdf_path = '')
+    """)
+
+
+def _m005_search_index(cur):
+    """
+    jobs_fts: FTS5 index over title / company / location / description.
+
+    External-content table (the text lives only in jobs, keyed by jobs.rowid).
+    Updates and deletes are mirrored by triggers.  New rows are indexed by
+    insert_raw_jobs in one INSERT ... SELECT per batch instead: FTS5 flushes
+    a segment at every trigger invocation, which made a 20k-job batch 8x
+    slower (and superlinear).  unicode61 without diacritics, 2- and 3-char
+    prefix indexes for search-as-you-type, bm25 ranking weighted title >
+    company > location > description.  Skipped on SQLite builds without FTS5
+    (job_queries then filters the search box by substring instead).
+    """
+    try:
+        cur.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                title, company, location, description,
+                content = 'jobs', content_rowid = 'rowid',
+                tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+            )
+        """)
+    except sqlite3.OperationalError as e:
+        print(f"  [DB] Full-text search unavailable ({e}) -- dashboard search falls back to substring match")
+        return
+    cur.execute("INSERT INTO jobs_fts(jobs_fts, rank) VALUES ('rank', 'bm25(10.0, 5.0, 2.0, 1.0)')")
+    cur.execute("""
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+            INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+            VALUES ('delete', old.rowid, old.title, old.company, old.location, old.description);
+        END
+    """)
+    cur.execute("""
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF title, company, location, description ON jobs BEGIN
+            INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+            VALUES ('delete', old.rowid, old.title, old.company, old.location, old.description);
+            INSERT INTO jobs_fts(rowid, title, company, location, description)
+            VALUES (new.rowid, new.title, new.company, new.location, new.description);
+        END
+    """)
+    cur.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+
+
+def _m006_covering_todo_index(cur):
+    """
+    Rebuild idx_applications_todo as a covering index: every applications
+    column get_new_applications reads is in it, so the backlog scan never
+    touches the applications table.  The ORDER BY j.scraped_date sort stays
+    a temp b-tree -- it orders by a jobs column, and the partial index holds
+    only the (small) untailored backlog, so sorting that beats walking all
+    of jobs in idx_jobs_scraped_date order.
+    """
+    cur.execute("DROP INDEX IF EXISTS idx_applications_todo")
+    cur.execute("""
+        CREATE INDEX idx_applications_todo
+        ON applications(job_id, status, resume_pdf_path, cover_letter_pdf_path, ats_score)
+        WHERE status = 'NEW' AND (resume_pdf_path IS NULL OR resume_pdf_path = '')
+    """)
+
+
+# Columns whose changes readers care about -- last_seen / content_hash bumps are not news
+_FEED_JOB_COLUMNS = ("company, title, location, source, url, description, date_posted, "
+                     "hiring_manager, salary, department, sponsorship")
+_FEED_APP_COLUMNS = "status, ats_score, resume_pdf_path, cover_letter_pdf_path, applied_date, notes"
+
+
+def _m007_change_feed(cur):
+    """
+    A monotonically increasing change version for readers (see changes_since).
+
+    change_version holds one counter; triggers bump it on every visible
+    update of jobs and applications and stamp the row's row_version with the
+    new value, and a deleted job leaves a job_tombstones row.  New jobs are
+    stamped by insert_raw_jobs, one version per batch (an insert trigger
+    made bulk inserts ~25% slower; their applications rows ride along with
+    the job).  A reader remembers the version it rendered and later asks
+    only for rows past it.  Existing rows start at row_version 0.
+    """
+    cur.execute("CREATE TABLE IF NOT EXISTS change_version (version INTEGER NOT NULL)")
+    if not cur.execute("SELECT 1 FROM change_version").fetchone():
+        cur.execute("INSERT INTO change_version (version) VALUES (0)")
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS job_tombstones (
+            job_id  TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        )
+    """)
+    _add_missing_columns(cur, "jobs",         [("row_version", "INTEGER NOT NULL DEFAULT 0")])
+    _add_missing_columns(cur, "applications", [("row_version", "INTEGER NOT NULL DEFAULT 0")])
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_jobs_row_version ON jobs(row_version)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_applications_row_version ON applications(row_version)")
+
+    bump = "UPDATE change_version SET version = version + 1;"
+    for table, key, columns in [
+        ("jobs",         "rowid",  _FEED_JOB_COLUMNS),
+        ("applications", "job_id", _FEED_APP_COLUMNS),
+    ]:
+        cur.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_version_au AFTER UPDATE OF {columns} ON {table} BEGIN
+                {bump}
+                UPDATE {table} SET row_version = (SELECT version FROM change_version)
+                WHERE {key} = new.{key};
+            END
+        """)
+    cur.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS jobs_version_del AFTER DELETE ON jobs BEGIN
+            {bump}
+            INSERT OR REPLACE INTO job_tombstones (job_id, version)
+            VALUES (old.id, (SELECT version FROM change_version));
+        END
+    """)
+
+
+# Analytics dimensions of one jobs row; {j} is its alias (j, or new / old in a trigger)
+DAY_SQL       = "COALESCE(substr({j}.scraped_date, 1, 10), '')"
+H1B_LABEL_SQL = """CASE WHEN instr(lower(COALESCE({j}.sponsorship, '')), 'likely')
+                          OR instr(lower(COALESCE({j}.sponsorship, '')), 'yes') THEN 'Likely Sponsor'
+                        WHEN lower(COALESCE({j}.sponsorship, '')) = 'no'
+                          OR instr(lower(COALESCE({j}.sponsorship, '')), 'does not') THEN 'No Sponsorship'
+                        ELSE 'Unknown' END"""
+ATS_BUCKET    = 0.5         # ats_buckets bin width
+
+_COUNT_KEY = f"{DAY_SQL}, COALESCE({{j}}.source, ''), {{status}}, {H1B_LABEL_SQL}"
+_COUNT_UPSERT = """
+    INSERT INTO job_counts (day, source, status, h1b, n) {rows}
+    ON CONFLICT (day, source, status, h1b) DO UPDATE SET n = n + excluded.n;
+"""
+# job_counts rows of every job past a rowid (insert_raw_jobs, once per batch)
+COUNT_JOBS_SQL = _COUNT_UPSERT.format(rows=f"""
+    SELECT {_COUNT_KEY.format(j="j", status="COALESCE(a.status, 'NEW')")}, COUNT(*)
+    FROM jobs j LEFT JOIN applications a ON a.job_id = j.id
+    WHERE j.rowid > ? GROUP BY 1, 2, 3, 4
+""")
+
+
+def _count_job(j: str, delta: int) -> str:
+    """Trigger step: add `delta` to the job_counts cell of the jobs row `j` (new / old)."""
+    status = f"COALESCE((SELECT status FROM applications WHERE job_id = {j}.id), 'NEW')"
+    return _COUNT_UPSERT.format(rows=f"VALUES ({_COUNT_KEY.format(j=j, status=status)}, {delta})")
+
+
+def _count_application(row: str, delta: int, status: str = "") -> str:
+    """Trigger step: add `delta` to the job_counts cell of applications row `row`'s job (at `status`)."""
+    status = status or f"COALESCE({row}.status, 'NEW')"
+    return _COUNT_UPSERT.format(rows=f"""
+        SELECT {_COUNT_KEY.format(j="j", status=status)}, {delta} FROM jobs j WHERE j.id = {row}.job_id""")
+
+
+def _count_ats(row: str, delta: int) -> str:
+    """Trigger step: add `delta` to the ats_buckets bin of applications row `row`."""
+    return f"""
+        INSERT INTO ats_buckets (bucket, n)
+        SELECT CAST({row}.ats_score / {ATS_BUCKET} AS INTEGER) * {ATS_BUCKET}, {delta}
+        WHERE {row}.ats_score IS NOT NULL
+        ON CONFLICT (bucket) DO UPDATE SET n = n + excluded.n;
+    """
+
+
+def _backfill_aggregates(cur):
+    """Recount job_counts / ats_buckets from scratch."""
+    cur.execute("DELETE FROM job_counts")
+    cur.execute("DELETE FROM ats_buckets")
+    cur.execute(COUNT_JOBS_SQL, (0,))
+    cur.execute(f"""
+        INSERT INTO ats_buckets (bucket, n)
+        SELECT CAST(ats_score / {ATS_BUCKET} AS INTEGER) * {ATS_BUCKET}, COUNT(*)
+        FROM applications WHERE ats_score IS NOT NULL GROUP BY 1
+    """)
+
+
+def _m008_analytics_aggregates(cur):
+    """
+    Analytics summary tables, kept current on write so charts never scan jobs.
+
+        job_counts   (day, source, status, h1b) -> jobs   day x source x status
+                                                          counts, and the
+                                                          sponsorship buckets
+        ats_buckets  bucket -> scored jobs                ATS_BUCKET-wide bins
+
+    Triggers move a job between cells when its status, source, sponsorship
+    or scraped_date changes, and take it out when it (or its application)
+    is deleted; ats_score changes move it between buckets.  New jobs are
+    counted by insert_raw_jobs, one GROUP BY per batch (COUNT_JOBS_SQL),
+    for the same reason the change feed stamps them there.  Cells are never
+    deleted, so a count can read 0.  `python local_db_manager.py
+    --rebuild-aggregates` recounts both tables.
+    """
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS job_counts (
+            day    TEXT NOT NULL,
+            source TEXT NOT NULL,
+            status TEXT NOT NULL,
+            h1b    TEXT NOT NULL,
+            n      INTEGER NOT NULL,
+            PRIMARY KEY (day, source, status, h1b)
+        ) WITHOUT ROWID
+    """)
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS ats_buckets (
+            bucket REAL PRIMARY KEY,
+            n      INTEGER NOT NULL
+        )
+    """)
+    triggers = {
+        "jobs_counts_au": ("""AFTER UPDATE OF scraped_date, source, sponsorship ON jobs
+                              WHEN old.scraped_date IS NOT new.scraped_date OR old.source IS NOT new.source
+                                OR old.sponsorship IS NOT new.sponsorship""",
+                           _count_job("old", -1) + _count_job("new", 1)),
+        "jobs_counts_ad": ("AFTER DELETE ON jobs", _count_job("old", -1)),
+        "applications_counts_ai": ("AFTER INSERT ON applications WHEN COALESCE(new.status, 'NEW') != 'NEW'",
+                                   _count_application("new", -1, "'NEW'") + _count_application("new", 1)),
+        "applications_counts_au": ("""AFTER UPDATE OF status ON applications
+                                      WHEN COALESCE(old.status, 'NEW') != COALESCE(new.status, 'NEW')""",
+                                   _count_application("old", -1) + _count_application("new", 1)),
+        "applications_counts_ad": ("AFTER DELETE ON applications WHEN COALESCE(old.status, 'NEW') != 'NEW'",
+                                   _count_application("old", -1) + _count_application("old", 1, "'NEW'")),
+        "applications_ats_ai": ("AFTER INSERT ON applications WHEN new.ats_score IS NOT NULL",
+                                _count_ats("new", 1)),
+        "applications_ats_au": ("AFTER UPDATE OF ats_score ON applications WHEN old.ats_score IS NOT new.ats_score",
+                                _count_ats("old", -1) + _count_ats("new", 1)),
+        "applications_ats_ad": ("AFTER DELETE ON applications WHEN old.ats_score IS NOT NULL",
+                                _count_ats("old", -1)),
+    }
+    for name, (when, body) in triggers.items():
+        cur.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {when} BEGIN {body} END")
+    _backfill_aggregates(cur)
+
+
+def _m009_sync_state(cur):
+    """
+    sync_state: named sync high-water marks -- the last change version
+    written to the changelog ('changelog_out') and, on a replica, the last
+    one replayed from it ('changelog_in'); see changelog.py.
+    """
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS sync_state (
+            name    TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        )
+    """)
+
+
+MIGRATIONS = [
+    (1, "baseline jobs / applications schema",      _m001_baseline),
+    (2, "known_jobs fingerprint table",             _m002_known_jobs),
+    (3, "jobs.content_hash / last_seen",            _m003_content_hash),
+    (4, "indexes for hot queries",                  _m004_hot_query_indexes),
+    (5, "jobs_fts full-text search index",          _m005_search_index),
+    (6, "covering idx_applications_todo",           _m006_covering_todo_index),
+    (7, "change feed: row_version + tombstones",    _m007_change_feed),
+    (8, "analytics aggregates",                     _m008_analytics_aggregates),
+    (9, "sync_state high-water marks",              _m009_sync_state),
+]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Job Hunter DB maintenance")
+    parser.add_argument("--rebuild-aggregates",   action="store_true",
+                        help="Recount the analytics tables (job_counts, ats_buckets)")
+    parser.add_argument("--rebuild-search-index", action="store_true",
+                        help="Re-index jobs_fts from jobs (after a VACUUM)")
+    args = parser.parse_args()
+
+    db = DatabaseManager()
+    print(f"{db.db_path}: schema version {db.schema_version}")
+    if args.rebuild_aggregates:
+        db.rebuild_aggregates()
+        print("  analytics aggregates rebuilt")
+    if args.rebuild_search_index:
+        db.rebuild_search_index()
+        print("  search index rebuilt")
+    db.close()
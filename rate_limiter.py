@@ -0,0 +1,144 @@
+"""
+HostLimiter — per-host concurrency + token-bucket pacing for discovery
+───────────────────────────────────────────────────────────────────────
+Every fetch_* in JobDiscovery goes through _fetch_with_retry, which asks
+the limiter for a slot before touching the network.  Each ATS gets its
+own concurrency cap and request rate, so 150 Greenhouse boards queue up
+behind boards-api.greenhouse.io while Lever / Ashby / Workable requests
+keep flowing instead of all of them piling onto one host at once.
+
+A 429 on any request pauses the whole host group (honouring Retry-After),
+so one throttle no longer turns into a storm of parallel retries.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# PER-ATS LIMITS  (tune freely -- concurrency = in-flight requests,
+#                  rate = sustained requests/sec, burst = bucket size)
+#   hosts  : hostname suffixes that belong to this ATS
+#   shared : True  -> every matching host shares ONE budget (same backend)
+#            False -> each matching host (tenant) gets its own budget
+# ─────────────────────────────────────────────────────────────────────────────
+HOST_LIMITS = {
+    "Greenhouse":      {"hosts": ["boards-api.greenhouse.io"], "concurrency": 8, "rate": 10.0, "burst": 10, "shared": True},
+    "Lever":           {"hosts": ["api.lever.co"],             "concurrency": 6, "rate": 8.0,  "burst": 8,  "shared": True},
+    "Ashby":           {"hosts": ["api.ashbyhq.com"],          "concurrency": 6, "rate": 8.0,  "burst": 8,  "shared": True},
+    "Workable":        {"hosts": ["apply.workable.com"],       "concurrency": 4, "rate": 4.0,  "burst": 4,  "shared": True},
+    "SmartRecruiters": {"hosts": ["api.smartrecruiters.com"],  "concurrency": 4, "rate": 5.0,  "burst": 5,  "shared": True},
+    "BambooHR":        {"hosts": ["bamboohr.com"],             "concurrency": 4, "rate": 4.0,  "burst": 4,  "shared": True},
+    "LinkedIn":        {"hosts": ["linkedin.com"],             "concurrency": 2, "rate": 1.25, "burst": 2,  "shared": True},
+    "Workday":         {"hosts": ["myworkdayjobs.com"],        "concurrency": 4, "rate": 5.0,  "burst": 5,  "shared": False},
+}
+
+# Anything not listed above (GitHub raw, RemoteOK, Adzuna, ...)
+DEFAULT_LIMIT = {"concurrency": 6, "rate": 10.0, "burst": 10}
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens/sec, holds at most `burst` tokens."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate        = max(float(rate), 0.01)
+        self.burst       = max(int(burst), 1)
+        self.tokens      = float(self.burst)
+        self.updated     = time.monotonic()
+        self.paused_till = 0.0
+        self._lock       = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens  = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_till:
+                    await asyncio.sleep(self.paused_till - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for `seconds` and start the bucket empty afterwards."""
+        until = time.monotonic() + seconds
+        if until > self.paused_till:
+            self.paused_till = until
+            self.tokens      = 0.0
+            self.updated     = until
+
+
+class _HostGroup:
+    def __init__(self, name: str, concurrency: int, rate: float, burst: int):
+        self.name      = name
+        self.semaphore = asyncio.Semaphore(max(int(concurrency), 1))
+        self.bucket    = TokenBucket(rate, burst)
+        self.requests  = 0
+        self.throttled = 0
+        self.bytes_in  = 0
+
+
+class HostLimiter:
+    """
+    Shared scheduler for the discovery HTTP layer.
+
+        async with limiter.slot(url):
+            resp = await session.get(url)
+
+    `limits` overrides / extends HOST_LIMITS per ATS name, e.g.
+        HostLimiter({"Greenhouse": {"concurrency": 12, "rate": 15}})
+    """
+
+    def __init__(self, limits: dict | None = None, default: dict | None = None):
+        self.limits = {name: dict(cfg) for name, cfg in HOST_LIMITS.items()}
+        for name, cfg in (limits or {}).items():
+            self.limits.setdefault(name, {"hosts": [], "shared": True}).update(cfg)
+        self.default = {**DEFAULT_LIMIT, **(default or {})}
+        self._groups: dict[str, _HostGroup] = {}
+
+    def _group_for(self, url: str) -> _HostGroup:
+        host = (urlsplit(url).hostname or "").lower()
+        for name, cfg in self.limits.items():
+            if any(host == h or host.endswith("." + h) for h in cfg.get("hosts", [])):
+                key = name if cfg.get("shared", True) else f"{name}:{host}"
+                break
+        else:
+            name, cfg, key = host, self.default, host
+
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _HostGroup(
+                key,
+                cfg.get("concurrency", self.default["concurrency"]),
+                cfg.get("rate",        self.default["rate"]),
+                cfg.get("burst",       self.default["burst"]),
+            )
+        return group
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Hold one concurrency slot for `url`'s host, after waiting for a token."""
+        group = self._group_for(url)
+        async with group.semaphore:
+            await group.bucket.acquire()
+            group.requests += 1
+            yield group
+
+    def throttle(self, url: str, retry_after: float):
+        """Called on 429 -- pauses every request to this host group, not just the caller."""
+        group = self._group_for(url)
+        group.throttled += 1
+        group.bucket.pause(retry_after)
+
+    def summary(self) -> list[tuple[str, int, int, int]]:
+        """[(host group, requests sent, 429s received, body bytes received)] busiest first."""
+        rows = [(g.name, g.requests, g.throttled, g.bytes_in) for g in self._groups.values()]
+        return sorted(rows, key=lambda r: -r[1])
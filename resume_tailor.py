@@ -32,6 +32,8 @@ from playwright.async_api import async_playwright
 from groq import Groq
 from dotenv import load_dotenv
 
+from job_queries import thumbnail_path
+
 load_dotenv()
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -145,6 +147,10 @@ p { font-size: 9.1pt; margin-bottom: 3px; }
 @page { size: letter; margin: 0; }
 """
 
+# One Letter page at 96 dpi; thumbnails are its first screenful at 3/8 scale (306x396 px)
+LETTER_VIEWPORT = {"width": 816, "height": 1056}
+THUMBNAIL_SCALE = 0.375
+
 
 class ResumeTailor:
     def __init__(self, profile_path="user_profile.json"):
@@ -393,6 +399,28 @@ Write the 3-paragraph body now."""
                 return 8, clean
         return 8, content.strip()
 
+    # ── RENDERING ───────────────────────────────────────────────────────────
+    async def _render_pdf(self, html: str, output_path: str):
+        """
+        Print `html` to a Letter PDF at output_path, plus its first page as a
+        small PNG at thumbnail_path(output_path) for the dashboard's document
+        viewer -- rendered here, once, from the same page.
+        """
+        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
+        async with async_playwright() as p:
+            br   = await p.chromium.launch(headless=True)
+            page = await br.new_page(viewport=LETTER_VIEWPORT, device_scale_factor=THUMBNAIL_SCALE)
+            await page.set_content(html, wait_until="networkidle")
+            await page.pdf(path=output_path, format="Letter",
+                           margin={"top":"0in","right":"0in","bottom":"0in","left":"0in"},
+                           print_background=True)
+            try:
+                await page.emulate_media(media="print")
+                await page.screenshot(path=thumbnail_path(output_path))
+            except Exception as e:                # the PDF is what matters
+                print(f"  [WARN] Thumbnail failed for {output_path}: {e}")
+            await br.close()
+
     # ── RESUME PDF ──────────────────────────────────────────────────────────
     async def convert_markdown_to_pdf(self, md_text: str, output_path: str):
         pi        = self.personal
@@ -442,15 +470,7 @@ Write the 3-paragraph body now."""
 {ACHIEVEMENTS_HTML}
 </body></html>"""
 
-        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
-        async with async_playwright() as p:
-            br   = await p.chromium.launch(headless=True)
-            page = await br.new_page()
-            await page.set_content(html, wait_until="networkidle")
-            await page.pdf(path=output_path, format="Letter",
-                           margin={"top":"0in","right":"0in","bottom":"0in","left":"0in"},
-                           print_background=True)
-            await br.close()
+        await self._render_pdf(html, output_path)
         print(f"  [PDF] Resume saved → {output_path}")
 
     # ── COVER LETTER PDF ────────────────────────────────────────────────────
@@ -501,15 +521,7 @@ p {{ margin-bottom: 13px; text-align: justify; }}
 </div>
 </body></html>"""
 
-        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
-        async with async_playwright() as p:
-            br   = await p.chromium.launch(headless=True)
-            page = await br.new_page()
-            await page.set_content(html, wait_until="networkidle")
-            await page.pdf(path=output_path, format="Letter",
-                           margin={"top":"0in","right":"0in","bottom":"0in","left":"0in"},
-                           print_background=True)
-            await br.close()
+        await self._render_pdf(html, output_path)
         print(f"  [PDF] Cover letter saved → {output_path}")
 
 
@@ -0,0 +1,127 @@
+"""
+Snapshot — columnar export of the dashboard's view for the hosted dashboard
+─────────────────────────────────────────────────────────────────────────────
+daily_runner used to push the whole applications.db after every run so the
+hosted Streamlit dashboard could read it: a growing binary blob rewritten
+in git history each time.  Step 5 now pushes a changelog segment each run
+and, once the log has grown, a fresh jobs_snapshot.parquet:
+
+    one row per job   jobs ⋈ applications, the columns the dashboard shows
+    source / status / company   dictionary-encoded (a few hundred distinct
+                                values over the whole history)
+    zstd-compressed, in DB order (rowid -- the Jobs Board's tie-breaker)
+    metadata          the DB's change version at export time
+
+The dashboard opens the snapshot when there is no applications.db next to
+it (or DASHBOARD_SNAPSHOT=1).  open_snapshot() memory-maps the file, reads
+every column except description, and loads them into an in-memory SQLite
+DB with the real schema, so job_queries.py serves the hosted board exactly
+as it serves the local one; changelog segments pushed since the snapshot
+are replayed on top.  A job's description is read from the file only when
+its detail panel opens (description()); search on the hosted board covers
+title / company / location.
+
+    python snapshot.py        -> export applications.db to jobs_snapshot.parquet
+"""
+
+import os
+import sqlite3
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from changelog import replay
+from local_db_manager import DB_PATH, DatabaseManager
+
+
+SNAPSHOT_PATH = os.getenv("JOB_SNAPSHOT_PATH", "jobs_snapshot.parquet")
+
+DICTIONARY_COLUMNS = ["source", "status", "company"]
+
+# Columns open_snapshot loads back into jobs / applications (description stays in the file)
+JOB_COLUMNS = ["id", "company", "title", "location", "source", "url", "date_posted", "scraped_date",
+               "hiring_manager", "salary", "department", "sponsorship"]
+APP_COLUMNS = ["status", "ats_score", "resume_pdf_path", "cover_letter_pdf_path", "applied_date", "notes"]
+
+_EXPORT_SQL = f"""
+    SELECT {", ".join("j." + c for c in JOB_COLUMNS)}, j.description,
+           COALESCE(a.status, 'NEW') AS status, a.ats_score, a.resume_pdf_path,
+           a.cover_letter_pdf_path, a.applied_date, a.notes
+    FROM jobs j LEFT JOIN applications a ON j.id = a.job_id
+    ORDER BY j.rowid
+"""
+
+
+def export_snapshot(conn: sqlite3.Connection, path: str = SNAPSHOT_PATH) -> int:
+    """Write the dashboard's view of `conn` to `path` (atomically); returns the row count."""
+    cur     = conn.execute(_EXPORT_SQL)
+    names   = [d[0] for d in cur.description]
+    columns = list(zip(*cur.fetchall())) or [()] * len(names)
+    arrays  = []
+    for name, values in zip(names, columns):
+        kind = pa.float64() if name == "ats_score" else pa.string()
+        arr  = pa.array(values, type=kind)
+        arrays.append(arr.dictionary_encode() if name in DICTIONARY_COLUMNS else arr)
+    version = conn.execute("SELECT version FROM change_version").fetchone()[0]
+    table   = pa.table(arrays, names=names).replace_schema_metadata({"version": str(version)})
+
+    tmp = path + ".tmp"
+    pq.write_table(table, tmp, compression="zstd")
+    os.replace(tmp, path)
+    return table.num_rows
+
+
+def snapshot_version(path: str = SNAPSHOT_PATH) -> int:
+    """The change version of the DB the snapshot was exported from."""
+    return int(pq.read_schema(path).metadata[b"version"])
+
+
+def open_snapshot(path: str = SNAPSHOT_PATH, changelog_dir: str | None = None) -> sqlite3.Connection:
+    """
+    An in-memory jobs DB holding the snapshot minus descriptions: schema,
+    indexes, search index and analytics tables as migrated by
+    DatabaseManager.  With `changelog_dir`, the changelog segments newer
+    than the snapshot are replayed on top (changelog.py).
+
+    Its change version is the newest one the files cover, and every row
+    carries it, so a page read from older files is never patched, always
+    re-read.
+    """
+    table   = pq.read_table(path, columns=JOB_COLUMNS + APP_COLUMNS, memory_map=True)
+    version = snapshot_version(path)
+    db      = DatabaseManager(":memory:")
+    db.conn.row_factory = None
+    with db.conn:
+        db.conn.executemany(
+            f"INSERT INTO jobs ({', '.join(JOB_COLUMNS)}, description) "
+            f"VALUES ({', '.join('?' * len(JOB_COLUMNS))}, '')",
+            zip(*(table.column(c).to_pylist() for c in JOB_COLUMNS)))
+        db.conn.executemany(
+            f"INSERT INTO applications (job_id, {', '.join(APP_COLUMNS)}) "
+            f"VALUES (?, {', '.join('?' * len(APP_COLUMNS))})",
+            zip(*(table.column(c).to_pylist() for c in ["id"] + APP_COLUMNS)))
+    db.rebuild_aggregates()
+    if db._has_search_index:
+        db.rebuild_search_index()
+    if changelog_dir:
+        version, _ = replay(db, changelog_dir, since=version)
+    with db.conn:
+        db.conn.execute("UPDATE change_version SET version = ?", (version,))
+        db.conn.execute("UPDATE jobs SET row_version = ?", (version,))
+        db.conn.execute("UPDATE applications SET row_version = ?", (version,))
+    return db.conn
+
+
+def description(job_id: str, path: str = SNAPSHOT_PATH) -> str:
+    """One job's description, read from the snapshot (only the row groups holding that id)."""
+    table = pq.read_table(path, columns=["description"], filters=[("id", "=", job_id)], memory_map=True)
+    if not table.num_rows:
+        return ""
+    return table.column("description")[0].as_py() or ""
+
+
+if __name__ == "__main__":
+    db = DatabaseManager(DB_PATH)
+    rows = export_snapshot(db.conn)
+    print(f"{rows:,} jobs -> {SNAPSHOT_PATH} ({os.path.getsize(SNAPSHOT_PATH) / 1e6:.1f} MB)")
+    db.close()
@@ -0,0 +1,102 @@
+"""
+TokenMatcher — one-pass multi-pattern substring matcher for discovery filters
+───────────────────────────────────────────────────────────────────────────────
+The title / location / sponsorship filters in JobDiscovery used to run one
+`tok in text` scan per token (~120 scans per posting across the filters).
+TokenMatcher compiles every token of every category into a single regex,
+factored as a prefix trie, and reports all matched categories in one pass:
+
+    m = TokenMatcher({"block": ["senior", "sr."], "role": ["engineer"]})
+    m.scan("senior software engineer")   -> frozenset({"block", "role"})
+
+Semantics are exactly those of the old `any(tok in text for tok in LIST)`
+checks -- plain substring containment, no word boundaries (the indicator
+lists rely on that, e.g. " ca" / "us").  After each hit the search resumes
+one character past the hit's start, so overlapping tokens are all seen; at
+each position the trie takes the longest token, and every token also
+carries the categories of the shorter tokens that are its prefixes, so
+nothing is lost when a longer one wins.
+
+CPython's sre is not a DFA: on long inputs (job descriptions) a handful of
+C-level `str.__contains__` scans beats it, so texts longer than
+`long_text` are answered with per-category containment checks instead.
+The result is the same either way -- see bench_matchers.py.  For the same
+reason the sponsorship scan, which only ever sees descriptions, is not a
+TokenMatcher: the gain is in the title and location filters (about 6x and
+2.5x; about 1.2x per posting overall).
+"""
+
+import re
+from functools import lru_cache
+
+
+class TokenMatcher:
+    def __init__(self, categories: dict[str, list[str]], cache_size: int = 0, long_text: int = 200):
+        """
+        categories  name -> tokens (matched case-sensitively; lower-case both
+                    sides as the callers already do)
+        cache_size  memoize scan() for up to this many distinct texts --
+                    worth it for titles, which are checked several times each
+        long_text   length above which scan() falls back to containment checks
+        """
+        self.categories = {name: list(toks) for name, toks in categories.items()}
+
+        owners: dict[str, set] = {}
+        for name, toks in self.categories.items():
+            for tok in toks:
+                if tok:
+                    owners.setdefault(tok, set()).add(name)
+
+        # Close each token over its prefixes (see module docstring)
+        self._owners = {
+            tok: frozenset().union(*(owners[tok[:i]] for i in range(1, len(tok) + 1) if tok[:i] in owners))
+            for tok in owners
+        }
+        self._regex = re.compile(self._trie_pattern(list(owners)), re.DOTALL) if owners else None
+        self.long_text = long_text
+        # `"" in text` is always True, so a category holding an empty token always matches
+        self._empty = frozenset(n for n, toks in self.categories.items() if "" in toks)
+        self._all   = frozenset(n for n, toks in self.categories.items() if toks)
+
+        if cache_size:
+            self.scan = lru_cache(maxsize=cache_size)(self.scan)
+
+    @staticmethod
+    def _trie_pattern(tokens: list[str]) -> str:
+        """Prefix-factored alternation; greedy so the longest token at a position wins."""
+        trie: dict = {}
+        for tok in tokens:
+            node = trie
+            for ch in tok:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+
+        def emit(node) -> str:
+            end  = "" in node
+            alts = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+            if not alts:
+                return ""
+            body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+            if end:
+                return ("(?:" + body + ")?") if len(alts) == 1 and len(body) > 1 else body + "?"
+            return body
+
+        return emit(trie)
+
+    def scan(self, text: str) -> frozenset:
+        """Every category with at least one token occurring in `text`."""
+        if self._regex is None or not text:
+            return self._empty
+        if len(text) > self.long_text:
+            return frozenset(n for n, toks in self.categories.items() if any(t in text for t in toks))
+
+        found  = self._empty
+        search = self._regex.search
+        pos    = 0
+        while len(found) < len(self._all):
+            m = search(text, pos)
+            if m is None:
+                break
+            found = found | self._owners[m.group()]
+            pos   = m.start() + 1
+        return found
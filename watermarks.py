@@ -0,0 +1,157 @@
+"""
+Watermarks — per-board high-water marks for incremental ("delta") discovery
+────────────────────────────────────────────────────────────────────────────
+Every ATS fetcher reports the postings it lists, so each (ATS, board) gets:
+
+    newest      ISO time of the newest posted_at / createdAt / publishedAt seen
+    ids         posting IDs already processed (most recent MAX_IDS kept)
+    updated     ISO time of the last successful listing
+
+Marks are recorded on every run, but only used with delta=True
+(daily_runner --delta).  A delta run then skips, before any filtering:
+
+  - postings whose ID is already known,
+  - postings dated before  newest - OVERLAP_HOURS  (slack for boards that
+    publish with a slightly back-dated timestamp),
+
+and a paginated listing stops as soon as a whole page is known territory.
+A board's mark only moves after its listing was fetched successfully, and
+marks are only written at the end of a run (Watermarks.save), once every
+job has been through the detail stage and the DB writer.  A posting whose
+job failed there is forgotten: its ID is not stored and `newest` is held
+back to its date, so a failed run never hides postings from the next one.
+State lives in watermarks.json; delete it (or run without --delta) for a
+full rescan.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+
+WATERMARK_PATH = os.getenv("WATERMARK_PATH", "watermarks.json")
+OVERLAP_HOURS  = 6
+MAX_IDS        = 3000
+
+
+class BoardMark:
+    """One board's mark for the duration of a single fetch."""
+
+    def __init__(self, entry: dict, delta: bool):
+        self.entry     = entry
+        self.delta     = delta
+        self.known_ids = set(entry.get("ids", []))
+        self.fresh     = []          # IDs first seen in this fetch, in listing order
+        self.posted    = {}          # fresh ID -> its posted time, when the listing had one
+        self.dropped   = set()       # fresh IDs whose job failed downstream (forget)
+        self.newest    = None
+        self.skipped   = 0
+        self._page_new = 0
+        self.horizon   = None
+        if delta and entry.get("newest"):
+            try:
+                self.horizon = datetime.fromisoformat(entry["newest"]) - timedelta(hours=OVERLAP_HOURS)
+            except ValueError:
+                pass
+
+    def skip(self, posting_id, posted: datetime | None = None) -> bool:
+        """
+        Record one listed posting; True when a delta run should not process it.
+        Call once per posting, before any per-posting work.
+        """
+        if posted is not None and posted.tzinfo is None:
+            posted = posted.replace(tzinfo=timezone.utc)
+        if posted is not None and (self.newest is None or posted > self.newest):
+            self.newest = posted
+        posting_id = str(posting_id or "")
+        known = posting_id in self.known_ids if posting_id else False
+        if posting_id and not known:
+            self.known_ids.add(posting_id)
+            self.fresh.append(posting_id)
+            if posted is not None:
+                self.posted[posting_id] = posted
+        old = self.horizon is not None and posted is not None and posted < self.horizon
+        if self.delta and (known or old):
+            self.skipped += 1
+            return True
+        self._page_new += 1
+        return False
+
+    def page_done(self) -> bool:
+        """True when a delta run has reached known territory (nothing new on this page)."""
+        done = self.delta and not self._page_new
+        self._page_new = 0
+        return done
+
+    def forget(self, posting_id):
+        """This posting's job did not make it (detail fetch / DB write failed): leave it unmarked."""
+        self.dropped.add(str(posting_id))
+
+    def commit(self):
+        """Advance the stored mark -- Watermarks.save() calls this for successfully listed boards."""
+        fresh = [i for i in self.fresh if i not in self.dropped]
+        if fresh:
+            self.entry["ids"] = (self.entry.get("ids", []) + fresh)[-MAX_IDS:]
+        if self.newest is not None:
+            newest = self.newest.astimezone(timezone.utc).isoformat(timespec="seconds")
+            if newest > self.entry.get("newest", ""):
+                self.entry["newest"] = newest
+        # keep a forgotten posting inside the next run's horizon
+        floor = [self.posted[i] for i in self.dropped if i in self.posted]
+        if floor:
+            floor = min(floor).astimezone(timezone.utc).isoformat(timespec="seconds")
+            if self.entry.get("newest", "") > floor:
+                self.entry["newest"] = floor
+        self.entry["updated"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class Watermarks:
+    def __init__(self, path: str = WATERMARK_PATH, delta: bool = False):
+        self.path  = path
+        self.delta = delta
+        self.marks: dict[str, dict] = {}
+        # ats -> postings skipped as already known this run
+        self.skipped: dict[str, int] = {}
+        self._listed: dict[str, BoardMark] = {}            # boards listed successfully this run
+        self._held: dict[str, tuple[BoardMark, str]] = {}  # job URL -> its board mark and posting ID
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    self.marks = json.load(f)
+            except (OSError, ValueError):
+                self.marks = {}
+
+    def board(self, ats: str, slug: str) -> BoardMark:
+        entry = self.marks.get(f"{ats}:{slug}")
+        if entry is None:
+            entry = {"ats": ats, "slug": slug, "newest": "", "ids": []}
+        return BoardMark(entry, self.delta and bool(entry.get("ids")))
+
+    def commit(self, ats: str, slug: str, mark: BoardMark):
+        """The board's listing was fetched successfully: its mark advances at save()."""
+        self._listed[f"{ats}:{slug}"] = mark
+        if mark.skipped:
+            self.skipped[ats] = self.skipped.get(ats, 0) + mark.skipped
+
+    def hold(self, url: str, mark: BoardMark, posting_id):
+        """Remember which posting the job at `url` came from, so a later failure can forget() it."""
+        if url and posting_id:
+            self._held[url] = (mark, str(posting_id))
+
+    def forget(self, url: str):
+        held = self._held.pop(url, None)
+        if held:
+            held[0].forget(held[1])
+
+    def save(self):
+        for key, mark in self._listed.items():
+            mark.commit()
+            self.marks[key] = mark.entry
+        self._listed.clear()
+        self._held.clear()
+        if not self.path:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.marks, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)